@@ -1,11 +1,12 @@
 from django.contrib import admin
 from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
-from django.db import transaction
 from unfold.admin import ModelAdmin
 from django.template.response import TemplateResponse
 from django.shortcuts import redirect
 
 from apps.blog.models import Author, Category, Tag, Blog, GalleryImage
+from apps.blog.tasks import duplicate_blogs_task
+from apps.blog.utils.duplication import DUPLICATE_ASYNC_THRESHOLD, duplicate_blogs
 
 
 class AuthorAdmin(ModelAdmin[Author]):
@@ -109,34 +110,21 @@ class BlogAdmin(ModelAdmin[Blog]):
     )
     actions = ['duplicate_blog']
 
-    @transaction.atomic
     def duplicate_blog(self, request, queryset):
         if 'apply' in request.POST:
             form = DuplicateBlogForm(request.POST)
             if form.is_valid():
                 duplicates = form.cleaned_data['duplicates']
-                for blog in queryset:
-                    original_slug = blog.slug
-                    original_title = blog.title
-                    for _ in range(duplicates):
-                        # Generate unique slug
-                        new_slug = original_slug
-                        counter = 1
-                        while self.model.objects.filter(slug=new_slug).exists():
-                            new_slug = f"{original_slug}-{counter}"
-                            counter += 1
-                        # Generate unique title
-                        new_title = original_title
-                        counter = 1
-                        while self.model.objects.filter(title=new_title).exists():
-                            new_title = f"{original_title} {counter}"
-                            counter += 1
-                        # Duplicate blog instance
-                        blog.pk = None  # Reset primary key to create new instance
-                        blog.slug = new_slug
-                        blog.title = new_title
-                        blog.save()
-                self.message_user(request, "Selected blog(s) duplicated successfully.")
+                blog_ids = [str(pk) for pk in queryset.values_list('pk', flat=True)]
+                if len(blog_ids) * duplicates > DUPLICATE_ASYNC_THRESHOLD:
+                    duplicate_blogs_task.delay(blog_ids, duplicates)
+                    self.message_user(
+                        request,
+                        f"Duplicating {len(blog_ids)} blog(s) in the background.",
+                    )
+                else:
+                    created = duplicate_blogs(queryset, duplicates)
+                    self.message_user(request, f"Created {created} duplicate blog(s) successfully.")
                 return redirect(request.get_full_path())
         else:
             form = DuplicateBlogForm(initial={
@@ -1,13 +1,20 @@
 # blog/views.py (or wherever your endpoints are defined)
 from ninja import Form, Router, Query, File, UploadedFile
+from contextlib import contextmanager
 from typing import List, Optional
+from django.conf import settings
 from django.shortcuts import get_object_or_404
+from django.db.models import Count
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from ninja.errors import HttpError
+from celery.result import AsyncResult
 from uuid import UUID
 from datetime import datetime
 import logging
 from django.utils.text import slugify
 
-from apps.blog.models import Blog, Category, Tag, GalleryImage, Author
+from apps.blog.models import Blog, Category, Tag, GalleryImage, Author, ChunkedUpload
 from apps.blog.schema import (
     AuthorOut,
     AuthorIn,
@@ -16,6 +23,7 @@ from apps.blog.schema import (
     TagOut,
     TagIn,
     GalleryImageOut,
+    GalleryImageUsageOut,
     BlogOut,
     BlogIn,
     BlogPatch,
@@ -27,7 +35,36 @@ from apps.blog.schema import (
     PaginatedAuthorResponse,
     PaginatedGalleryResponse,
 )
-from apps.blog.schemas.bulk import BulkPostIDs, BulkPostCategory, BulkPostTag
+from apps.blog.schemas.bulk import (
+    BulkPostIDs,
+    BulkPostCategory,
+    BulkPostTag,
+    BulkImportResult,
+    BulkJobStatus,
+    BulkNames,
+    BulkResolvedIDs,
+)
+from apps.blog.schemas.uploads import ChunkedUploadIn, ChunkedUploadOut
+from apps.blog.tasks import bulk_operation_task
+from apps.blog.utils.bulk import (
+    BULK_ASYNC_THRESHOLD,
+    bulk_add_tags,
+    bulk_remove_tags,
+    bulk_set_tags,
+)
+from apps.blog.utils.exporter import EXPORT_FORMATS, stream_export
+from apps.blog.utils.images import serialize_image_metadata, serialize_srcset
+from apps.blog.utils.importer import PostImporter
+from apps.blog.utils.posts import save_post
+from apps.blog.utils.taxonomy import get_or_create_by_slug, slugify_name
+from apps.blog.utils.uploads import (
+    UploadChecksumMismatch,
+    UploadConflict,
+    UploadIncomplete,
+    assemble,
+    discard,
+    write_chunk,
+)
 from authentication.ninja_auth import django_auth_is_staff
 
 logger = logging.getLogger(__name__)
@@ -38,6 +75,51 @@ category_router = Router(tags=["Category"])
 tag_router = Router(tags=["Tag"])
 author_router = Router(tags=["Author"])
 gallery_router = Router(tags=["Gallery"])
+upload_router = Router(tags=["Upload"])
+
+# ------------------------
+# Helper Bulk Upsert Function
+# ------------------------
+def bulk_upsert_names(model, names: List[str]) -> dict:
+    invalid = [name for name in names if not slugify_name(model, name.strip())]
+    if invalid:
+        raise HttpError(400, f"Names must contain at least one letter or digit: {invalid}")
+    ids = get_or_create_by_slug(model, names)
+    return {"ids": [ids[slugify_name(model, name.strip())] for name in names]}
+
+# ------------------------
+# Chunked Upload Helpers
+# ------------------------
+def serialize_upload(upload: ChunkedUpload) -> dict:
+    return {
+        "upload_id": upload.id,
+        "filename": upload.filename,
+        "size": upload.size,
+        "offset": upload.received,
+        "max_chunk_size": settings.CHUNKED_UPLOAD_MAX_CHUNK_SIZE,
+        "complete": upload.received == upload.size,
+    }
+
+def get_complete_upload(request, upload_id: UUID) -> ChunkedUpload:
+    upload = get_object_or_404(ChunkedUpload, id=upload_id, user=request.user)
+    if upload.received != upload.size:
+        raise HttpError(409, f"Upload incomplete: {upload.received} of {upload.size} bytes received.")
+    return upload
+
+@contextmanager
+def assembled_upload(upload: ChunkedUpload):
+    """
+    Yield the verified file for a complete upload and clean up the parts once
+    the caller has stored it.
+    """
+    try:
+        file = assemble(upload)
+    except UploadChecksumMismatch as exc:
+        discard(upload)
+        raise HttpError(400, f"{exc} Start a new upload.")
+    with file:
+        yield file
+    discard(upload)
 
 # ------------------------
 # Helper Pagination Function
@@ -66,11 +148,16 @@ def serialize_tag(tag: Tag) -> dict:
         "slug": tag.slug,
     }
 
-def serialize_author(author: Author) -> dict:
+def serialize_author(request, author: Author) -> dict:
     return {
         "id": author.id,
         "full_name": author.user.get_full_name(),
         "bio": author.bio,
+        "avatar": request.build_absolute_uri(author.avatar.url) if author.avatar else None,
+        "avatar_srcset": serialize_srcset(
+            request, author.avatar_derivatives, author.avatar.storage
+        ),
+        "avatar_metadata": serialize_image_metadata(author, "avatar"),
         "instagram": author.instagram,
         "facebook": author.facebook,
         "x": author.x,
@@ -87,9 +174,12 @@ def serialize_gallery_image(request, image: GalleryImage) -> dict:
     return {
         "id": image.id,
         "image": request.build_absolute_uri(image.image.url),
+        "image_srcset": serialize_srcset(request, image.image_derivatives, image.image.storage),
+        "image_metadata": serialize_image_metadata(image, "image"),
         "alt_text": image.alt_text,
         "caption": image.caption,
         "uploaded_at": image.uploaded_at.isoformat() if image.uploaded_at else None,
+        "used_in_count": getattr(image, "used_in_count", 0),
     }
 
 def serialize_blog(request, blog: Blog) -> dict:
@@ -100,12 +190,16 @@ def serialize_blog(request, blog: Blog) -> dict:
         "excerpt": blog.excerpt,
         "content": blog.content,
         "featured_image": request.build_absolute_uri(blog.featured_image.url) if blog.featured_image else None,
+        "featured_image_srcset": serialize_srcset(
+            request, blog.featured_image_derivatives, blog.featured_image.storage
+        ),
+        "featured_image_metadata": serialize_image_metadata(blog, "featured_image"),
         "published": blog.published,
         "created_at": blog.created_at.isoformat() if blog.created_at else None,
         "updated_at": blog.updated_at.isoformat() if blog.updated_at else None,
         "category": serialize_category(blog.category) if blog.category else None,
         "tags": [serialize_tag(tag) for tag in blog.tags.all()],
-        "author": serialize_author(blog.author) if blog.author else None,
+        "author": serialize_author(request, blog.author) if blog.author else None,
         "keyphrase": blog.keyphrase,
         "cornerstone_content": blog.cornerstone_content,
         "seo_score": blog.seo_score,
@@ -228,52 +322,27 @@ def get_blog(request, post_id: UUID):
 
 @post_router.post("/posts", response=BlogOut, auth=django_auth_is_staff)
 def create_blog(request, payload: BlogIn, file: File[UploadedFile]):
-
-    # Look up the category using the UUID from the payload.
-    category = get_object_or_404(Category, id=payload.category_id)
-
-    # Check for an existing blog with the same slug if provided.
-    if payload.slug:
-        blog = Blog.objects.filter(slug=payload.slug).first()
-        if blog:
-            return {"detail": "A blog with this slug already exists."}
-    else:
-        payload.slug = slugify(payload.title)
-
-    # Create the blog instance using the data from the payload.
-    blog = Blog.objects.create(
-        slug=payload.slug,
-        title=payload.title,
-        excerpt=payload.excerpt,
-        content=payload.content,
-        category=category,
-        published=payload.published,
-        keyphrase=payload.keyphrase,
-        cornerstone_content=payload.cornerstone_content,
-        seo_score=payload.seo_score,
-        seo_analysis=payload.seo_analysis,
-        readability_score=payload.readability_score,
-        readability_analysis=payload.readability_analysis,
-    )
-
-    # Link the author if available.
-    if request.user.is_authenticated:
-        try:
-            blog.author = request.user.author_profile
-        except Author.DoesNotExist:
-            blog.author = None
-    blog.save()
-
-    # Set tags if provided.
-    if payload.tag_ids:
-        tags = Tag.objects.filter(id__in=payload.tag_ids)
-        blog.tags.set(tags)
-
-    # Handle the featured image from the file parameter.
+    values = {
+        "slug": payload.slug or slugify(payload.title),
+        "title": payload.title,
+        "excerpt": payload.excerpt,
+        "content": payload.content,
+        "category_id": payload.category_id,
+        "published": payload.published,
+        "keyphrase": payload.keyphrase,
+        "cornerstone_content": payload.cornerstone_content,
+        "seo_score": payload.seo_score,
+        "seo_analysis": payload.seo_analysis,
+        "readability_score": payload.readability_score,
+        "readability_analysis": payload.readability_analysis,
+    }
+    # The featured image is part of the single INSERT.
     if file:
-        blog.featured_image = file
-        blog.save()
+        values["featured_image"] = file
 
+    # Link the author if available.
+    author_user_id = request.user.id if request.user.is_authenticated else None
+    blog = save_post(Blog(), values, payload.tag_ids, author_user_id=author_user_id)
     return serialize_blog(request,blog)
 
 
@@ -281,31 +350,23 @@ def create_blog(request, payload: BlogIn, file: File[UploadedFile]):
 def update_blog(request, post_id: UUID, payload: BlogIn):
 
     blog = get_object_or_404(Blog, id=post_id)
+    values = {
+        "title": payload.title,
+        "excerpt": payload.excerpt,
+        "content": payload.content,
+        "published": payload.published,
+        "keyphrase": payload.keyphrase,
+        "seo_score": payload.seo_score,
+        "seo_analysis": payload.seo_analysis,
+        "readability_score": payload.readability_score,
+        "readability_analysis": payload.readability_analysis,
+        "cornerstone_content": payload.cornerstone_content,
+        "category_id": payload.category_id,
+    }
     if payload.slug:
-        check_blog = Blog.objects.filter(slug=payload.slug).exclude(id=post_id).first()
-        if check_blog:
-            return {"detail": "A blog with this slug already exists."}
-        blog.slug = payload.slug
-
-    blog.title = payload.title
-    blog.excerpt = payload.excerpt
-    blog.content = payload.content
-    blog.published = payload.published
-    blog.keyphrase = payload.keyphrase
-    blog.seo_score = payload.seo_score
-    blog.seo_analysis = payload.seo_analysis
-    blog.readability_score = payload.readability_score
-    blog.readability_analysis = payload.readability_analysis
-    blog.cornerstone_content = payload.cornerstone_content
-    blog.category = get_object_or_404(Category, id=payload.category_id)
-    if payload.tag_ids:
-        tags = Tag.objects.filter(id__in=payload.tag_ids)
-        blog.tags.set(tags)
-    else:
-        blog.tags.clear()
-    
-    blog.save()
-    
+        values["slug"] = payload.slug
+
+    save_post(blog, values, payload.tag_ids)
     return serialize_blog(request,blog)
 
 @post_router.post("/posts/{uuid:post_id}/featured-image", response=BlogOut, auth=django_auth_is_staff)
@@ -320,54 +381,48 @@ def update_featured_image(
     return serialize_blog(request, blog)
 
 
+@post_router.post(
+    "/posts/{uuid:post_id}/featured-image/uploads/{upload_id}",
+    response=BlogOut,
+    auth=django_auth_is_staff,
+)
+def finalize_featured_image_upload(request, post_id: UUID, upload_id: UUID):
+    blog = get_object_or_404(Blog, id=post_id)
+    upload = get_complete_upload(request, upload_id)
+    with assembled_upload(upload) as file:
+        blog.featured_image = file
+        blog.save()
+    return serialize_blog(request, blog)
+
+
 @post_router.patch("/posts/{uuid:post_id}", response=BlogOut, auth=django_auth_is_staff)
 def patch_blog(request, post_id: UUID, payload: BlogPatch):
     blog = get_object_or_404(Blog, id=post_id)
 
-    if payload.slug is not None:
-        check_blog = Blog.objects.filter(slug=payload.slug).exclude(id=post_id).first()
-        if check_blog:
-            return {"detail": "A blog with this slug already exists."}
-        blog.slug = payload.slug
-
     # Only update fields if they are provided.
-    if payload.title is not None:
-        blog.title = payload.title
-    if payload.excerpt is not None:
-        blog.excerpt = payload.excerpt
-    if payload.content is not None:
-        blog.content = payload.content
-    if payload.published is not None:
-        blog.published = payload.published
-    if payload.keyphrase is not None:
-        blog.keyphrase = payload.keyphrase
-    if payload.cornerstone_content is not None:
-        blog.cornerstone_content = payload.cornerstone_content
-    if payload.seo_score is not None:
-        blog.seo_score = payload.seo_score
-    if payload.seo_analysis is not None:
-        blog.seo_analysis = payload.seo_analysis
-    if payload.readability_score is not None:
-        blog.readability_score = payload.readability_score
-    if payload.readability_analysis is not None:
-        blog.readability_analysis = payload.readability_analysis
-    if payload.category_id is not None:
-        blog.category = get_object_or_404(Category, id=payload.category_id)
-    else:
-        blog.category = None
-    if payload.author_id is not None:
-        blog.author = get_object_or_404(Author, id=payload.author_id)
-    else:
-        blog.author = None
-    if payload.tag_ids is not None:
-        if payload.tag_ids:
-            tags = Tag.objects.filter(id__in=payload.tag_ids)
-            blog.tags.set(tags)
-        else:
-            blog.tags.clear()
+    values = {
+        field: getattr(payload, field)
+        for field in (
+            "slug",
+            "title",
+            "excerpt",
+            "content",
+            "published",
+            "keyphrase",
+            "cornerstone_content",
+            "seo_score",
+            "seo_analysis",
+            "readability_score",
+            "readability_analysis",
+        )
+        if getattr(payload, field) is not None
+    }
+    # Category and author are always written: omitting them clears them.
+    values["category_id"] = payload.category_id
+    values["author_id"] = payload.author_id
 
     # Save the blog after applying partial updates.
-    blog.save()
+    save_post(blog, values, payload.tag_ids)
     return serialize_blog(request,blog)
 
 
@@ -437,8 +492,33 @@ def blogs_by_tag(request, tag_id: UUID, page: int = 1, page_size: int = 25):
 # Bulk Post Endpoints
 # ------------------------
 
+def queue_bulk_operation(operation: str, post_ids: List[UUID], **params):
+    """
+    Hand a large selection to a Celery worker, which processes it in chunks.
+    Progress is available from the bulk-jobs endpoint.
+    """
+    job = bulk_operation_task.delay(operation, [str(post_id) for post_id in post_ids], params)
+    return {
+        "detail": f"Queued {operation} for {len(post_ids)} posts.",
+        "job_id": job.id,
+    }
+
+
+@post_router.get("/posts/bulk-jobs/{job_id}", response=BulkJobStatus, auth=django_auth_is_staff)
+def bulk_job_status(request, job_id: str):
+    result = AsyncResult(job_id)
+    status = {"job_id": job_id, "state": result.state}
+    if isinstance(result.info, dict):
+        status.update(result.info)
+    elif result.failed():
+        status["error"] = str(result.info)
+    return status
+
+
 @post_router.delete("/posts/bulk-delete", auth=django_auth_is_staff)
 def bulk_delete_posts(request, payload: BulkPostIDs):
+    if len(payload.post_ids) > BULK_ASYNC_THRESHOLD:
+        return queue_bulk_operation("delete", payload.post_ids)
     qs = Blog.objects.filter(id__in=payload.post_ids)
     count = qs.count()
     qs.delete()
@@ -447,6 +527,8 @@ def bulk_delete_posts(request, payload: BulkPostIDs):
 
 @post_router.patch("/posts/bulk-publish", auth=django_auth_is_staff)
 def bulk_publish_posts(request, payload: BulkPostIDs):
+    if len(payload.post_ids) > BULK_ASYNC_THRESHOLD:
+        return queue_bulk_operation("publish", payload.post_ids)
     qs = Blog.objects.filter(id__in=payload.post_ids)
     updated = qs.update(published=True)
     return {"detail": f"Published {updated} posts successfully."}
@@ -454,6 +536,8 @@ def bulk_publish_posts(request, payload: BulkPostIDs):
 
 @post_router.patch("/posts/bulk-draft", auth=django_auth_is_staff)
 def bulk_draft_posts(request, payload: BulkPostIDs):
+    if len(payload.post_ids) > BULK_ASYNC_THRESHOLD:
+        return queue_bulk_operation("draft", payload.post_ids)
     qs = Blog.objects.filter(id__in=payload.post_ids)
     updated = qs.update(published=False)
     return {"detail": f"Set {updated} posts to draft successfully."}
@@ -461,6 +545,8 @@ def bulk_draft_posts(request, payload: BulkPostIDs):
 
 @post_router.patch("/posts/bulk-cornerstone", auth=django_auth_is_staff)
 def bulk_cornerstone_posts(request, payload: BulkPostIDs):
+    if len(payload.post_ids) > BULK_ASYNC_THRESHOLD:
+        return queue_bulk_operation("cornerstone", payload.post_ids)
     qs = Blog.objects.filter(id__in=payload.post_ids)
     updated = qs.update(cornerstone_content=True)
     return {"detail": f"Marked {updated} posts as cornerstone successfully."}
@@ -468,6 +554,8 @@ def bulk_cornerstone_posts(request, payload: BulkPostIDs):
 
 @post_router.patch("/posts/bulk-not-cornerstone", auth=django_auth_is_staff)
 def bulk_not_cornerstone_posts(request, payload: BulkPostIDs):
+    if len(payload.post_ids) > BULK_ASYNC_THRESHOLD:
+        return queue_bulk_operation("not-cornerstone", payload.post_ids)
     qs = Blog.objects.filter(id__in=payload.post_ids)
     updated = qs.update(cornerstone_content=False)
     return {"detail": f"Marked {updated} posts as not cornerstone successfully."}
@@ -476,6 +564,10 @@ def bulk_not_cornerstone_posts(request, payload: BulkPostIDs):
 @post_router.patch("/posts/bulk-add-category", auth=django_auth_is_staff)
 def bulk_add_category(request, payload: BulkPostCategory):
     category = get_object_or_404(Category, id=payload.category_id)
+    if len(payload.post_ids) > BULK_ASYNC_THRESHOLD:
+        return queue_bulk_operation(
+            "add-category", payload.post_ids, category_id=str(category.id)
+        )
     qs = Blog.objects.filter(id__in=payload.post_ids)
     updated = qs.update(category=category)
     return {"detail": f"Assigned category to {updated} posts successfully."}
@@ -483,6 +575,10 @@ def bulk_add_category(request, payload: BulkPostCategory):
 
 @post_router.patch("/posts/bulk-remove-category", auth=django_auth_is_staff)
 def bulk_remove_category(request, payload: BulkPostCategory):
+    if len(payload.post_ids) > BULK_ASYNC_THRESHOLD:
+        return queue_bulk_operation(
+            "remove-category", payload.post_ids, category_id=str(payload.category_id)
+        )
     qs = Blog.objects.filter(id__in=payload.post_ids, category_id=payload.category_id)
     updated = qs.update(category=None)
     return {"detail": f"Removed category from {updated} posts successfully."}
@@ -490,23 +586,73 @@ def bulk_remove_category(request, payload: BulkPostCategory):
 
 @post_router.patch("/posts/bulk-add-tag", auth=django_auth_is_staff)
 def bulk_add_tag(request, payload: BulkPostTag):
-    qs = Blog.objects.filter(id__in=payload.post_ids)
-    tags = list(Tag.objects.filter(id__in=payload.tag_ids))
-    count = 0
-    for blog in qs:
-        blog.tags.add(*tags)
-        count += 1
-    return {"detail": f"Added tags to {count} posts successfully."}
+    if len(payload.post_ids) > BULK_ASYNC_THRESHOLD:
+        return queue_bulk_operation(
+            "add-tag", payload.post_ids, tag_ids=[str(tag_id) for tag_id in payload.tag_ids]
+        )
+    posts, added = bulk_add_tags(payload.post_ids, payload.tag_ids)
+    return {
+        "detail": f"Added tags to {posts} posts successfully.",
+        "posts": posts,
+        "added": added,
+    }
 
 
 @post_router.patch("/posts/bulk-remove-tag", auth=django_auth_is_staff)
 def bulk_remove_tag(request, payload: BulkPostTag):
-    qs = Blog.objects.filter(id__in=payload.post_ids)
-    count = 0
-    for blog in qs:
-        blog.tags.remove(*payload.tag_ids)
-        count += 1
-    return {"detail": f"Removed tags from {count} posts successfully."}
+    if len(payload.post_ids) > BULK_ASYNC_THRESHOLD:
+        return queue_bulk_operation(
+            "remove-tag", payload.post_ids, tag_ids=[str(tag_id) for tag_id in payload.tag_ids]
+        )
+    posts, removed = bulk_remove_tags(payload.post_ids, payload.tag_ids)
+    return {
+        "detail": f"Removed tags from {posts} posts successfully.",
+        "posts": posts,
+        "removed": removed,
+    }
+
+
+@post_router.patch("/posts/bulk-set-tags", auth=django_auth_is_staff)
+def bulk_set_tag(request, payload: BulkPostTag):
+    if len(payload.post_ids) > BULK_ASYNC_THRESHOLD:
+        return queue_bulk_operation(
+            "set-tags", payload.post_ids, tag_ids=[str(tag_id) for tag_id in payload.tag_ids]
+        )
+    posts, added, removed = bulk_set_tags(payload.post_ids, payload.tag_ids)
+    return {
+        "detail": f"Replaced tags on {posts} posts successfully.",
+        "posts": posts,
+        "added": added,
+        "removed": removed,
+    }
+
+
+@post_router.post("/posts/import", response=BulkImportResult, auth=django_auth_is_staff)
+def import_posts(request):
+    # The NDJSON body is read line by line straight from the request stream, so
+    # it is never buffered in full; send it with Content-Type: application/x-ndjson.
+    return PostImporter().run(request)
+
+
+
+@post_router.get("/posts/export", auth=django_auth_is_staff)
+def export_posts(
+    request, export_format: str = Query("ndjson", alias="format"), compress: bool = False
+):
+    if export_format not in EXPORT_FORMATS:
+        raise HttpError(400, f"Unsupported export format: {export_format}")
+
+    filename = f"posts-{timezone.now():%Y%m%d}.{export_format}"
+    content_type = EXPORT_FORMATS[export_format]
+    if compress:
+        filename += ".gz"
+        content_type = "application/gzip"
+
+    response = StreamingHttpResponse(
+        stream_export(export_format, compress), content_type=content_type
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
 
 
@@ -537,6 +683,11 @@ def create_category(request, payload: CategoryIn):
     return serialize_category(category)
 
 
+@category_router.post("/categories/bulk", response=BulkResolvedIDs, auth=django_auth_is_staff)
+def bulk_create_categories(request, payload: BulkNames):
+    return bulk_upsert_names(Category, payload.names)
+
+
 @category_router.put(
     "/categories/{category_id}", response=CategoryOut, auth=django_auth_is_staff
 )
@@ -581,6 +732,11 @@ def create_tag(request, payload: TagIn):
     return serialize_tag(tag)
 
 
+@tag_router.post("/tags/bulk", response=BulkResolvedIDs, auth=django_auth_is_staff)
+def bulk_create_tags(request, payload: BulkNames):
+    return bulk_upsert_names(Tag, payload.names)
+
+
 @tag_router.put("/tags/{tag_id}", response=TagOut, auth=django_auth_is_staff)
 def update_tag(request, tag_id: UUID, payload: TagIn):
     tag = get_object_or_404(Tag, id=tag_id)
@@ -601,9 +757,9 @@ def delete_tag(request, tag_id: UUID):
 # ------------------------
 @gallery_router.get("/gallery", response=PaginatedGalleryResponse)
 def list_gallery(request, page: int = 1, page_size: int = 25):
-    qs = GalleryImage.objects.all()
+    qs = GalleryImage.objects.annotate(used_in_count=Count("blogs"))
     items, total_items, total_pages = paginate_queryset(qs, page, page_size)
-    serialized_items = [serialize_gallery_image(img) for img in items]
+    serialized_items = [serialize_gallery_image(request, img) for img in items]
     pagination = {
         "page": page,
         "page_size": page_size,
@@ -627,6 +783,42 @@ def upload_image(request, payload: GalleryImageIn, file: File[UploadedFile]):
     return serialize_gallery_image(request, image)
 
 
+@gallery_router.get(
+    "/gallery/{uuid:image_id}/usage", response=GalleryImageUsageOut, auth=django_auth_is_staff
+)
+def get_gallery_image_usage(request, image_id: UUID):
+    image = get_object_or_404(GalleryImage, id=image_id)
+    # Answered from the indexed (blog, gallery image) link table.
+    posts = list(image.blogs.order_by("-created_at").values("id", "title", "slug", "published"))
+    return {"count": len(posts), "results": posts}
+
+
+@gallery_router.delete("/gallery/{uuid:image_id}", auth=django_auth_is_staff)
+def delete_gallery_image(request, image_id: UUID, force: bool = False):
+    image = get_object_or_404(GalleryImage, id=image_id)
+    used_in = image.blogs.count()
+    if used_in and not force:
+        raise HttpError(
+            409, f"Image is used in {used_in} posts. Pass force=true to delete it anyway."
+        )
+    image.delete()
+    return {"detail": "Image deleted successfully.", "used_in_count": used_in}
+
+
+@gallery_router.post(
+    "/gallery/uploads/{upload_id}", response=GalleryImageOut, auth=django_auth_is_staff
+)
+def finalize_gallery_upload(request, upload_id: UUID, payload: GalleryImageIn):
+    upload = get_complete_upload(request, upload_id)
+    with assembled_upload(upload) as file:
+        image = GalleryImage.objects.create(
+            image=file,
+            alt_text=payload.alt_text,
+            caption=payload.caption,
+        )
+    return serialize_gallery_image(request, image)
+
+
 # ------------------------
 # Author Endpoints (with pagination)
 # ------------------------
@@ -634,25 +826,7 @@ def upload_image(request, payload: GalleryImageIn, file: File[UploadedFile]):
 def list_authors(request, page: int = 1, page_size: int = 25):
     qs = Author.objects.all()
     items, total_items, total_pages = paginate_queryset(qs, page, page_size)
-    results = []
-    for author in items:
-        results.append(
-            {
-                "id": author.id,
-                "full_name": author.user.get_full_name(),
-                "bio": author.bio,
-                "instagram": author.instagram,
-                "facebook": author.facebook,
-                "x": author.x,
-                "linkedin": author.linkedin,
-                "github": author.github,
-                "pinterest": author.pinterest,
-                "threads": author.threads,
-                "bluesky": author.bluesky,
-                "youtube": author.youtube,
-                "tiktok": author.tiktok,
-            }
-        )
+    results = [serialize_author(request, author) for author in items]
     pagination = {
         "page": page,
         "page_size": page_size,
@@ -669,21 +843,7 @@ def list_authors(request, page: int = 1, page_size: int = 25):
 @author_router.get("/authors/{author_id}", response=AuthorOut)
 def get_author(request, author_id: UUID):
     author = get_object_or_404(Author, id=author_id)
-    return {
-        "id": author.id,
-        "full_name": author.user.get_full_name(),
-        "bio": author.bio,
-        "instagram": author.instagram,
-        "facebook": author.facebook,
-        "x": author.x,
-        "linkedin": author.linkedin,
-        "github": author.github,
-        "pinterest": author.pinterest,
-        "threads": author.threads,
-        "bluesky": author.bluesky,
-        "youtube": author.youtube,
-        "tiktok": author.tiktok,
-    }
+    return serialize_author(request, author)
 
 
 # Use our custom auth on updates for authors.
@@ -714,18 +874,65 @@ def update_author(request, author_id: UUID, payload: AuthorIn):
         author.tiktok = payload.tiktok
 
     author.save()
-    return {
-        "id": author.id,
-        "full_name": author.user.get_full_name(),
-        "bio": author.bio,
-        "instagram": author.instagram,
-        "facebook": author.facebook,
-        "x": author.x,
-        "linkedin": author.linkedin,
-        "github": author.github,
-        "pinterest": author.pinterest,
-        "threads": author.threads,
-        "bluesky": author.bluesky,
-        "youtube": author.youtube,
-        "tiktok": author.tiktok,
-    }
+    return serialize_author(request, author)
+
+
+# ------------------------
+# Chunked Upload Endpoints
+# ------------------------
+# Large images are uploaded in pieces: POST /uploads announces the file, each
+# PUT /uploads/{id} appends one chunk starting at the Upload-Offset header, and
+# the finalize endpoints under /gallery and /posts turn the verified file into
+# a gallery image or featured image. GET /uploads/{id} reports the offset to
+# resume from after a dropped connection.
+@upload_router.post("/uploads", response=ChunkedUploadOut, auth=django_auth_is_staff)
+def create_upload(request, payload: ChunkedUploadIn):
+    if payload.size > settings.CHUNKED_UPLOAD_MAX_SIZE:
+        raise HttpError(413, f"Uploads are limited to {settings.CHUNKED_UPLOAD_MAX_SIZE} bytes.")
+    upload = ChunkedUpload.objects.create(
+        user=request.user,
+        filename=payload.filename,
+        size=payload.size,
+        sha256=payload.sha256.lower(),
+    )
+    return serialize_upload(upload)
+
+
+@upload_router.get("/uploads/{upload_id}", response=ChunkedUploadOut, auth=django_auth_is_staff)
+def get_upload(request, upload_id: UUID):
+    upload = get_object_or_404(ChunkedUpload, id=upload_id, user=request.user)
+    return serialize_upload(upload)
+
+
+@upload_router.put("/uploads/{upload_id}", response=ChunkedUploadOut, auth=django_auth_is_staff)
+def upload_chunk(request, upload_id: UUID):
+    upload = get_object_or_404(ChunkedUpload, id=upload_id, user=request.user)
+    try:
+        offset = int(request.headers["Upload-Offset"])
+        length = int(request.headers["Content-Length"])
+    except (KeyError, ValueError):
+        raise HttpError(400, "Upload-Offset and Content-Length headers are required.")
+
+    # Validate everything before touching the body: it is streamed straight
+    # to storage and cannot be read twice.
+    if offset != upload.received:
+        raise HttpError(409, f"Expected offset {upload.received}, got {offset}.")
+    if length > settings.CHUNKED_UPLOAD_MAX_CHUNK_SIZE:
+        raise HttpError(413, f"Chunks are limited to {settings.CHUNKED_UPLOAD_MAX_CHUNK_SIZE} bytes.")
+    if length <= 0 or offset + length > upload.size:
+        raise HttpError(400, f"Chunk must be 1 to {upload.size - offset} bytes.")
+
+    try:
+        write_chunk(upload, offset, request, length)
+    except UploadConflict as exc:
+        raise HttpError(409, str(exc))
+    except UploadIncomplete as exc:
+        raise HttpError(400, str(exc))
+    return serialize_upload(upload)
+
+
+@upload_router.delete("/uploads/{upload_id}", auth=django_auth_is_staff)
+def delete_upload(request, upload_id: UUID):
+    upload = get_object_or_404(ChunkedUpload, id=upload_id, user=request.user)
+    discard(upload)
+    return {"detail": "Upload deleted successfully."}
@@ -5,4 +5,6 @@ class BlogConfig(AppConfig):
     name = "apps.blog"
 
     def ready(self) -> None:
-        pass
+        from apps.blog.signals import connect_signals
+
+        connect_signals()
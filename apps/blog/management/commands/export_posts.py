@@ -0,0 +1,39 @@
+import sys
+from typing import Any, Union
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.blog.utils.exporter import EXPORT_FORMATS, stream_export
+
+
+class Command(BaseCommand):
+    help = "Export all posts as NDJSON or CSV."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--format",
+            choices=sorted(EXPORT_FORMATS),
+            default="ndjson",
+            help="Output format.",
+        )
+        parser.add_argument("--gzip", action="store_true", help="Gzip the output.")
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="File to write to, or '-' for stdout.",
+        )
+
+    def handle(self, *args: Any, **options: Union[str, bool]) -> None:
+        chunks = stream_export(str(options["format"]), bool(options["gzip"]))
+        output = str(options["output"])
+
+        if output == "-":
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+            return
+
+        with open(output, "wb") as stream:
+            for chunk in chunks:
+                stream.write(chunk)
+        self.stderr.write(self.style.SUCCESS(f"Exported posts to {output}."))
@@ -0,0 +1,115 @@
+import os
+import shutil
+import time
+from datetime import timedelta
+from typing import Any, List, Union
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from django.utils import timezone
+
+from apps.blog.models import ChunkedUpload, MediaBlob
+from apps.blog.utils.media_gc import (
+    SUPPORTED_VENDORS,
+    find_orphans,
+    referenced_names,
+    walk_media,
+)
+
+DEFAULT_GRACE_HOURS = 24
+PROGRESS_EVERY = 100_000
+BLOB_DELETE_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Remove or quarantine media files that no database row refers to."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=DEFAULT_GRACE_HOURS,
+            help="Leave files modified more recently than this alone.",
+        )
+        parser.add_argument(
+            "--quarantine",
+            help="Move orphans into this directory instead of deleting them.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report orphans without touching them.",
+        )
+
+    def handle(self, *args: Any, **options: Union[str, float, bool, None]) -> None:
+        # Checked before anything is expired or walked.
+        if connection.vendor not in SUPPORTED_VENDORS:
+            raise CommandError(
+                f"gc_media does not support {connection.vendor} databases; "
+                f"supported: {', '.join(sorted(SUPPORTED_VENDORS))}."
+            )
+
+        started = time.monotonic()
+        dry_run = bool(options["dry_run"])
+        cutoff = timezone.now() - timedelta(hours=float(options["grace_hours"]))
+        root = os.path.abspath(settings.MEDIA_ROOT)
+        quarantine = os.path.abspath(str(options["quarantine"])) if options["quarantine"] else None
+
+        # Uploads abandoned for longer than the grace period no longer protect
+        # their parts.
+        stale_uploads = ChunkedUpload.objects.filter(updated_at__lt=cutoff)
+        if not dry_run:
+            expired, _ = stale_uploads.delete()
+        else:
+            expired = stale_uploads.count()
+
+        scanned = orphans = reclaimed = recent = 0
+        removed_blobs: List[str] = []
+        files = walk_media(root, skip=quarantine, prune=not dry_run)
+
+        def counted(files):
+            nonlocal scanned
+            for item in files:
+                scanned += 1
+                if scanned % PROGRESS_EVERY == 0:
+                    self.stdout.write(
+                        f"Scanned {scanned} files, {orphans} orphans "
+                        f"({time.monotonic() - started:.1f}s)"
+                    )
+                yield item
+
+        for path, size, mtime in find_orphans(counted(files), referenced_names()):
+            if mtime > cutoff.timestamp():
+                recent += 1
+                continue
+            orphans += 1
+            reclaimed += size
+            if dry_run:
+                self.stdout.write(f"Orphan: {path} ({size} bytes)")
+                continue
+
+            source = os.path.join(root, path)
+            if quarantine:
+                target = os.path.join(quarantine, path)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.move(source, target)
+            else:
+                os.remove(source)
+
+            removed_blobs.append(path)
+            if len(removed_blobs) >= BLOB_DELETE_BATCH_SIZE:
+                MediaBlob.objects.filter(name__in=removed_blobs).delete()
+                removed_blobs.clear()
+        if removed_blobs:
+            MediaBlob.objects.filter(name__in=removed_blobs).delete()
+
+        action = "Would reclaim" if dry_run else ("Quarantined" if quarantine else "Reclaimed")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Scanned {scanned} files in {time.monotonic() - started:.1f}s. "
+                f"{action} {reclaimed} bytes from {orphans} orphans; "
+                f"kept {recent} recent unreferenced files and expired {expired} "
+                f"abandoned uploads."
+            )
+        )
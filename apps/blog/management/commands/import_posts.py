@@ -0,0 +1,48 @@
+import gzip
+import sys
+import time
+from typing import Any, Union
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.blog.utils.importer import IMPORT_BATCH_SIZE, PostImporter
+
+
+class Command(BaseCommand):
+    help = "Import posts from an NDJSON file (optionally gzipped)."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", help="NDJSON file to read, or '-' for stdin.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help="Number of posts written per transaction.",
+        )
+
+    def handle(self, *args: Any, **options: Union[str, int]) -> None:
+        path = str(options["path"])
+        started = time.monotonic()
+
+        def report(importer: PostImporter) -> None:
+            self.stdout.write(
+                f"{importer.created} created, {importer.skipped} skipped, "
+                f"{importer.failed} failed ({time.monotonic() - started:.1f}s)"
+            )
+
+        importer = PostImporter(batch_size=int(options["batch_size"]), progress=report)
+        if path == "-":
+            result = importer.run(sys.stdin)
+        else:
+            opener = gzip.open if path.endswith(".gz") else open
+            with opener(path, "rt", encoding="utf-8") as stream:
+                result = importer.run(stream)
+
+        for error in result["errors"]:
+            self.stderr.write(error)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result['created']} posts ({result['skipped']} skipped, "
+                f"{result['failed']} failed) in {time.monotonic() - started:.1f}s."
+            )
+        )
@@ -0,0 +1,41 @@
+from typing import Any, Union
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from apps.blog.models import Blog
+from apps.blog.utils.usage import index_gallery_usage
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = "Rebuild the index of gallery images embedded in post content."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of posts indexed per transaction.",
+        )
+
+    def handle(self, *args: Any, **options: Union[str, int]) -> None:
+        batch_size = int(options["batch_size"])
+        posts = Blog.objects.only("id", "content").order_by("pk")
+        indexed = 0
+        batch = []
+        for blog in posts.iterator(chunk_size=batch_size):
+            batch.append(blog)
+            if len(batch) >= batch_size:
+                with transaction.atomic():
+                    index_gallery_usage(batch)
+                indexed += len(batch)
+                batch = []
+                self.stdout.write(f"Indexed {indexed} posts")
+        if batch:
+            with transaction.atomic():
+                index_gallery_usage(batch)
+            indexed += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed gallery image usage for {indexed} posts."))
@@ -0,0 +1,51 @@
+from typing import Any, Union
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Q
+
+from apps.blog.tasks import generate_image_derivatives
+from apps.blog.utils.images import DERIVATIVE_FIELDS
+
+
+class Command(BaseCommand):
+    help = "Generate derivatives, dimensions and placeholders for images that lack them."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Reprocess every image, not only those missing metadata.",
+        )
+        parser.add_argument(
+            "--queue",
+            action="store_true",
+            help="Queue a Celery task per image instead of processing inline.",
+        )
+
+    def handle(self, *args: Any, **options: Union[str, bool]) -> None:
+        processed = 0
+        for model_label, fields in DERIVATIVE_FIELDS.items():
+            model = apps.get_model(model_label)
+            for field in fields:
+                rows = model.objects.exclude(**{f"{field}__isnull": True}).exclude(**{field: ""})
+                if not options["all"]:
+                    rows = rows.filter(
+                        Q(**{f"{field}_width__isnull": True})
+                        | Q(**{f"{field}_lqip": ""})
+                        | Q(**{f"{field}_derivatives": []})
+                    )
+
+                for pk in rows.values_list("pk", flat=True).iterator():
+                    if options["queue"]:
+                        generate_image_derivatives.delay(model_label, str(pk), field)
+                    else:
+                        try:
+                            generate_image_derivatives(model_label, str(pk), field)
+                        except (OSError, ValueError) as exc:
+                            self.stderr.write(f"{model_label} {pk} {field}: {exc}")
+                            continue
+                    processed += 1
+
+        action = "Queued" if options["queue"] else "Processed"
+        self.stdout.write(self.style.SUCCESS(f"{action} {processed} images."))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0006_blog_keyphrase"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="author",
+            name="avatar_derivatives",
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name="blog",
+            name="featured_image_derivatives",
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name="galleryimage",
+            name="image_derivatives",
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
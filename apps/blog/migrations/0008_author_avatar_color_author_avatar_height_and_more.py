@@ -0,0 +1,73 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0007_author_avatar_derivatives_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="author",
+            name="avatar_color",
+            field=models.CharField(blank=True, default="", max_length=7),
+        ),
+        migrations.AddField(
+            model_name="author",
+            name="avatar_height",
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="author",
+            name="avatar_lqip",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AddField(
+            model_name="author",
+            name="avatar_width",
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="blog",
+            name="featured_image_color",
+            field=models.CharField(blank=True, default="", max_length=7),
+        ),
+        migrations.AddField(
+            model_name="blog",
+            name="featured_image_height",
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="blog",
+            name="featured_image_lqip",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AddField(
+            model_name="blog",
+            name="featured_image_width",
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="galleryimage",
+            name="image_color",
+            field=models.CharField(blank=True, default="", max_length=7),
+        ),
+        migrations.AddField(
+            model_name="galleryimage",
+            name="image_height",
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="galleryimage",
+            name="image_lqip",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AddField(
+            model_name="galleryimage",
+            name="image_width",
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+    ]
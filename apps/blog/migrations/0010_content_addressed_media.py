@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:22
+
+import apps.blog.utils.storage
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0009_chunkedupload"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MediaBlob",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("references", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="author",
+            name="avatar",
+            field=models.ImageField(blank=True, null=True, storage=apps.blog.utils.storage.media_storage, upload_to="authors/avatars/"),
+        ),
+        migrations.AlterField(
+            model_name="blog",
+            name="featured_image",
+            field=models.ImageField(blank=True, null=True, storage=apps.blog.utils.storage.media_storage, upload_to="blogs/featured/"),
+        ),
+        migrations.AlterField(
+            model_name="galleryimage",
+            name="image",
+            field=models.ImageField(storage=apps.blog.utils.storage.media_storage, upload_to="gallery/"),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:26
+
+import apps.blog.utils.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0010_content_addressed_media"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blog",
+            name="gallery_images",
+            field=models.ManyToManyField(blank=True, related_name="blogs", to="blog.galleryimage"),
+        ),
+        migrations.AlterField(
+            model_name="galleryimage",
+            name="image",
+            field=models.ImageField(db_index=True, storage=apps.blog.utils.storage.media_storage, upload_to="gallery/"),
+        ),
+    ]
@@ -4,6 +4,8 @@ from django.contrib.auth import get_user_model
 from django.utils.text import slugify
 import uuid
 
+from apps.blog.utils.storage import media_storage
+
 User = get_user_model()
 
 class Author(models.Model):
@@ -14,7 +16,15 @@ class Author(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='author_profile')
     bio = models.TextField(blank=True, null=True)
-    avatar = models.ImageField(upload_to='authors/avatars/', blank=True, null=True)
+    avatar = models.ImageField(upload_to='authors/avatars/', storage=media_storage, blank=True, null=True)
+    # Resized copies of the avatar, filled in by a Celery task after upload.
+    avatar_derivatives = models.JSONField(default=list, blank=True)
+    # Dimensions, dominant colour and inline placeholder, so clients can lay
+    # out the avatar before downloading it.
+    avatar_width = models.PositiveIntegerField(blank=True, null=True, db_index=True)
+    avatar_height = models.PositiveIntegerField(blank=True, null=True, db_index=True)
+    avatar_color = models.CharField(max_length=7, blank=True, default='')
+    avatar_lqip = models.TextField(blank=True, default='')
     
     # Native social link fields
     instagram = models.URLField(blank=True, null=True)
@@ -59,7 +69,12 @@ class Tag(models.Model):
 
 class GalleryImage(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    image = models.ImageField(upload_to='gallery/')
+    image = models.ImageField(upload_to='gallery/', storage=media_storage, db_index=True)
+    image_derivatives = models.JSONField(default=list, blank=True)
+    image_width = models.PositiveIntegerField(blank=True, null=True, db_index=True)
+    image_height = models.PositiveIntegerField(blank=True, null=True, db_index=True)
+    image_color = models.CharField(max_length=7, blank=True, default='')
+    image_lqip = models.TextField(blank=True, default='')
     alt_text = models.CharField(max_length=255)
     caption = models.CharField(max_length=255, blank=True, null=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
@@ -74,9 +89,16 @@ class Blog(models.Model):
     slug = models.SlugField(unique=True, blank=True, max_length=100)
     excerpt = models.TextField(blank=True, null=True)
     content = models.TextField()  # Markdown content
-    featured_image = models.ImageField(upload_to='blogs/featured/', blank=True, null=True)
+    featured_image = models.ImageField(upload_to='blogs/featured/', storage=media_storage, blank=True, null=True)
+    featured_image_derivatives = models.JSONField(default=list, blank=True)
+    featured_image_width = models.PositiveIntegerField(blank=True, null=True, db_index=True)
+    featured_image_height = models.PositiveIntegerField(blank=True, null=True, db_index=True)
+    featured_image_color = models.CharField(max_length=7, blank=True, default='')
+    featured_image_lqip = models.TextField(blank=True, default='')
     category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, related_name='blogs')
     tags = models.ManyToManyField(Tag, related_name='blogs', blank=True)
+    # Gallery images embedded in the Markdown content, kept in sync on save.
+    gallery_images = models.ManyToManyField(GalleryImage, related_name='blogs', blank=True)
     published = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -108,3 +130,40 @@ class Blog(models.Model):
         related_by_category = Blog.objects.filter(category=self.category).exclude(id=self.id)
         qs = (related_by_tags | related_by_category).distinct()
         return qs.order_by('-created_at')[:limit]
+
+
+class ChunkedUpload(models.Model):
+    """
+    A resumable upload in progress. The client sends the file in chunks, each
+    stored as a separate part under ``uploads/partial/<id>/``; the parts are
+    joined and checksummed when the upload is finalized.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='chunked_uploads')
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    sha256 = models.CharField(max_length=64)
+    received = models.PositiveBigIntegerField(default=0)
+    # Storage names of the parts received so far, in offset order.
+    parts = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.filename} ({self.received}/{self.size})"
+
+
+class MediaBlob(models.Model):
+    """
+    A content-addressed image file and the number of image fields that point
+    at it. The file and its derivatives are deleted when the count drops to
+    zero.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=255, unique=True)
+    size = models.PositiveBigIntegerField(default=0)
+    references = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.references})"
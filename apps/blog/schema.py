@@ -7,10 +7,26 @@ from uuid import UUID
 # Existing Schemas
 # ------------------------
 
+class ImageVariantOut(Schema):
+    url: str
+    width: int
+    height: int
+    format: str
+    size: int
+
+class ImageMetadataOut(Schema):
+    width: int
+    height: int
+    color: Optional[str] = None  # dominant colour, "#rrggbb"
+    lqip: Optional[str] = None  # tiny base64 data URI placeholder
+
 class AuthorOut(Schema):
     id: UUID
     full_name: Optional[str] = None
     bio: Optional[str] = None
+    avatar: Optional[str] = None
+    avatar_srcset: List[ImageVariantOut] = []
+    avatar_metadata: Optional[ImageMetadataOut] = None
     instagram: Optional[str] = None
     facebook: Optional[str] = None
     x: Optional[str] = None
@@ -64,6 +80,9 @@ class BlogSEOAnalysisIn(Schema):
 class GalleryImageOut(Schema):
     id: UUID
     image: str  # URL to the image file
+    image_srcset: List[ImageVariantOut] = []
+    image_metadata: Optional[ImageMetadataOut] = None
+    used_in_count: int = 0  # posts embedding this image
     alt_text: str
     caption: Optional[str] = None
     uploaded_at: str
@@ -75,6 +94,8 @@ class BlogOut(Schema):
     excerpt: Optional[str] = None
     content: str
     featured_image: Optional[str] = None
+    featured_image_srcset: List[ImageVariantOut] = []
+    featured_image_metadata: Optional[ImageMetadataOut] = None
     published: bool
     created_at: str
     updated_at: str
@@ -164,6 +185,16 @@ class PaginatedTagResponse(Schema):
     results: List[TagOut]
     pagination: Pagination
 
+class PostReferenceOut(Schema):
+    id: UUID
+    title: str
+    slug: str
+    published: bool
+
+class GalleryImageUsageOut(Schema):
+    count: int
+    results: List[PostReferenceOut]
+
 class PaginatedGalleryResponse(Schema):
     results: List[GalleryImageOut]
     pagination: Pagination
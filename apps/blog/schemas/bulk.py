@@ -1,6 +1,6 @@
 from uuid import UUID
-from typing import List
-from ninja import Schema
+from typing import Annotated, Dict, List, Optional
+from ninja import Field, Schema
 
 class BulkPostIDs(Schema):
     post_ids: List[UUID]
@@ -11,4 +11,46 @@ class BulkPostCategory(Schema):
 
 class BulkPostTag(Schema):
     post_ids: List[UUID]
-    tag_ids: List[UUID]
\ No newline at end of file
+    tag_ids: List[UUID]
+
+class BulkJobStatus(Schema):
+    job_id: str
+    state: str
+    processed: int = 0
+    total: Optional[int] = None
+    count: Optional[int] = None
+    error: Optional[str] = None
+
+class BulkNames(Schema):
+    names: List[str]
+
+class BulkResolvedIDs(Schema):
+    ids: List[UUID]
+
+class BlogImportRecord(Schema):
+    """
+    One line of an NDJSON post import. Category and tags are given by name and
+    created on the fly; the author is matched by the user's email address.
+    Lengths match the model columns, so an over-long value fails its own line
+    instead of the whole batch.
+    """
+    title: str = Field(..., max_length=255)
+    slug: Optional[str] = Field(None, max_length=100)
+    excerpt: Optional[str] = None
+    content: str
+    category: Optional[str] = Field(None, max_length=100)
+    tags: List[Annotated[str, Field(max_length=50)]] = []
+    author_email: Optional[str] = Field(None, max_length=254)
+    published: bool = False
+    keyphrase: Optional[str] = Field(None, max_length=255)
+    cornerstone_content: bool = False
+    seo_score: int = 0
+    seo_analysis: Optional[Dict] = None
+    readability_score: int = 0
+    readability_analysis: Optional[Dict] = None
+
+class BulkImportResult(Schema):
+    created: int
+    skipped: int
+    failed: int
+    errors: List[str] = []
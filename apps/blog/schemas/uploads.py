@@ -0,0 +1,17 @@
+from uuid import UUID
+
+from ninja import Field, Schema
+
+
+class ChunkedUploadIn(Schema):
+    filename: str = Field(..., max_length=255)
+    size: int = Field(..., gt=0)
+    sha256: str = Field(..., pattern=r"^[0-9a-fA-F]{64}$")
+
+class ChunkedUploadOut(Schema):
+    upload_id: UUID
+    filename: str
+    size: int
+    offset: int  # bytes received so far; the next chunk starts here
+    max_chunk_size: int
+    complete: bool
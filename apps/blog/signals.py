@@ -0,0 +1,80 @@
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from apps.blog.models import Blog
+from apps.blog.tasks import generate_image_derivatives
+from apps.blog.utils.blobs import acquire, release
+from apps.blog.utils.images import DERIVATIVE_FIELDS, reset_image_metadata
+from apps.blog.utils.usage import index_gallery_usage
+
+
+def track_new_images(sender, instance, **kwargs) -> None:
+    # An uploaded file is only uncommitted until the model saves it to storage,
+    # so this is the one point where a fresh upload can be told apart.
+    instance._new_image_fields = [
+        field
+        for field in DERIVATIVE_FIELDS[sender._meta.label]
+        if getattr(instance, field) and not getattr(instance, field)._committed
+    ]
+    for field in instance._new_image_fields:
+        reset_image_metadata(instance, field)
+
+    # Remember the files this save stops pointing at, so their blobs can be
+    # released afterwards.
+    instance._replaced_images = []
+    if instance._state.adding:
+        return
+    fields = DERIVATIVE_FIELDS[sender._meta.label]
+    old = (
+        sender.objects.filter(pk=instance.pk)
+        .values(*fields, *(f"{field}_derivatives" for field in fields))
+        .first()
+    )
+    for field in fields:
+        if old and old[field] and old[field] != getattr(instance, field).name:
+            instance._replaced_images.append((old[field], old[f"{field}_derivatives"]))
+
+
+def schedule_image_derivatives(sender, instance, **kwargs) -> None:
+    for field in getattr(instance, "_new_image_fields", []):
+        acquire(getattr(instance, field).name)
+        transaction.on_commit(
+            partial(
+                generate_image_derivatives.delay, sender._meta.label, str(instance.pk), field
+            )
+        )
+    for name, derivatives in getattr(instance, "_replaced_images", []):
+        release(name, derivatives)
+
+
+def release_deleted_images(sender, instance, **kwargs) -> None:
+    for field in DERIVATIVE_FIELDS[sender._meta.label]:
+        release(getattr(instance, field).name, getattr(instance, f"{field}_derivatives"))
+
+
+def index_post_gallery_images(sender, instance, created, update_fields=None, **kwargs) -> None:
+    if update_fields is not None and "content" not in update_fields:
+        return
+    index_gallery_usage([instance], adding=created)
+
+
+def connect_signals() -> None:
+    for label in DERIVATIVE_FIELDS:
+        model = apps.get_model(label)
+        pre_save.connect(track_new_images, sender=model, dispatch_uid=f"track_new_images_{label}")
+        post_save.connect(
+            schedule_image_derivatives,
+            sender=model,
+            dispatch_uid=f"schedule_image_derivatives_{label}",
+        )
+        post_delete.connect(
+            release_deleted_images,
+            sender=model,
+            dispatch_uid=f"release_deleted_images_{label}",
+        )
+    post_save.connect(
+        index_post_gallery_images, sender=Blog, dispatch_uid="index_post_gallery_images"
+    )
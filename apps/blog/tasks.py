@@ -0,0 +1,83 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from celery import Task, shared_task
+from django.apps import apps
+
+from apps.blog.models import Blog
+from apps.blog.utils.bulk import run_bulk_operation_chunked
+from apps.blog.utils.duplication import duplicate_blogs
+from apps.blog.utils.images import DERIVATIVE_FIELDS, process_image
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def duplicate_blogs_task(blog_ids: List[str], duplicates: int) -> int:
+    created = duplicate_blogs(Blog.objects.filter(id__in=blog_ids), duplicates)
+    logger.info(f"Duplicated {len(blog_ids)} blogs into {created} copies")
+    return created
+
+
+@shared_task(bind=True)
+def bulk_operation_task(
+    self: Task, operation: str, post_ids: List[str], params: Dict[str, Any]
+) -> Dict[str, int]:
+    total = len(post_ids)
+
+    def report(processed: int, count: int) -> None:
+        self.update_state(
+            state="PROGRESS",
+            meta={"processed": processed, "total": total, "count": count},
+        )
+
+    count = run_bulk_operation_chunked(operation, post_ids, params, progress=report)
+    logger.info(f"Bulk {operation} affected {count} of {total} posts")
+    return {"processed": total, "total": total, "count": count}
+
+
+_DERIVED_COLUMNS = ("derivatives", "width", "height", "color", "lqip")
+
+
+def _processed_copy(name: str, field_name: str, pk: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the derived columns of another row (not ``pk``) already pointing at
+    the same content-addressed file, renamed for ``field_name``, if one has
+    been processed.
+    """
+    for model_label, fields in DERIVATIVE_FIELDS.items():
+        model = apps.get_model(model_label)
+        for field in fields:
+            row = (
+                model.objects.filter(**{field: name})
+                .exclude(pk=pk)
+                .exclude(**{f"{field}_width__isnull": True})
+                .exclude(**{f"{field}_derivatives": []})
+                .values(*(f"{field}_{suffix}" for suffix in _DERIVED_COLUMNS))
+                .first()
+            )
+            if row:
+                return {
+                    f"{field_name}_{suffix}": row[f"{field}_{suffix}"]
+                    for suffix in _DERIVED_COLUMNS
+                }
+    return None
+
+
+@shared_task
+def generate_image_derivatives(model_label: str, pk: str, field_name: str) -> int:
+    model = apps.get_model(model_label)
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None or not getattr(instance, field_name):
+        return 0
+
+    field_file = getattr(instance, field_name)
+    # Identical uploads share one blob, so their derivatives can be shared too.
+    values = _processed_copy(field_file.name, field_name, pk) or process_image(
+        field_name, field_file
+    )
+    # Only store the result if the image was not replaced in the meantime.
+    model.objects.filter(pk=pk, **{field_name: field_file.name}).update(**values)
+    derivatives = values[f"{field_name}_derivatives"]
+    logger.info(f"Generated {len(derivatives)} derivatives for {model_label} {pk}")
+    return len(derivatives)
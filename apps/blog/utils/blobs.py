@@ -0,0 +1,76 @@
+from typing import Iterable
+
+from django.apps import apps
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from apps.blog.models import MediaBlob
+from apps.blog.utils.images import DERIVATIVE_FIELDS
+from apps.blog.utils.storage import media_storage
+
+
+def count_references(name: str) -> int:
+    """Count the image fields that currently point at ``name``."""
+    return sum(
+        apps.get_model(model_label).objects.filter(**{field: name}).count()
+        for model_label, fields in DERIVATIVE_FIELDS.items()
+        for field in fields
+    )
+
+
+def acquire(name: str, count: int = 1) -> None:
+    """
+    Record ``count`` new references to the blob ``name``. Call after the rows
+    pointing at it have been saved.
+    """
+    if not name:
+        return
+    if MediaBlob.objects.filter(name=name).update(references=F("references") + count):
+        return
+    # First time this blob is counted. Files stored before reference counting
+    # may already be shared, so start from the actual number of users.
+    storage = media_storage()
+    try:
+        with transaction.atomic():
+            MediaBlob.objects.create(
+                name=name,
+                size=storage.size(name) if storage.exists(name) else 0,
+                references=count_references(name),
+            )
+    except IntegrityError:
+        MediaBlob.objects.filter(name=name).update(references=F("references") + count)
+
+
+def release(name: str, derivatives: Iterable[dict] = ()) -> None:
+    """
+    Drop one reference to the blob ``name`` and delete the file and its
+    ``derivatives`` once nothing uses it any more.
+    """
+    if not name:
+        return
+    with transaction.atomic():
+        blob = MediaBlob.objects.select_for_update().filter(name=name).first()
+        if blob is None:
+            # Not tracked: leave untracked files to the media garbage collector.
+            return
+        if blob.references > 1:
+            MediaBlob.objects.filter(pk=blob.pk).update(references=F("references") - 1)
+            return
+        # Recount before deleting so rows copied without going through
+        # acquire() can never lose their file.
+        remaining = count_references(name)
+        if remaining:
+            MediaBlob.objects.filter(pk=blob.pk).update(references=remaining)
+            return
+        blob.delete()
+
+    names = [name, *(item["name"] for item in derivatives)]
+    transaction.on_commit(lambda: _delete_files(names))
+
+
+def _delete_files(names) -> None:
+    storage = media_storage()
+    for name in names:
+        # A new upload of the same content may have re-created the blob since.
+        if not MediaBlob.objects.filter(name=name).exists():
+            storage.delete(name)
@@ -0,0 +1,137 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from django.db import transaction
+
+from apps.blog.models import Blog, Tag
+
+# The auto-created through model behind Blog.tags (blog_id, tag_id).
+BlogTag = Blog.tags.through
+
+BULK_TAG_BATCH_SIZE = 5000
+
+
+def _existing_ids(model, ids: Iterable[UUID]) -> List[UUID]:
+    return list(model.objects.filter(id__in=list(ids)).values_list("id", flat=True))
+
+
+def _insert_tag_links(blog_ids: List[UUID], tag_ids: List[UUID]) -> int:
+    """
+    Insert every missing (blog, tag) pair with a single set-based insert and
+    return the number of rows actually created.
+    """
+    if not blog_ids or not tag_ids:
+        return 0
+
+    existing = set(
+        BlogTag.objects.filter(blog_id__in=blog_ids, tag_id__in=tag_ids).values_list(
+            "blog_id", "tag_id"
+        )
+    )
+    rows = [
+        BlogTag(blog_id=blog_id, tag_id=tag_id)
+        for blog_id in blog_ids
+        for tag_id in tag_ids
+        if (blog_id, tag_id) not in existing
+    ]
+    # ignore_conflicts guards against a concurrent writer adding the same pair
+    # between the lookup above and the insert.
+    BlogTag.objects.bulk_create(rows, ignore_conflicts=True, batch_size=BULK_TAG_BATCH_SIZE)
+    return len(rows)
+
+
+@transaction.atomic
+def bulk_add_tags(post_ids: List[UUID], tag_ids: List[UUID]) -> Tuple[int, int]:
+    """
+    Attach tags to posts. Returns (matched posts, links added).
+    """
+    blog_ids = _existing_ids(Blog, post_ids)
+    valid_tag_ids = _existing_ids(Tag, tag_ids)
+    return len(blog_ids), _insert_tag_links(blog_ids, valid_tag_ids)
+
+
+@transaction.atomic
+def bulk_remove_tags(post_ids: List[UUID], tag_ids: List[UUID]) -> Tuple[int, int]:
+    """
+    Detach tags from posts. Returns (matched posts, links removed).
+    """
+    blog_ids = _existing_ids(Blog, post_ids)
+    removed, _ = BlogTag.objects.filter(blog_id__in=blog_ids, tag_id__in=tag_ids).delete()
+    return len(blog_ids), removed
+
+
+@transaction.atomic
+def bulk_set_tags(post_ids: List[UUID], tag_ids: List[UUID]) -> Tuple[int, int, int]:
+    """
+    Replace the tags of every post with exactly ``tag_ids``.
+    Returns (matched posts, links added, links removed).
+    """
+    blog_ids = _existing_ids(Blog, post_ids)
+    valid_tag_ids = _existing_ids(Tag, tag_ids)
+    removed, _ = (
+        BlogTag.objects.filter(blog_id__in=blog_ids).exclude(tag_id__in=valid_tag_ids).delete()
+    )
+    added = _insert_tag_links(blog_ids, valid_tag_ids)
+    return len(blog_ids), added, removed
+
+
+# ------------------------
+# Chunked bulk operations
+# ------------------------
+
+# Selections larger than this are handed to a Celery worker and processed in
+# chunks of BULK_CHUNK_SIZE posts, each in its own short transaction.
+BULK_ASYNC_THRESHOLD = 1000
+BULK_CHUNK_SIZE = 500
+
+
+def _posts(post_ids: List[UUID]):
+    return Blog.objects.filter(id__in=post_ids)
+
+
+def _delete_posts(post_ids: List[UUID]) -> int:
+    _, deleted = _posts(post_ids).delete()
+    return deleted.get(Blog._meta.label, 0)
+
+
+# Each operation applies one bulk change to a list of post ids and returns the
+# number of posts affected.
+BULK_OPERATIONS: Dict[str, Callable[..., int]] = {
+    "delete": _delete_posts,
+    "publish": lambda post_ids: _posts(post_ids).update(published=True),
+    "draft": lambda post_ids: _posts(post_ids).update(published=False),
+    "cornerstone": lambda post_ids: _posts(post_ids).update(cornerstone_content=True),
+    "not-cornerstone": lambda post_ids: _posts(post_ids).update(cornerstone_content=False),
+    "add-category": lambda post_ids, category_id: _posts(post_ids).update(
+        category_id=category_id
+    ),
+    "remove-category": lambda post_ids, category_id: _posts(post_ids)
+    .filter(category_id=category_id)
+    .update(category=None),
+    "add-tag": lambda post_ids, tag_ids: bulk_add_tags(post_ids, tag_ids)[0],
+    "remove-tag": lambda post_ids, tag_ids: bulk_remove_tags(post_ids, tag_ids)[0],
+    "set-tags": lambda post_ids, tag_ids: bulk_set_tags(post_ids, tag_ids)[0],
+}
+
+
+def run_bulk_operation_chunked(
+    operation: str,
+    post_ids: List[UUID],
+    params: Dict[str, Any],
+    chunk_size: int = BULK_CHUNK_SIZE,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Apply ``operation`` to ``post_ids`` one chunk at a time so that no single
+    transaction holds locks on the whole selection. ``progress`` is called
+    after every chunk with (posts processed, posts affected so far).
+    """
+    func = BULK_OPERATIONS[operation]
+    count = 0
+    for start in range(0, len(post_ids), chunk_size):
+        chunk = post_ids[start : start + chunk_size]
+        with transaction.atomic():
+            count += func(chunk, **params)
+        if progress:
+            progress(start + len(chunk), count)
+    return count
@@ -0,0 +1,92 @@
+import uuid
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set
+
+from django.db import transaction
+from django.db.models import Q
+
+from apps.blog.models import Blog
+from apps.blog.utils.blobs import acquire
+from apps.blog.utils.bulk import BULK_TAG_BATCH_SIZE, BlogTag
+from apps.blog.utils.usage import BlogGalleryImage
+
+# Selections producing more copies than this are duplicated on a Celery worker.
+DUPLICATE_ASYNC_THRESHOLD = 100
+
+
+def _next_free(base: str, separator: str, taken: Set[str], start: Dict[str, int]) -> str:
+    """
+    Return the first ``{base}{separator}{n}`` not in ``taken``, remembering
+    where the search stopped so repeated calls for the same base stay linear.
+    """
+    counter = start.get(base, 1)
+    candidate = f"{base}{separator}{counter}"
+    while candidate in taken:
+        counter += 1
+        candidate = f"{base}{separator}{counter}"
+    start[base] = counter + 1
+    taken.add(candidate)
+    return candidate
+
+
+@transaction.atomic
+def duplicate_blogs(blogs: Iterable[Blog], duplicates: int) -> int:
+    """
+    Create ``duplicates`` copies of every blog, tags included.
+
+    Slugs get a ``-{n}`` suffix and titles a `` {n}`` suffix, using the lowest
+    free counter as the admin action always has. All slugs and titles that
+    could collide are fetched in one query, the copies are written with a
+    single ``bulk_create`` and their tag and gallery image links with one more
+    each. Returns the number of copies created.
+    """
+    originals = list(blogs)
+    if not originals or duplicates < 1:
+        return 0
+
+    prefixes = Q()
+    for blog in originals:
+        prefixes |= Q(slug__startswith=blog.slug) | Q(title__startswith=blog.title)
+    taken_slugs: Set[str] = set()
+    taken_titles: Set[str] = set()
+    for slug, title in Blog.objects.filter(prefixes).values_list("slug", "title"):
+        taken_slugs.add(slug)
+        taken_titles.add(title)
+
+    tag_ids: Dict[uuid.UUID, List[uuid.UUID]] = defaultdict(list)
+    for blog_id, tag_id in BlogTag.objects.filter(
+        blog_id__in=[blog.pk for blog in originals]
+    ).values_list("blog_id", "tag_id"):
+        tag_ids[blog_id].append(tag_id)
+    image_ids: Dict[uuid.UUID, List[uuid.UUID]] = defaultdict(list)
+    for blog_id, image_id in BlogGalleryImage.objects.filter(
+        blog_id__in=[blog.pk for blog in originals]
+    ).values_list("blog_id", "galleryimage_id"):
+        image_ids[blog_id].append(image_id)
+
+    copyable = [f for f in Blog._meta.concrete_fields if not f.primary_key]
+    slug_counters: Dict[str, int] = {}
+    title_counters: Dict[str, int] = {}
+    copies: List[Blog] = []
+    links: List[BlogTag] = []
+    image_links: List[BlogGalleryImage] = []
+    for blog in originals:
+        for _ in range(duplicates):
+            copy = Blog(**{f.attname: getattr(blog, f.attname) for f in copyable})
+            copy.id = uuid.uuid4()
+            copy.slug = _next_free(blog.slug, "-", taken_slugs, slug_counters)
+            copy.title = _next_free(blog.title, " ", taken_titles, title_counters)
+            copies.append(copy)
+            links.extend(BlogTag(blog_id=copy.id, tag_id=tag_id) for tag_id in tag_ids[blog.pk])
+            image_links.extend(
+                BlogGalleryImage(blog_id=copy.id, galleryimage_id=image_id)
+                for image_id in image_ids[blog.pk]
+            )
+
+    Blog.objects.bulk_create(copies)
+    BlogTag.objects.bulk_create(links, batch_size=BULK_TAG_BATCH_SIZE)
+    BlogGalleryImage.objects.bulk_create(image_links, batch_size=BULK_TAG_BATCH_SIZE)
+    # The copies share the originals' featured image files.
+    for blog in originals:
+        acquire(blog.featured_image.name, duplicates)
+    return len(copies)
@@ -0,0 +1,127 @@
+import csv
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from apps.blog.models import Blog
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_BUFFER_SIZE = 64 * 1024
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# Column order for CSV; the keys match BlogImportRecord so an NDJSON export can
+# be fed straight back into the importer.
+EXPORT_FIELDS = [
+    "title",
+    "slug",
+    "excerpt",
+    "content",
+    "category",
+    "tags",
+    "author_email",
+    "published",
+    "keyphrase",
+    "cornerstone_content",
+    "seo_score",
+    "seo_analysis",
+    "readability_score",
+    "readability_analysis",
+    "created_at",
+    "updated_at",
+]
+
+
+def export_records() -> Iterator[Dict[str, Any]]:
+    """
+    Yield every post as a flat dict. Rows come from a server-side cursor in
+    chunks of ``EXPORT_CHUNK_SIZE``; tags are prefetched per chunk.
+    """
+    qs = (
+        Blog.objects.select_related("category", "author__user")
+        .prefetch_related("tags")
+        .order_by("created_at", "id")
+    )
+    for blog in qs.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield {
+            "title": blog.title,
+            "slug": blog.slug,
+            "excerpt": blog.excerpt,
+            "content": blog.content,
+            "category": blog.category.name if blog.category else None,
+            "tags": [tag.name for tag in blog.tags.all()],
+            "author_email": blog.author.user.email if blog.author else None,
+            "published": blog.published,
+            "keyphrase": blog.keyphrase,
+            "cornerstone_content": blog.cornerstone_content,
+            "seo_score": blog.seo_score,
+            "seo_analysis": blog.seo_analysis,
+            "readability_score": blog.readability_score,
+            "readability_analysis": blog.readability_analysis,
+            "created_at": blog.created_at,
+            "updated_at": blog.updated_at,
+        }
+
+
+def render_ndjson(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    for record in records:
+        yield json.dumps(record, cls=DjangoJSONEncoder) + "\n"
+
+
+class _Echo:
+    """File-like object whose write() hands the formatted row straight back."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def render_csv(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for record in records:
+        row = []
+        for field in EXPORT_FIELDS:
+            value = record[field]
+            if isinstance(value, (list, dict)):
+                value = json.dumps(value, cls=DjangoJSONEncoder)
+            elif hasattr(value, "isoformat"):
+                value = value.isoformat()
+            row.append(value)
+        yield writer.writerow(row)
+
+
+def _buffered(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Coalesce small rows into ~``EXPORT_BUFFER_SIZE`` byte chunks."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk.encode("utf-8")
+        if len(buffer) >= EXPORT_BUFFER_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _gzipped(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream_export(export_format: str = "ndjson", compress: bool = False) -> Iterator[bytes]:
+    """
+    Stream all posts in ``export_format`` ("ndjson" or "csv"), optionally
+    gzip-compressed on the fly. Memory use is independent of table size.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+    render = render_csv if export_format == "csv" else render_ndjson
+    chunks = _buffered(render(export_records()))
+    return _gzipped(chunks) if compress else chunks
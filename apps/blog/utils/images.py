@@ -0,0 +1,189 @@
+import base64
+import io
+import posixpath
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db.models.fields.files import FieldFile
+from PIL import ExifTags, Image, ImageOps
+
+# Image fields that get responsive derivatives and placeholders, keyed by model
+# label. For each field the model has ``<field>_derivatives`` (JSON list),
+# ``<field>_width``/``<field>_height``, ``<field>_color`` and ``<field>_lqip``.
+DERIVATIVE_FIELDS = {
+    "blog.Blog": ["featured_image"],
+    "blog.GalleryImage": ["image"],
+    "blog.Author": ["avatar"],
+}
+
+_PIL_FORMATS = {"webp": "WEBP", "jpeg": "JPEG"}
+_EXTENSIONS = {"webp": "webp", "jpeg": "jpg"}
+
+
+def derivative_name(source: str, width: int, image_format: str) -> str:
+    """``gallery/photo.png`` -> ``gallery/derivatives/photo-640w.webp``"""
+    directory, filename = posixpath.split(source)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(
+        directory, "derivatives", f"{stem}-{width}w.{_EXTENSIONS[image_format]}"
+    )
+
+
+def _encode(image: Image.Image, image_format: str) -> bytes:
+    if image_format == "jpeg" and image.mode != "RGB":
+        # JPEG has no alpha channel; flatten transparency onto white.
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        rgba = image.convert("RGBA")
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        image = background
+    elif image_format == "webp" and image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA")
+
+    buffer = io.BytesIO()
+    image.save(
+        buffer,
+        _PIL_FORMATS[image_format],
+        quality=settings.IMAGE_DERIVATIVE_QUALITY,
+        optimize=True,
+    )
+    return buffer.getvalue()
+
+
+def open_image(field_file: FieldFile) -> Image.Image:
+    with field_file.open("rb") as source:
+        image = ImageOps.exif_transpose(Image.open(source))
+        image.load()
+    return image
+
+
+def image_dimensions(field_file: FieldFile) -> Tuple[int, int]:
+    """
+    Width and height as displayed, i.e. after the EXIF orientation that
+    ``open_image`` applies, read from the file header alone.
+    """
+    close = field_file.closed
+    field_file.open("rb")
+    try:
+        field_file.seek(0)
+        with Image.open(field_file) as image:
+            width, height = image.size
+            orientation = image.getexif().get(ExifTags.Base.Orientation)
+    finally:
+        if close:
+            field_file.close()
+        else:
+            field_file.seek(0)
+    if orientation in (5, 6, 7, 8):
+        # Stored a quarter turn from how it is shown (rotated phone photos).
+        width, height = height, width
+    return width, height
+
+
+def build_derivatives(field_file: FieldFile, original: Image.Image) -> List[Dict[str, Any]]:
+    """
+    Resize ``original`` to every configured width narrower than it (plus its
+    own width) in every configured format, store the results next to
+    ``field_file`` and return their metadata.
+    """
+    widths = sorted({w for w in settings.IMAGE_DERIVATIVE_WIDTHS if w < original.width})
+    widths.append(original.width)
+
+    storage = field_file.storage
+    derivatives = []
+    for width in widths:
+        height = max(1, round(original.height * width / original.width))
+        resized = original if width == original.width else original.resize(
+            (width, height), Image.Resampling.LANCZOS
+        )
+        for image_format in settings.IMAGE_DERIVATIVE_FORMATS:
+            data = _encode(resized, image_format)
+            name = storage.save(
+                derivative_name(field_file.name, width, image_format), ContentFile(data)
+            )
+            derivatives.append(
+                {
+                    "name": name,
+                    "width": width,
+                    "height": height,
+                    "format": image_format,
+                    "size": len(data),
+                }
+            )
+    return derivatives
+
+
+def build_placeholder(original: Image.Image) -> Tuple[str, str]:
+    """
+    Return the dominant colour as ``#rrggbb`` and a tiny blurred-up preview as
+    a base64 ``data:`` URI, both small enough to inline in list responses.
+    """
+    rgb = original.convert("RGB")
+
+    sample = rgb.copy()
+    sample.thumbnail((64, 64))
+    palette_image = sample.quantize(colors=5)
+    _, index = max(palette_image.getcolors())
+    palette = palette_image.getpalette()
+    color = "#{:02x}{:02x}{:02x}".format(*palette[index * 3 : index * 3 + 3])
+
+    width = settings.IMAGE_PLACEHOLDER_WIDTH
+    height = max(1, round(rgb.height * width / rgb.width))
+    buffer = io.BytesIO()
+    rgb.resize((width, height), Image.Resampling.BOX).save(buffer, "WEBP", quality=40)
+    lqip = "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+    return color, lqip
+
+
+def process_image(field_name: str, field_file: FieldFile) -> Dict[str, Any]:
+    """
+    Decode the image once and return every derived column for ``field_name``.
+    """
+    original = open_image(field_file)
+    color, lqip = build_placeholder(original)
+    return {
+        f"{field_name}_derivatives": build_derivatives(field_file, original),
+        f"{field_name}_width": original.width,
+        f"{field_name}_height": original.height,
+        f"{field_name}_color": color,
+        f"{field_name}_lqip": lqip,
+    }
+
+
+def reset_image_metadata(instance, field_name: str) -> None:
+    """
+    Prepare a freshly uploaded image for saving: read its dimensions from the
+    file header, oriented as ``process_image`` will store them, and clear what
+    was derived from the previous image until the background task has
+    regenerated it.
+    """
+    width, height = image_dimensions(getattr(instance, field_name))
+    setattr(instance, f"{field_name}_width", width)
+    setattr(instance, f"{field_name}_height", height)
+    setattr(instance, f"{field_name}_color", "")
+    setattr(instance, f"{field_name}_lqip", "")
+    setattr(instance, f"{field_name}_derivatives", [])
+
+
+def serialize_image_metadata(instance, field_name: str) -> Optional[dict]:
+    if not getattr(instance, f"{field_name}_width"):
+        return None
+    return {
+        "width": getattr(instance, f"{field_name}_width"),
+        "height": getattr(instance, f"{field_name}_height"),
+        "color": getattr(instance, f"{field_name}_color") or None,
+        "lqip": getattr(instance, f"{field_name}_lqip") or None,
+    }
+
+
+def serialize_srcset(request, derivatives: List[Dict[str, Any]], storage) -> List[dict]:
+    return [
+        {
+            "url": request.build_absolute_uri(storage.url(item["name"])),
+            "width": item["width"],
+            "height": item["height"],
+            "format": item["format"],
+            "size": item["size"],
+        }
+        for item in derivatives or []
+    ]
@@ -0,0 +1,209 @@
+import io
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, Union
+from uuid import UUID
+
+from django.db import connection, models, transaction
+from django.db.models.fields import AutoFieldMixin
+from django.utils.text import slugify
+from pydantic import ValidationError
+
+from apps.blog.models import Author, Blog, Category, Tag
+from apps.blog.schemas.bulk import BlogImportRecord
+from apps.blog.utils.bulk import BlogTag
+from apps.blog.utils.taxonomy import get_or_create_by_slug, slugify_name
+from apps.blog.utils.usage import index_gallery_usage
+from authentication.models import UserManager
+
+IMPORT_BATCH_SIZE = 2000
+MAX_REPORTED_ERRORS = 100
+
+
+def _copy_value(field: models.Field, obj: models.Model) -> str:
+    """
+    Render a single field as a PostgreSQL CSV ``COPY`` value. Unquoted empty
+    means NULL, so every non-NULL value is quoted.
+    """
+    value = field.pre_save(obj, add=True)
+    if isinstance(field, models.JSONField):
+        value = None if value is None else json.dumps(value, cls=field.encoder)
+    else:
+        value = field.get_prep_value(value)
+
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        value = "t" if value else "f"
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def copy_insert(model: Type[models.Model], objs: List[models.Model]) -> None:
+    """
+    Insert ``objs`` with a single ``COPY ... FROM STDIN``. Database-generated
+    primary keys are left to their sequence.
+    """
+    fields = [f for f in model._meta.concrete_fields if not isinstance(f, AutoFieldMixin)]
+    columns = ", ".join(connection.ops.quote_name(f.column) for f in fields)
+    sql = (
+        f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) "
+        "FROM STDIN WITH (FORMAT csv)"
+    )
+
+    buffer = io.StringIO()
+    for obj in objs:
+        buffer.write(",".join(_copy_value(f, obj) for f in fields))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    with connection.cursor() as cursor:
+        cursor.copy_expert(sql, buffer)
+
+
+def insert_rows(model: Type[models.Model], objs: List[models.Model]) -> None:
+    if not objs:
+        return
+    if connection.vendor == "postgresql":
+        copy_insert(model, objs)
+    else:
+        model.objects.bulk_create(objs, batch_size=IMPORT_BATCH_SIZE)
+
+
+class PostImporter:
+    """
+    Streams NDJSON post records into the database.
+
+    Records are validated one line at a time and written in batches, each in its
+    own transaction: categories and tags are resolved with a batched
+    get-or-create, then posts and their tag links are inserted in bulk (``COPY``
+    on PostgreSQL) and the gallery images they embed are indexed. Posts whose
+    slug already exists are skipped, and authors are matched by email, left
+    empty when no author profile matches. Only the current batch and the
+    taxonomy/author lookup caches are held in memory.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        progress: Optional[Callable[["PostImporter"], None]] = None,
+    ) -> None:
+        self.batch_size = batch_size
+        self.progress = progress
+        self.created = 0
+        self.skipped = 0
+        self.failed = 0
+        self.errors: List[str] = []
+        self._categories: Dict[str, UUID] = {}
+        self._tags: Dict[str, UUID] = {}
+        self._authors: Dict[str, Optional[UUID]] = {}
+
+    def run(self, lines: Iterable[Union[str, bytes]]) -> Dict[str, Any]:
+        batch: List[BlogImportRecord] = []
+        for line_no, line in enumerate(lines, start=1):
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                batch.append(BlogImportRecord.model_validate_json(line))
+            except ValidationError as exc:
+                self._fail(line_no, exc)
+                continue
+
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+
+        if batch:
+            self._flush(batch)
+        return self.result()
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            "created": self.created,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "errors": self.errors,
+        }
+
+    def _fail(self, line_no: int, exc: ValidationError) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            messages = "; ".join(error["msg"] for error in exc.errors())
+            self.errors.append(f"Line {line_no}: {messages}")
+
+    def _resolve(self, model, cache: Dict[str, UUID], names: Iterable[str]) -> None:
+        missing = {name for name in names if slugify_name(model, name) not in cache}
+        if missing:
+            cache.update(get_or_create_by_slug(model, missing))
+
+    def _resolve_authors(self, emails: Iterable[str]) -> None:
+        missing = {email for email in emails if email not in self._authors}
+        if not missing:
+            return
+        found = dict(
+            Author.objects.filter(user__email__in=missing).values_list("user__email", "id")
+        )
+        for email in missing:
+            self._authors[email] = found.get(email)
+
+    def _flush(self, batch: List[BlogImportRecord]) -> None:
+        for record in batch:
+            if record.author_email:
+                record.author_email = UserManager.normalize_email(record.author_email)
+            # A supplied slug is cleaned like a derived one, so it is URL-safe.
+            record.slug = slugify(record.slug or record.title)[:100]
+
+        with transaction.atomic():
+            self._resolve(Category, self._categories, (r.category for r in batch if r.category))
+            self._resolve(Tag, self._tags, (name for r in batch for name in r.tags))
+            self._resolve_authors(r.author_email for r in batch if r.author_email)
+
+            taken = set(
+                Blog.objects.filter(slug__in=[r.slug for r in batch]).values_list(
+                    "slug", flat=True
+                )
+            )
+            blogs: List[Blog] = []
+            links: List[models.Model] = []
+            for record in batch:
+                if not record.slug or record.slug in taken:
+                    self.skipped += 1
+                    continue
+                taken.add(record.slug)
+
+                blog = Blog(
+                    title=record.title,
+                    slug=record.slug,
+                    excerpt=record.excerpt,
+                    content=record.content,
+                    category_id=(
+                        self._categories.get(slugify_name(Category, record.category))
+                        if record.category
+                        else None
+                    ),
+                    author_id=self._authors.get(record.author_email or ""),
+                    published=record.published,
+                    keyphrase=record.keyphrase,
+                    cornerstone_content=record.cornerstone_content,
+                    seo_score=record.seo_score,
+                    seo_analysis=record.seo_analysis,
+                    readability_score=record.readability_score,
+                    readability_analysis=record.readability_analysis,
+                )
+                blogs.append(blog)
+                tag_ids = {self._tags.get(slugify_name(Tag, name)) for name in record.tags}
+                links.extend(
+                    BlogTag(blog_id=blog.id, tag_id=tag_id) for tag_id in tag_ids if tag_id
+                )
+
+            insert_rows(Blog, blogs)
+            insert_rows(BlogTag, links)
+            index_gallery_usage(blogs, adding=True)
+
+        self.created += len(blogs)
+        if self.progress:
+            self.progress(self)
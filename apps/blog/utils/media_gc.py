@@ -0,0 +1,130 @@
+import heapq
+import os
+from typing import Iterator, List, Optional, Tuple
+
+from django.apps import apps
+from django.db import connection
+from django.db.models import F, FileField
+from django.db.models.functions import Collate
+
+from apps.blog.models import ChunkedUpload
+from apps.blog.utils.images import DERIVATIVE_FIELDS
+
+GC_FETCH_SIZE = 5000
+
+# Collations that compare strings by code point, matching Python's ordering,
+# so the sorted database streams can be merged with the sorted directory walk.
+_BINARY_COLLATIONS = {"postgresql": "C", "sqlite": "BINARY"}
+
+# Unnest a JSON array column into one row per element, optionally taking one
+# key of each element.
+_JSON_ELEMENTS_SQL = {
+    "postgresql": (
+        'SELECT ({value}) COLLATE "C" AS name FROM {table} '
+        "CROSS JOIN LATERAL jsonb_array_elements({table}.{column}) AS element "
+        "ORDER BY name"
+    ),
+    "sqlite": (
+        "SELECT ({value}) COLLATE BINARY AS name "
+        "FROM {table}, json_each({table}.{column}) AS element "
+        "ORDER BY name"
+    ),
+}
+_JSON_VALUE_SQL = {
+    "postgresql": ("element #>> '{}'", "element ->> '{key}'"),
+    "sqlite": ("element.value", "json_extract(element.value, '$.{key}')"),
+}
+
+# Database vendors every query above is written for.
+SUPPORTED_VENDORS = frozenset(_JSON_ELEMENTS_SQL)
+
+
+def walk_media(root: str, skip: Optional[str] = None, prune: bool = False, rel: str = ""):
+    """
+    Yield ``(relative path, size, mtime)`` for every file under ``root`` in
+    code point order of the full relative path, holding one directory listing
+    per level at a time. With ``prune``, directories left empty once their
+    files have been consumed are removed.
+    """
+    directory = os.path.join(root, rel)
+    with os.scandir(directory) as it:
+        # Sorting directories as "name/" keeps the order of full paths.
+        entries = sorted(
+            it, key=lambda e: e.name + "/" if e.is_dir(follow_symlinks=False) else e.name
+        )
+    for entry in entries:
+        path = rel + entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if skip and os.path.abspath(entry.path) == skip:
+                continue
+            yield from walk_media(root, skip, prune, path + "/")
+            if prune:
+                try:
+                    os.rmdir(entry.path)
+                except OSError:
+                    pass
+        else:
+            stat = entry.stat(follow_symlinks=False)
+            yield path, stat.st_size, stat.st_mtime
+
+
+def _file_field_names(model, field: str) -> Iterator[str]:
+    collation = _BINARY_COLLATIONS[connection.vendor]
+    return (
+        model._default_manager.exclude(**{field: ""})
+        .exclude(**{f"{field}__isnull": True})
+        .order_by(Collate(F(field), collation))
+        .values_list(field, flat=True)
+        .iterator(chunk_size=GC_FETCH_SIZE)
+    )
+
+
+def _json_array_names(model, column: str, key: Optional[str] = None) -> Iterator[str]:
+    plain, keyed = _JSON_VALUE_SQL[connection.vendor]
+    sql = _JSON_ELEMENTS_SQL[connection.vendor].format(
+        value=keyed.format(key=key) if key else plain,
+        table=connection.ops.quote_name(model._meta.db_table),
+        column=connection.ops.quote_name(column),
+    )
+    # chunked_cursor() is a server-side cursor where the backend has one.
+    with connection.chunked_cursor() as cursor:
+        cursor.execute(sql)
+        while rows := cursor.fetchmany(GC_FETCH_SIZE):
+            for (name,) in rows:
+                if name:
+                    yield name
+
+
+def referenced_names() -> Iterator[str]:
+    """
+    Yield every media path the database refers to, in code point order
+    (duplicates included): all FileField/ImageField values, the image
+    derivatives and the parts of unfinished chunked uploads. The database must
+    be one of ``SUPPORTED_VENDORS``.
+    """
+    streams: List[Iterator[str]] = []
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if isinstance(field, FileField):
+                streams.append(_file_field_names(model, field.name))
+    for model_label, fields in DERIVATIVE_FIELDS.items():
+        model = apps.get_model(model_label)
+        for field in fields:
+            streams.append(_json_array_names(model, f"{field}_derivatives", key="name"))
+    streams.append(_json_array_names(ChunkedUpload, "parts"))
+    return heapq.merge(*streams)
+
+
+def find_orphans(
+    files: Iterator[Tuple[str, int, float]], referenced: Iterator[str]
+) -> Iterator[Tuple[str, int, float]]:
+    """
+    Merge two sorted streams and yield the files no reference points at.
+    Memory use is constant: both sides are consumed in order.
+    """
+    current = next(referenced, None)
+    for path, size, mtime in files:
+        while current is not None and current < path:
+            current = next(referenced, None)
+        if current != path:
+            yield path, size, mtime
@@ -0,0 +1,117 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import CharField, Value
+from django.http import Http404
+from ninja.errors import HttpError
+
+from apps.blog.models import Author, Blog, Category, Tag
+from apps.blog.utils.bulk import BlogTag
+
+
+def _tagged(qs, kind: str):
+    return (
+        qs.order_by()
+        .annotate(kind=Value(kind, output_field=CharField()))
+        .values_list("kind", "id")
+    )
+
+
+def resolve_relations(
+    category_id: Optional[UUID] = None,
+    author_id: Optional[UUID] = None,
+    author_user_id: Optional[UUID] = None,
+    tag_ids: Optional[List[UUID]] = None,
+    slug: Optional[str] = None,
+    exclude_post_id: Optional[UUID] = None,
+) -> Dict[str, Set[UUID]]:
+    """
+    Look up everything a post write references in a single ``UNION ALL``
+    round trip. Returns the ids found, keyed by "category", "author", "tag"
+    and "slug" (posts other than ``exclude_post_id`` already using ``slug``).
+    """
+    queries = []
+    if category_id is not None:
+        queries.append(_tagged(Category.objects.filter(id=category_id), "category"))
+    if author_id is not None:
+        queries.append(_tagged(Author.objects.filter(id=author_id), "author"))
+    elif author_user_id is not None:
+        queries.append(_tagged(Author.objects.filter(user_id=author_user_id), "author"))
+    if tag_ids:
+        queries.append(_tagged(Tag.objects.filter(id__in=tag_ids), "tag"))
+    if slug:
+        queries.append(_tagged(Blog.objects.filter(slug=slug).exclude(id=exclude_post_id), "slug"))
+
+    found: Dict[str, Set[UUID]] = defaultdict(set)
+    if queries:
+        for kind, pk in queries[0].union(*queries[1:], all=True):
+            found[kind].add(pk)
+    return found
+
+
+def sync_tags(blog: Blog, tag_ids: List[UUID], adding: bool = False) -> None:
+    """
+    Bring the post's tag links in line with ``tag_ids`` by inserting and
+    deleting only the difference.
+    """
+    current: Set[UUID] = set()
+    if not adding:
+        current = set(BlogTag.objects.filter(blog_id=blog.pk).values_list("tag_id", flat=True))
+    wanted = set(tag_ids)
+
+    if current - wanted:
+        BlogTag.objects.filter(blog_id=blog.pk, tag_id__in=current - wanted).delete()
+    if wanted - current:
+        BlogTag.objects.bulk_create(
+            [BlogTag(blog_id=blog.pk, tag_id=tag_id) for tag_id in wanted - current],
+            ignore_conflicts=True,
+        )
+
+
+@transaction.atomic
+def save_post(
+    blog: Blog,
+    values: Dict[str, Any],
+    tag_ids: Optional[List[UUID]] = None,
+    author_user_id: Optional[UUID] = None,
+) -> Blog:
+    """
+    Create or update a post in one transaction.
+
+    ``values`` maps Blog attribute names (``category_id``, ``author_id``, ...)
+    to their new values; only those columns are written, with a single INSERT
+    or UPDATE. ``tag_ids`` replaces the post's tags when given, unknown ids are
+    ignored. ``author_user_id`` sets the author to that user's profile, if any.
+    Referenced rows and the slug are validated in one query beforehand.
+    """
+    adding = blog._state.adding
+    found = resolve_relations(
+        category_id=values.get("category_id"),
+        author_id=values.get("author_id"),
+        author_user_id=author_user_id,
+        tag_ids=tag_ids,
+        slug=values.get("slug"),
+        exclude_post_id=None if adding else blog.pk,
+    )
+
+    if found["slug"]:
+        raise HttpError(400, "A blog with this slug already exists.")
+    if values.get("category_id") is not None and not found["category"]:
+        raise Http404("No Category matches the given query.")
+    if values.get("author_id") is not None and not found["author"]:
+        raise Http404("No Author matches the given query.")
+    if author_user_id is not None:
+        values["author_id"] = next(iter(found["author"]), None)
+
+    for attname, value in values.items():
+        setattr(blog, attname, value)
+    if adding:
+        blog.save(force_insert=True)
+    else:
+        blog.save(update_fields=[*values, "updated_at"])
+
+    if tag_ids is not None:
+        sync_tags(blog, [tag_id for tag_id in tag_ids if tag_id in found["tag"]], adding)
+    return blog
@@ -0,0 +1,51 @@
+import hashlib
+import posixpath
+
+from django.core.files.storage import FileSystemStorage, storages
+from django.utils.deconstruct import deconstructible
+
+CONTENT_ADDRESSED_PREFIX = "cas"
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage that names every upload after the SHA-256 of its bytes,
+    e.g. ``gallery/photo.png`` is stored as ``cas/3f/a2/3fa2....png``. The same
+    image uploaded twice, to the gallery or as a featured image, is written
+    once and both rows point at the same blob.
+
+    Names already inside the content-addressed tree (such as the derivatives
+    generated next to a blob) are written as given, overwriting any previous
+    version.
+    """
+
+    def __init__(self, prefix: str = CONTENT_ADDRESSED_PREFIX, **kwargs):
+        kwargs.setdefault("allow_overwrite", True)
+        super().__init__(**kwargs)
+        self.prefix = prefix
+
+    def is_content_addressed(self, name: str) -> bool:
+        return name.startswith(f"{self.prefix}/")
+
+    def content_name(self, name: str, digest: str) -> str:
+        extension = posixpath.splitext(name)[1].lower()
+        return posixpath.join(self.prefix, digest[:2], digest[2:4], f"{digest}{extension}")
+
+    def _save(self, name, content):
+        if self.is_content_addressed(name):
+            return super()._save(name, content)
+
+        sha256 = hashlib.sha256()
+        for chunk in content.chunks():
+            sha256.update(chunk)
+        name = self.content_name(name, sha256.hexdigest())
+        if self.exists(name):
+            # Already stored: the bytes are identical by construction.
+            return name
+        return super()._save(name, content)
+
+
+def media_storage():
+    """Storage for uploaded images, configured as ``STORAGES["media"]``."""
+    return storages["media"]
@@ -0,0 +1,42 @@
+from typing import Dict, Iterable, Type, Union
+from uuid import UUID
+
+from django.utils.text import slugify
+
+from apps.blog.models import Category, Tag
+
+
+def slugify_name(model: Type[Union[Category, Tag]], name: str) -> str:
+    """
+    Build the slug ``model.save()`` would derive for ``name``, clipped to the
+    column length so it can be written without going through ``save()``.
+    """
+    max_length = model._meta.get_field("slug").max_length
+    return slugify(name)[:max_length]
+
+
+def get_or_create_by_slug(
+    model: Type[Union[Category, Tag]], names: Iterable[str]
+) -> Dict[str, UUID]:
+    """
+    Batched get-or-create for categories and tags.
+
+    Every name is slugified in Python, missing rows are inserted with a single
+    ``bulk_create(ignore_conflicts=True)`` on the unique slug and the ids are
+    read back with one query. Returns a ``slug -> id`` mapping.
+    """
+    name_max_length = model._meta.get_field("name").max_length
+    wanted: Dict[str, str] = {}
+    for name in names:
+        name = name.strip()
+        slug = slugify_name(model, name)
+        if slug:
+            wanted.setdefault(slug, name[:name_max_length])
+    if not wanted:
+        return {}
+
+    model.objects.bulk_create(
+        [model(name=name, slug=slug) for slug, name in wanted.items()],
+        ignore_conflicts=True,
+    )
+    return dict(model.objects.filter(slug__in=list(wanted)).values_list("slug", "id"))
@@ -0,0 +1,118 @@
+import hashlib
+import posixpath
+import tempfile
+from typing import BinaryIO
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.http import UnreadablePostError
+
+from apps.blog.models import ChunkedUpload
+
+UPLOAD_PARTS_DIR = "uploads/partial"
+# Bytes read from the request or a stored part at a time.
+UPLOAD_READ_SIZE = 64 * 1024
+# Assembled files larger than this spill from memory to a temporary file.
+UPLOAD_SPOOL_SIZE = 4 * 1024 * 1024
+
+
+class UploadConflict(Exception):
+    """The chunk does not start at the upload's current offset."""
+
+
+class UploadIncomplete(Exception):
+    """The request ended before the announced chunk length arrived."""
+
+
+class UploadChecksumMismatch(Exception):
+    """The assembled file does not match the checksum announced at init."""
+
+
+class _LimitedReader:
+    """
+    Read at most ``length`` bytes from ``stream``, counting what was read. A
+    stream that breaks off ends the read early instead of raising, so that
+    storage finishes the file and the caller can delete it.
+    """
+
+    def __init__(self, stream: BinaryIO, length: int):
+        self.stream = stream
+        self.remaining = length
+        self.read_bytes = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        try:
+            data = self.stream.read(size) if size else b""
+        except (UnreadablePostError, OSError):
+            data = b""
+        if size and not data:
+            # Dropped connection: nothing more will arrive.
+            self.remaining = 0
+        self.remaining -= len(data)
+        self.read_bytes += len(data)
+        return data
+
+
+def write_chunk(upload: ChunkedUpload, offset: int, stream: BinaryIO, length: int) -> int:
+    """
+    Stream ``length`` bytes from ``stream`` into a new part starting at
+    ``offset`` and return the upload's new offset. A short read (dropped
+    connection) stores nothing: the part is deleted and the client resends
+    the chunk from the unchanged offset.
+    """
+    if offset != upload.received:
+        raise UploadConflict(f"Expected offset {upload.received}, got {offset}.")
+
+    reader = _LimitedReader(stream, length)
+    name = default_storage.save(
+        posixpath.join(UPLOAD_PARTS_DIR, str(upload.id), f"{offset:012d}"),
+        File(reader),
+    )
+    if reader.read_bytes < length:
+        default_storage.delete(name)
+        raise UploadIncomplete(f"Received {reader.read_bytes} of {length} bytes.")
+
+    with transaction.atomic():
+        locked = ChunkedUpload.objects.select_for_update().get(pk=upload.pk)
+        if locked.received != offset:
+            # Another request wrote this range first.
+            default_storage.delete(name)
+            raise UploadConflict(f"Expected offset {locked.received}, got {offset}.")
+        locked.parts.append(name)
+        locked.received += reader.read_bytes
+        locked.save(update_fields=["parts", "received", "updated_at"])
+
+    upload.parts, upload.received = locked.parts, locked.received
+    return upload.received
+
+
+def assemble(upload: ChunkedUpload) -> File:
+    """
+    Join the parts into a single file, hashing them on the way, and return it
+    ready to be assigned to a FileField. Memory use is bounded by
+    UPLOAD_SPOOL_SIZE; larger files are spooled to disk.
+    """
+    digest = hashlib.sha256()
+    spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE)
+    for name in upload.parts:
+        with default_storage.open(name, "rb") as part:
+            for data in iter(lambda: part.read(UPLOAD_READ_SIZE), b""):
+                digest.update(data)
+                spool.write(data)
+
+    if digest.hexdigest() != upload.sha256.lower():
+        spool.close()
+        raise UploadChecksumMismatch("The uploaded data does not match the announced checksum.")
+
+    spool.seek(0)
+    return File(spool, name=upload.filename)
+
+
+def discard(upload: ChunkedUpload) -> None:
+    """Delete the stored parts and the upload record."""
+    for name in upload.parts:
+        default_storage.delete(name)
+    upload.delete()
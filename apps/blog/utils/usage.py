@@ -0,0 +1,104 @@
+import posixpath
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set
+from urllib.parse import unquote, urlsplit
+from uuid import UUID
+
+from django.conf import settings
+from django.db.models import Q
+
+from apps.blog.models import Blog, GalleryImage
+
+# The auto-created through model behind Blog.gallery_images (blog_id, galleryimage_id).
+BlogGalleryImage = Blog.gallery_images.through
+
+# ![alt](url "title") and ![alt](<url>), plus raw <img src="url"> tags.
+_MARKDOWN_IMAGE = re.compile(r"!\[[^\]]*\]\(\s*<?([^)\s>]+)")
+_HTML_IMAGE = re.compile(r"<img\b[^>]*\bsrc\s*=\s*[\"']([^\"']+)[\"']", re.IGNORECASE)
+# A derivative such as ``dir/derivatives/stem-640w.webp`` belongs to ``dir/stem.*``.
+_DERIVATIVE = re.compile(r"^(?P<dir>.*?)/?derivatives/(?P<stem>.+)-\d+w\.[^./]+$")
+
+
+def media_names(content: str) -> Set[str]:
+    """Return the media storage names of the images referenced in ``content``."""
+    media_path = urlsplit(settings.MEDIA_URL).path
+    names = set()
+    for url in [*_MARKDOWN_IMAGE.findall(content or ""), *_HTML_IMAGE.findall(content or "")]:
+        path = unquote(urlsplit(url).path)
+        if path.startswith(media_path):
+            names.add(path[len(media_path) :])
+    return names
+
+
+def _image_lookup(names: Iterable[str]) -> Q:
+    lookup = Q()
+    for name in names:
+        match = _DERIVATIVE.match(name)
+        if match:
+            source = posixpath.join(match["dir"], match["stem"])
+            lookup |= Q(image__startswith=f"{source}.")
+        else:
+            lookup |= Q(image=name)
+    return lookup
+
+
+def resolve_gallery_images(contents: Dict[UUID, str]) -> Dict[UUID, Set[UUID]]:
+    """
+    Map each blog id to the gallery images its content embeds, by original or
+    derivative URL, with a single query for all of them.
+    """
+    names_by_blog = {blog_id: media_names(content) for blog_id, content in contents.items()}
+    all_names = set().union(*names_by_blog.values()) if names_by_blog else set()
+    if not all_names:
+        return {blog_id: set() for blog_id in contents}
+
+    images: Dict[str, Set[UUID]] = defaultdict(set)
+    for image_id, image_name in GalleryImage.objects.filter(_image_lookup(all_names)).values_list(
+        "id", "image"
+    ):
+        images[image_name].add(image_id)
+
+    found = {}
+    for blog_id, names in names_by_blog.items():
+        found[blog_id] = set()
+        for name in names:
+            match = _DERIVATIVE.match(name)
+            if match:
+                prefix = f"{posixpath.join(match['dir'], match['stem'])}."
+                for image_name, ids in images.items():
+                    if image_name.startswith(prefix):
+                        found[blog_id] |= ids
+            else:
+                found[blog_id] |= images.get(name, set())
+    return found
+
+
+def index_gallery_usage(blogs: List[Blog], adding: bool = False) -> None:
+    """
+    Bring the (blog, gallery image) links of ``blogs`` in line with their
+    content, inserting and deleting only the difference. With ``adding`` the
+    posts are known to have no links yet.
+    """
+    if not blogs:
+        return
+    wanted = resolve_gallery_images({blog.pk: blog.content for blog in blogs})
+    current: Dict[UUID, Set[UUID]] = defaultdict(set)
+    if not adding:
+        for blog_id, image_id in BlogGalleryImage.objects.filter(
+            blog_id__in=list(wanted)
+        ).values_list("blog_id", "galleryimage_id"):
+            current[blog_id].add(image_id)
+
+    stale = Q()
+    rows = []
+    for blog_id, image_ids in wanted.items():
+        if current[blog_id] - image_ids:
+            stale |= Q(blog_id=blog_id, galleryimage_id__in=current[blog_id] - image_ids)
+        rows.extend(
+            BlogGalleryImage(blog_id=blog_id, galleryimage_id=image_id)
+            for image_id in image_ids - current[blog_id]
+        )
+    if stale:
+        BlogGalleryImage.objects.filter(stale).delete()
+    BlogGalleryImage.objects.bulk_create(rows, ignore_conflicts=True)
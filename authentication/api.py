@@ -1,11 +1,19 @@
 # users/api.py (or authentication/api.py)
 from ninja import Router
-from django.contrib.auth import authenticate, login, logout, get_user_model
+from django.http import HttpResponse
+from django.contrib.auth import (
+    authenticate,
+    login,
+    logout,
+    get_user_model,
+    update_session_auth_hash,
+)
 from django.contrib.auth.tokens import default_token_generator
 from django.core.mail import send_mail
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
 from django.conf import settings
+from ninja.errors import HttpError
 from ninja.security import django_auth  # Import the built-in Django auth
 
 from authentication.schema import (
@@ -16,16 +24,33 @@ from authentication.schema import (
     RequestPasswordResetResponse,
     ConfirmPasswordResetInput,
     CurrentUserResponse,
+    SessionPoolsResponse,
+    LoginThrottleStats,
 )
+from authentication.current_user import cache_user, cached_current_user
+from authentication.current_user import render as render_current_user
+from authentication.ninja_auth import django_auth_is_staff
+from authentication.redis_sessions.local_cache import get_local_cache
+from authentication.redis_sessions.pool import get_registry
+from authentication.redis_sessions import user_index
+from authentication.redis_sessions.user_index import delete_user_sessions
+from authentication.throttle import get_login_throttle
 from authentication.tasks import send_reset_password_email  # if you use Celery tasks
 
 User = get_user_model()
 auth_router = Router(tags=["Authentication"])
 
-@auth_router.post("/login", response=LoginResponse)
-def login_user(request, data: LoginInput):
+@auth_router.post("/login", response={200: LoginResponse, 429: LoginResponse})
+def login_user(request, data: LoginInput, response: HttpResponse):
+    # Checked before authenticate(), so throttled attempts cost no password hashing.
+    throttle = get_login_throttle()
+    attempt = throttle.acquire(request, data.email)
+    if attempt.throttled:
+        response["Retry-After"] = str(attempt.retry_after)
+        return 429, LoginResponse(success=False, message="Too many login attempts. Try again later.")
     user = authenticate(request, username=data.email, password=data.password)
     if user is not None:
+        throttle.succeeded(attempt)
         login(request, user)
         return LoginResponse(success=True, message="Logged in successfully.")
     return LoginResponse(success=False, message="Invalid credentials.")
@@ -35,6 +60,15 @@ def logout_user(request):
     logout(request)
     return LoginResponse(success=True, message="Logged out successfully.")
 
+@auth_router.post("/logout-everywhere", response=LoginResponse, auth=django_auth)
+def logout_everywhere(request):
+    """End every session of the current user, on all devices."""
+    if not user_index.is_enabled():
+        raise HttpError(501, "Logging out everywhere needs the Redis session engine.")
+    deleted = delete_user_sessions(request.user.pk)
+    logout(request)
+    return LoginResponse(success=True, message=f"Logged out of {deleted} sessions.")
+
 @auth_router.post("/reset-password", response=LoginResponse, auth=django_auth)
 def reset_password_logged_in(request, data: ResetPasswordLoggedInInput):
     user = request.user  # Guaranteed to be authenticated because of auth=django_auth
@@ -43,6 +77,11 @@ def reset_password_logged_in(request, data: ResetPasswordLoggedInInput):
     
     user.set_password(data.new_password)
     user.save()
+    # Stay logged in here, but end the sessions on every other device.
+    update_session_auth_hash(request, user)
+    # Other engines still reject those sessions through the session auth hash.
+    if user_index.is_enabled():
+        delete_user_sessions(user.pk, keep_session_key=request.session.session_key)
     return LoginResponse(success=True, message="Password reset successfully.")
 
 @auth_router.post("/request-password-reset", response=RequestPasswordResetResponse)
@@ -70,6 +109,8 @@ def confirm_password_reset(request, data: ConfirmPasswordResetInput):
         if default_token_generator.check_token(user, data.token):
             user.set_password(data.new_password)
             user.save()
+            if user_index.is_enabled():
+                delete_user_sessions(user.pk)
             return RequestPasswordResetResponse(success=True, message="Password has been reset.")
         else:
             return RequestPasswordResetResponse(success=False, message="Invalid token or token expired.")
@@ -79,26 +120,33 @@ def confirm_password_reset(request, data: ConfirmPasswordResetInput):
 # Updated /auth/me endpoint that includes author details if available.
 @auth_router.get("/me", response=CurrentUserResponse)
 def get_current_user(request):
+    # Served from the session and the cached projection when they agree, so
+    # neither the user nor their author profile is loaded from the database.
+    cached = cached_current_user(request)
+    if cached is not None:
+        return cached
     if request.user.is_authenticated:
-        author_data = None
-        # Check if the user has an associated author profile.
-        # (This assumes that your Author model is linked via a OneToOneField with related_name "author_profile".)
-        if hasattr(request.user, "author_profile") and request.user.author_profile:
-            author_profile = request.user.author_profile
-            # If an avatar image is available, use its URL.
-            avatar_url = request.build_absolute_uri(author_profile.avatar.url) if author_profile.avatar else None
-            author_data = {
-                "avatar": avatar_url,
-                "bio": author_profile.bio,
-            }
-        return {
-            "user": {
-                "id": request.user.id,
-                "email": request.user.email,
-                "first_name": request.user.first_name,
-                "last_name": request.user.last_name,
-                "is_staff": request.user.is_staff,
-                "author": author_data,
-            }
-        }
+        return render_current_user(request, cache_user(request.user))
     return {"user": None}
+
+@auth_router.get("/session-pools", response=SessionPoolsResponse, auth=django_auth_is_staff)
+def session_pool_stats(request, check: bool = False):
+    """
+    Connection pool usage per session Redis server, and local session cache
+    hits; ``check`` also pings each server.
+    """
+    registry = get_registry()
+    servers = registry.stats()
+    if check:
+        for stats, health in zip(servers, registry.health()):
+            stats.update(health)
+    local_cache = get_local_cache()
+    return {"servers": servers, "local_cache": local_cache.stats() if local_cache else None}
+
+@auth_router.get("/login-throttle", response=LoginThrottleStats, auth=django_auth_is_staff)
+def login_throttle_stats(request):
+    """Login attempts allowed, succeeded and throttled, across all workers."""
+    stats = get_login_throttle().stats()
+    if stats is None:
+        raise HttpError(503, "Login throttle counters are unavailable.")
+    return stats
@@ -1,6 +1,17 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class AuthConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "authentication"
+
+    def ready(self) -> None:
+        from authentication.current_user import connect_signals
+
+        connect_signals()
+        if settings.SESSION_ENGINE == "authentication.redis_sessions.session":
+            # Build the session connection pools once, before serving requests.
+            from authentication.redis_sessions.pool import get_registry
+
+            get_registry()
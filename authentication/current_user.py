@@ -0,0 +1,141 @@
+import logging
+from functools import partial
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, user_logged_in
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpRequest
+from django.utils.crypto import constant_time_compare
+
+logger = logging.getLogger(__name__)
+
+# Where the /auth/me projection of each user is kept, and for how long.
+CURRENT_USER_CACHE = getattr(settings, "CURRENT_USER_CACHE", "default")
+CURRENT_USER_CACHE_TIMEOUT = getattr(settings, "CURRENT_USER_CACHE_TIMEOUT", None)
+
+
+def cache_key(user_id: Any) -> str:
+    return f"auth:me:{user_id}"
+
+
+def project_user(user: Any) -> Dict[str, Any]:
+    """
+    What /auth/me returns for ``user``, plus what is needed to check a session
+    against it: whether the user may log in, and their session auth hash.
+    """
+    author_data = None
+    # Check if the user has an associated author profile (the Author model's
+    # OneToOneField has related_name "author_profile").
+    if hasattr(user, "author_profile") and user.author_profile:
+        author_profile = user.author_profile
+        author_data = {
+            # Made absolute per request, since the host may differ.
+            "avatar": author_profile.avatar.url if author_profile.avatar else None,
+            "bio": author_profile.bio,
+        }
+    return {
+        "user": {
+            "id": str(user.id),
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "is_staff": user.is_staff,
+            "author": author_data,
+        },
+        "is_active": user.is_active,
+        "session_hash": user.get_session_auth_hash(),
+    }
+
+
+def cache_user(user: Any) -> Dict[str, Any]:
+    projection = project_user(user)
+    timeout = CURRENT_USER_CACHE_TIMEOUT or settings.SESSION_COOKIE_AGE
+    try:
+        caches[CURRENT_USER_CACHE].set(cache_key(user.pk), projection, timeout)
+    except Exception:
+        # Like the login throttle, fail open: /auth/me then loads the user.
+        logger.warning("Current user cache unavailable", exc_info=True)
+    return projection
+
+
+def forget_user_id(user_id: Any) -> None:
+    try:
+        caches[CURRENT_USER_CACHE].delete(cache_key(user_id))
+    except Exception:
+        logger.warning("Current user cache unavailable", exc_info=True)
+
+
+def render(request: HttpRequest, projection: Dict[str, Any]) -> Dict[str, Any]:
+    user = dict(projection["user"])
+    author = user["author"]
+    if author and author["avatar"]:
+        # If an avatar image is available, use its URL.
+        user["author"] = {**author, "avatar": request.build_absolute_uri(author["avatar"])}
+    return {"user": user}
+
+
+def cached_current_user(request: HttpRequest) -> Optional[Dict[str, Any]]:
+    """
+    /auth/me from the session and the cached projection alone, without
+    loading ``request.user``. None when the full check is needed: nothing is
+    cached, the cache is unavailable, or the session may no longer be valid
+    (password changed, user deactivated), which the auth middleware then
+    deals with.
+    """
+    session = request.session
+    user_id = session.get(SESSION_KEY)
+    if user_id is None:
+        return {"user": None}
+    if session.get(BACKEND_SESSION_KEY) not in settings.AUTHENTICATION_BACKENDS:
+        return None
+    try:
+        projection = caches[CURRENT_USER_CACHE].get(cache_key(user_id))
+    except Exception:
+        logger.warning("Current user cache unavailable", exc_info=True)
+        return None
+    if projection is None or not projection["is_active"]:
+        return None
+    if not constant_time_compare(session.get(HASH_SESSION_KEY, ""), projection["session_hash"]):
+        return None
+    return render(request, projection)
+
+
+def refresh_user(sender, instance, update_fields=None, **kwargs) -> None:
+    # Logging in only touches last_login, which is not part of the projection.
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    transaction.on_commit(partial(cache_user, instance))
+
+
+def refresh_author(sender, instance, **kwargs) -> None:
+    transaction.on_commit(partial(cache_user, instance.user))
+
+
+def forget_author(sender, instance, **kwargs) -> None:
+    # instance.user still holds the deleted profile in its reverse accessor
+    # cache, so the projection is rebuilt from the database on next use.
+    transaction.on_commit(partial(forget_user_id, instance.user_id))
+
+
+def forget_user(sender, instance, **kwargs) -> None:
+    transaction.on_commit(partial(forget_user_id, instance.pk))
+
+
+def cache_logged_in_user(sender, request, user, **kwargs) -> None:
+    cache_user(user)
+
+
+def connect_signals() -> None:
+    from django.apps import apps
+    from django.contrib.auth import get_user_model
+
+    User = get_user_model()
+    Author = apps.get_model("blog", "Author")
+    user_logged_in.connect(cache_logged_in_user, dispatch_uid="cache_logged_in_user")
+    post_save.connect(refresh_user, sender=User, dispatch_uid="refresh_current_user")
+    post_delete.connect(forget_user, sender=User, dispatch_uid="forget_current_user")
+    post_save.connect(refresh_author, sender=Author, dispatch_uid="refresh_current_user_author")
+    post_delete.connect(forget_author, sender=Author, dispatch_uid="forget_current_user_author")
@@ -0,0 +1,106 @@
+import secrets
+import time
+from typing import Any, Dict, List, Tuple, Union
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from authentication.redis_sessions import settings
+from authentication.redis_sessions.codec import CompactCodec, DjangoCodec, SessionCodec
+from authentication.redis_sessions.pool import get_registry
+from authentication.redis_sessions.session import SessionStore
+
+DEFAULT_ITERATIONS = 10_000
+
+
+def sample_sessions(extra_items: int) -> Dict[str, Dict[str, Any]]:
+    authenticated = {
+        "_auth_user_id": "1024",
+        "_auth_user_backend": "django.contrib.auth.backends.ModelBackend",
+        "_auth_user_hash": secrets.token_hex(32),
+    }
+    return {
+        "anonymous": {"_language": "en"},
+        "authenticated": authenticated,
+        "with_data": {
+            **authenticated,
+            "_session_expiry": 864000,
+            "recently_viewed": [
+                {"id": secrets.token_hex(16), "slug": f"post-{i}", "read": i % 2 == 0}
+                for i in range(extra_items)
+            ],
+        },
+    }
+
+
+class Command(BaseCommand):
+    help = "Compare session codecs: stored bytes per session and encode/decode time."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+        parser.add_argument(
+            "--extra-items",
+            type=int,
+            default=20,
+            help="Entries in the list stored by the 'with_data' sample session.",
+        )
+        parser.add_argument(
+            "--from-redis",
+            type=int,
+            default=0,
+            help="Also measure up to this many real sessions read from the session servers.",
+        )
+
+    def handle(self, *args: Any, **options: Union[int, str]) -> None:
+        iterations = int(options["iterations"])
+        key_salt = SessionStore().key_salt
+        codecs: List[Tuple[str, SessionCodec]] = [
+            ("django", DjangoCodec(key_salt)),
+            ("compact", CompactCodec(key_salt)),
+            ("compact, no zlib", CompactCodec(key_salt, compress_min_size=2**31)),
+        ]
+        samples = sample_sessions(int(options["extra_items"]))
+        if options["from_redis"]:
+            samples["from_redis"] = self.real_sessions(int(options["from_redis"]))
+
+        self.stdout.write(
+            f"{'sample':<14} {'codec':<18} {'bytes':>8} {'encode µs':>10} {'decode µs':>10}"
+        )
+        for sample_name, sessions in samples.items():
+            batch = sessions if isinstance(sessions, list) else [sessions]
+            if not batch:
+                continue
+            rounds = max(1, iterations // len(batch))
+            for codec_name, codec in codecs:
+                encoded = [codec.encode(session) for session in batch]
+                started = time.perf_counter()
+                for _ in range(rounds):
+                    for session in batch:
+                        codec.encode(session)
+                encode_time = time.perf_counter() - started
+                started = time.perf_counter()
+                for _ in range(rounds):
+                    for data in encoded:
+                        codec.decode(data)
+                decode_time = time.perf_counter() - started
+
+                calls = rounds * len(batch)
+                size = sum(len(data) for data in encoded) / len(encoded)
+                self.stdout.write(
+                    f"{sample_name:<14} {codec_name:<18} {size:>8.0f} "
+                    f"{encode_time / calls * 1e6:>10.1f} {decode_time / calls * 1e6:>10.1f}"
+                )
+        self.stdout.write(self.style.SUCCESS("Done."))
+
+    def real_sessions(self, limit: int) -> List[Dict[str, Any]]:
+        store = SessionStore()
+        pattern = f"{settings.SESSION_REDIS_PREFIX}:*" if settings.SESSION_REDIS_PREFIX else "*"
+        sessions: List[Dict[str, Any]] = []
+        for server in get_registry().servers:
+            for stored_key in server.client.scan_iter(match=pattern, count=500, _type="string"):
+                if len(sessions) >= limit:
+                    return sessions
+                data = server.client.get(stored_key)
+                session = store.decode(data) if data is not None else {}
+                if session:
+                    sessions.append(session)
+        return sessions
@@ -0,0 +1,111 @@
+import json
+from contextlib import ExitStack
+from typing import Any, Dict, List, Tuple, Union
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from authentication.redis_sessions.benchmark import (
+    OPERATIONS,
+    base_overrides,
+    connection_paths,
+    find_regressions,
+    in_process_paths,
+    local_server,
+    override_settings,
+    run_workload,
+    summarize,
+)
+
+DEFAULT_THREADS = 8
+DEFAULT_SESSIONS = 200
+DEFAULT_TOLERANCE = 0.25
+
+
+class Command(BaseCommand):
+    help = "Measure session store latency and throughput under concurrent threads."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--target",
+            choices=["in-process", "local", "configured"],
+            default="in-process",
+            help=(
+                "in-process: fakeredis in this process. local: a throwaway redis-server "
+                "(or fakeredis TCP server), through the url, unix socket, pool and "
+                "connection object paths. configured: the SESSION_REDIS servers."
+            ),
+        )
+        parser.add_argument("--threads", type=int, default=DEFAULT_THREADS)
+        parser.add_argument(
+            "--sessions",
+            type=int,
+            default=DEFAULT_SESSIONS,
+            help="Sessions created, loaded, saved and deleted per thread.",
+        )
+        parser.add_argument("--redis-server", help="Path to the redis-server binary.")
+        parser.add_argument("--baseline", help="JSON results to compare against.")
+        parser.add_argument("--save-baseline", help="Write the results to this JSON file.")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=DEFAULT_TOLERANCE,
+            help="Allowed slowdown against the baseline, as a fraction.",
+        )
+
+    def handle(self, *args: Any, **options: Union[str, int, float, None]) -> None:
+        results: Dict[str, Dict[str, Any]] = {}
+        try:
+            with ExitStack() as stack:
+                paths: List[Tuple[str, Dict[str, Any]]]
+                if options["target"] == "in-process":
+                    paths = in_process_paths()
+                elif options["target"] == "local":
+                    server = stack.enter_context(local_server(options["redis_server"]))
+                    paths = connection_paths(server)
+                else:
+                    paths = [("configured", {})]
+
+                for name, overrides in paths:
+                    values = (
+                        {"SESSION_REDIS_PREFIX": "benchmark", "SESSION_REDIS_LOCAL_CACHE": None}
+                        if options["target"] == "configured"
+                        else {**base_overrides(), **overrides}
+                    )
+                    with override_settings(**values):
+                        latencies, elapsed = run_workload(
+                            int(options["threads"]), int(options["sessions"])
+                        )
+                    results[name] = summarize(latencies, elapsed)
+                    self.report(name, results[name])
+        except ImproperlyConfigured as exc:
+            raise CommandError(str(exc))
+
+        if options["save_baseline"]:
+            with open(str(options["save_baseline"]), "w") as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(f"Saved results to {options['save_baseline']}")
+
+        if options["baseline"]:
+            with open(str(options["baseline"])) as f:
+                baseline = json.load(f)
+            regressions = find_regressions(results, baseline, float(options["tolerance"]))
+            if regressions:
+                for regression in regressions:
+                    self.stderr.write(regression)
+                raise CommandError(f"{len(regressions)} regressions against the baseline.")
+            self.stdout.write(self.style.SUCCESS("No regressions against the baseline."))
+
+    def report(self, name: str, summary: Dict[str, Any]) -> None:
+        self.stdout.write(self.style.SUCCESS(f"{name}: {summary['ops_per_sec']} ops/s"))
+        self.stdout.write(
+            f"  {'operation':<10} {'count':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        )
+        for operation in OPERATIONS:
+            stats = summary["operations"].get(operation)
+            if stats is None:
+                continue
+            self.stdout.write(
+                f"  {operation:<10} {stats['count']:>7} {stats['p50_ms']:>8.3f} "
+                f"{stats['p95_ms']:>8.3f} {stats['p99_ms']:>8.3f}"
+            )
@@ -1,18 +1,70 @@
-from typing import Union
+import time
+from typing import Any, Union
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
 
+from apps.blog.models import Author, Blog
 from authentication.models import User
 
+DEFAULT_BATCH_SIZE = 1000
+
 
 class Command(BaseCommand):
     help = "Delete Non Superusers."
 
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of users deleted per transaction.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be deleted without deleting anything.",
+        )
+
     def handle(self, *args: str, **options: Union[str, int]) -> None:
-        users = User.objects.all()
+        batch_size = int(options["batch_size"])
+        users = User.objects.filter(is_superuser=False)
+        total = users.count()
+
+        if options["dry_run"]:
+            authors = Author.objects.filter(user__is_superuser=False).count()
+            blogs = Blog.objects.filter(author__user__is_superuser=False).count()
+            self.stdout.write(
+                f"Would delete {total} users and {authors} author profiles, "
+                f"and unset the author on {blogs} posts."
+            )
+            return
+
+        started = time.monotonic()
+        deleted = 0
+        last_pk: Any = None
+        while True:
+            # Walk the table in primary key order, holding one batch of ids at a time.
+            batch = users.order_by("pk")
+            if last_pk is not None:
+                batch = batch.filter(pk__gt=last_pk)
+            ids = list(batch.values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            last_pk = ids[-1]
 
-        for user in users:
-            if not user.is_superuser:
-                user.delete()
+            # QuerySet.delete() cascades with set-based queries: one UPDATE for
+            # the SET_NULL on Blog.author and one DELETE per related table.
+            with transaction.atomic():
+                User.objects.filter(pk__in=ids).delete()
+            deleted += len(ids)
+            self.stdout.write(
+                f"Deleted {deleted}/{total} users ({time.monotonic() - started:.1f}s)"
+            )
 
-        self.stdout.write(self.style.SUCCESS("Successfully deleted none superusers."))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully deleted {deleted} none superusers in "
+                f"{time.monotonic() - started:.1f}s."
+            )
+        )
@@ -0,0 +1,50 @@
+from typing import Any, Dict, Union
+
+import redis
+from django.core.management.base import BaseCommand, CommandParser
+
+from authentication.redis_sessions.pool import get_registry
+from authentication.redis_sessions.rebalance import REBALANCE_BATCH_SIZE, rebalance_sessions
+
+
+class Command(BaseCommand):
+    help = "Move Redis sessions to the server the hash ring assigns them after a pool change."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--source",
+            action="append",
+            default=[],
+            help="Redis URL of a server removed from the pool, to drain. Repeatable.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Leave the old copies in place instead of deleting them.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the sessions that would move.",
+        )
+        parser.add_argument("--batch-size", type=int, default=REBALANCE_BATCH_SIZE)
+
+    def handle(self, *args: Any, **options: Union[str, int, bool, list]) -> None:
+        def report(counts: Dict[str, int]) -> None:
+            self.stdout.write(f"Scanned {counts['scanned']}, moved {counts['moved']}")
+
+        counts = rebalance_sessions(
+            get_registry(),
+            extra_sources=[redis.Redis.from_url(url) for url in options["source"]],
+            delete=not options["keep"],
+            dry_run=bool(options["dry_run"]),
+            batch_size=int(options["batch_size"]),
+            progress=report,
+        )
+        verb = "Would move" if options["dry_run"] else "Moved"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {counts['moved']} of {counts['scanned']} sessions; "
+                f"{counts['skipped']} already present on their new server."
+            )
+        )
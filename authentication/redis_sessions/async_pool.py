@@ -0,0 +1,142 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import redis.asyncio
+import redis.asyncio.connection
+from redis.asyncio.sentinel import Sentinel
+from redis.exceptions import ResponseError
+
+from authentication.redis_sessions import settings
+from authentication.redis_sessions.pool import ServerRegistry, SessionServer, get_registry
+
+
+def _async_client(server: SessionServer) -> redis.asyncio.Redis:
+    """An asyncio client for the same server, with the same connection and pool options."""
+    pool = server.client.connection_pool
+    connection_class = getattr(
+        redis.asyncio.connection,
+        pool.connection_class.__name__,
+        redis.asyncio.connection.Connection,
+    )
+    return redis.asyncio.Redis(
+        connection_pool=redis.asyncio.BlockingConnectionPool(
+            connection_class=connection_class,
+            max_connections=settings.SESSION_REDIS_MAX_CONNECTIONS,
+            timeout=settings.SESSION_REDIS_POOL_TIMEOUT,
+            **pool.connection_kwargs,
+        )
+    )
+
+
+async def _async_sentinel_clients() -> Tuple[redis.asyncio.Redis, Optional[redis.asyncio.Redis]]:
+    def sentinel(**extra: Any) -> Sentinel:
+        return Sentinel(
+            settings.SESSION_REDIS_SENTINEL_LIST,
+            db=settings.SESSION_REDIS_DB,
+            password=settings.SESSION_REDIS_PASSWORD,
+            socket_timeout=settings.SESSION_REDIS_SOCKET_TIMEOUT,
+            retry_on_timeout=settings.SESSION_REDIS_RETRY_ON_TIMEOUT,
+            health_check_interval=settings.SESSION_REDIS_HEALTH_CHECK_INTERVAL,
+            **extra,
+        )
+
+    instance = sentinel(sentinel_kwargs={"password": settings.SESSION_REDIS_SENTINEL_PASSWORD})
+    # Check if the sentinels are configured with a password. If not, connect
+    # without one.
+    try:
+        await instance.sentinel_masters()
+    except ResponseError:
+        instance = sentinel()
+    alias = settings.SESSION_REDIS_SENTINEL_MASTER_ALIAS
+    pool_kwargs = {"max_connections": settings.SESSION_REDIS_MAX_CONNECTIONS}
+    master = instance.master_for(alias, **pool_kwargs)
+    if not settings.SESSION_REDIS_SENTINEL_REPLICA_READS:
+        return master, None
+    return master, instance.slave_for(alias, **pool_kwargs)
+
+
+class AsyncServerRegistry:
+    """
+    asyncio clients for the servers of a ``ServerRegistry``. Sessions are placed
+    by the sync registry's hash ring and read-your-writes window, so both
+    stores agree on where every session lives.
+    """
+
+    def __init__(self, registry: ServerRegistry) -> None:
+        self.registry = registry
+        self.clients: Dict[str, redis.asyncio.Redis] = {}
+        self.replicas: Dict[str, redis.asyncio.Redis] = {}
+
+    @classmethod
+    async def build(cls, registry: ServerRegistry) -> "AsyncServerRegistry":
+        instance = cls(registry)
+        for server in registry.servers:
+            if settings.SESSION_REDIS_SENTINEL_LIST is not None:
+                master, replica = await _async_sentinel_clients()
+                instance.clients[server.name] = master
+                if replica is not None:
+                    instance.replicas[server.name] = replica
+            else:
+                instance.clients[server.name] = _async_client(server)
+        return instance
+
+    def client_for(self, session_key: Optional[str]) -> redis.asyncio.Redis:
+        return self.clients[self.registry.server_for(session_key).name]
+
+    def reader_for(self, session_key: Optional[str], stored_key: str) -> redis.asyncio.Redis:
+        name = self.registry.server_for(session_key).name
+        if name not in self.replicas or stored_key in self.registry.recent_writes:
+            return self.clients[name]
+        return self.replicas[name]
+
+    async def disconnect(self) -> None:
+        for client in [*self.clients.values(), *self.replicas.values()]:
+            await client.connection_pool.disconnect()
+
+
+# asyncio connections belong to the event loop that opened them, so there is
+# one registry per running loop. Its connections keep the loop alive, so the
+# registry is disconnected and dropped when the loop shuts down (asyncio.run
+# and async_to_sync finalize async generators first), or at the next lookup
+# if the loop was closed without that.
+_async_registries: Dict[asyncio.AbstractEventLoop, Tuple[AsyncServerRegistry, Any]] = {}
+
+
+async def _disconnect_at_shutdown(
+    loop: asyncio.AbstractEventLoop, registry: AsyncServerRegistry
+) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        if _async_registries.get(loop, (None,))[0] is registry:
+            del _async_registries[loop]
+        if not loop.is_closed():
+            await registry.disconnect()
+
+
+def _drop_closed_loops() -> None:
+    for loop in [loop for loop in _async_registries if loop.is_closed()]:
+        _, closer = _async_registries.pop(loop)
+        # Nothing can be awaited on a closed loop: just run out the generator,
+        # leaving the connections to be closed as they are collected.
+        try:
+            closer.aclose().send(None)
+        except (StopIteration, RuntimeError):
+            pass
+
+
+async def get_async_registry() -> AsyncServerRegistry:
+    loop = asyncio.get_running_loop()
+    entry = _async_registries.get(loop)
+    if entry is None:
+        _drop_closed_loops()
+        registry = await AsyncServerRegistry.build(get_registry())
+        # Another task may have built one while this one was awaiting.
+        entry = _async_registries.get(loop)
+        if entry is not None:
+            await registry.disconnect()
+            return entry[0]
+        closer = _disconnect_at_shutdown(loop, registry)
+        await closer.__anext__()
+        entry = _async_registries[loop] = (registry, closer)
+    return entry[0]
@@ -0,0 +1,246 @@
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import redis
+from django.core.exceptions import ImproperlyConfigured
+
+from authentication.redis_sessions import settings
+from authentication.redis_sessions.pool import reset_registry
+
+OPERATIONS = ["create", "load", "save", "delete"]
+SERVER_START_TIMEOUT = 10
+
+
+@contextmanager
+def override_settings(**values: Any) -> Iterator[None]:
+    """Point the session store at other servers, rebuilding the registry around it."""
+    previous = {name: getattr(settings, name) for name in values}
+    for name, value in values.items():
+        setattr(settings, name, value)
+    reset_registry()
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(settings, name, value)
+        reset_registry()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def local_server(binary: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Start a throwaway Redis: ``redis-server`` (listening on TCP and a unix
+    socket) when one is installed, else fakeredis' TCP server.
+    """
+    binary = binary or shutil.which("redis-server")
+    if binary is None:
+        try:
+            from fakeredis import TcpFakeServer
+        except ImportError:
+            raise ImproperlyConfigured("Install redis-server or fakeredis to run a local server.")
+        server = TcpFakeServer(("127.0.0.1", _free_port()))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield {"host": "127.0.0.1", "port": server.server_address[1], "unix_socket": None}
+        finally:
+            server.shutdown()
+            server.server_close()
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        port = _free_port()
+        unix_socket = os.path.join(directory, "redis.sock")
+        options = {
+            "port": str(port),
+            "unixsocket": unix_socket,
+            "save": "",
+            "appendonly": "no",
+            "dir": directory,
+        }
+        process = subprocess.Popen(
+            [binary, *(arg for name, value in options.items() for arg in (f"--{name}", value))],
+            stdout=subprocess.DEVNULL,
+        )
+        try:
+            client = redis.Redis(port=port)
+            deadline = time.monotonic() + SERVER_START_TIMEOUT
+            while True:
+                try:
+                    client.ping()
+                    break
+                except redis.ConnectionError:
+                    if time.monotonic() > deadline or process.poll() is not None:
+                        raise ImproperlyConfigured(f"{binary} did not start on port {port}.")
+                    time.sleep(0.05)
+            client.close()
+            yield {"host": "127.0.0.1", "port": port, "unix_socket": unix_socket}
+        finally:
+            process.terminate()
+            process.wait()
+
+
+def connection_paths(server: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Settings overrides exercising each way the registry can connect to ``server``."""
+    host, port = server["host"], server["port"]
+    paths = [("url", {"SESSION_REDIS_URL": f"redis://{host}:{port}/0"})]
+    if server["unix_socket"]:
+        paths.append(
+            ("unix_socket", {"SESSION_REDIS_UNIX_DOMAIN_SOCKET_PATH": server["unix_socket"]})
+        )
+    paths.append(
+        (
+            "pool",
+            {
+                # Two databases of the same server stand in for two servers.
+                "SESSION_REDIS_POOL": [
+                    {"name": "bench-1", "url": f"redis://{host}:{port}/1"},
+                    {"name": "bench-2", "url": f"redis://{host}:{port}/2"},
+                ]
+            },
+        )
+    )
+    paths.append(
+        (
+            "connection_object",
+            {"SESSION_REDIS_CONNECTION_OBJECT": redis.Redis(host=host, port=port, db=3)},
+        )
+    )
+    return paths
+
+
+def in_process_paths() -> List[Tuple[str, Dict[str, Any]]]:
+    """A fakeredis client in this process: the store's own overhead, without a network."""
+    try:
+        import fakeredis
+    except ImportError:
+        raise ImproperlyConfigured("Install fakeredis to benchmark against an in-process Redis.")
+    client = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+    return [("in_process", {"SESSION_REDIS_CONNECTION_OBJECT": client})]
+
+
+def base_overrides() -> Dict[str, Any]:
+    """Isolate benchmark sessions from real ones and from optional features."""
+    return {
+        "SESSION_REDIS_PREFIX": "benchmark",
+        "SESSION_REDIS_URL": None,
+        "SESSION_REDIS_UNIX_DOMAIN_SOCKET_PATH": None,
+        "SESSION_REDIS_POOL": None,
+        "SESSION_REDIS_CONNECTION_OBJECT": None,
+        "SESSION_REDIS_SENTINEL_LIST": None,
+        "SESSION_REDIS_LOCAL_CACHE": None,
+        "SESSION_REDIS_LEGACY_CACHE": None,
+    }
+
+
+def run_workload(threads: int, sessions: int) -> Tuple[Dict[str, List[float]], float]:
+    """
+    Create, load, modify and delete ``sessions`` sessions on each of
+    ``threads`` threads. Returns latencies in milliseconds per operation and
+    the wall-clock time.
+    """
+    from authentication.redis_sessions.session import SessionStore
+
+    latencies: Dict[str, List[float]] = {operation: [] for operation in OPERATIONS}
+    lock = threading.Lock()
+    errors: List[BaseException] = []
+
+    def worker(worker_id: int) -> None:
+        timings: Dict[str, List[float]] = {operation: [] for operation in OPERATIONS}
+        try:
+            for i in range(sessions):
+                started = time.perf_counter()
+                store = SessionStore()
+                store["_auth_user_id"] = str(worker_id * sessions + i)
+                store["recently_viewed"] = list(range(10))
+                store.save()
+                timings["create"].append(time.perf_counter() - started)
+                session_key = store.session_key
+
+                started = time.perf_counter()
+                SessionStore(session_key).load()
+                timings["load"].append(time.perf_counter() - started)
+
+                store = SessionStore(session_key)
+                store["recently_viewed"] = store["recently_viewed"] + [i]
+                started = time.perf_counter()
+                store.save()
+                timings["save"].append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                SessionStore(session_key).delete()
+                timings["delete"].append(time.perf_counter() - started)
+        except BaseException as exc:
+            errors.append(exc)
+        with lock:
+            for operation, values in timings.items():
+                latencies[operation].extend(value * 1000 for value in values)
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    if errors:
+        raise errors[0]
+    return latencies, elapsed
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def summarize(latencies: Dict[str, List[float]], elapsed: float) -> Dict[str, Any]:
+    operations = {}
+    for operation, values in latencies.items():
+        if not values:
+            continue
+        ordered = sorted(values)
+        operations[operation] = {
+            "count": len(ordered),
+            "p50_ms": round(_percentile(ordered, 0.50), 3),
+            "p95_ms": round(_percentile(ordered, 0.95), 3),
+            "p99_ms": round(_percentile(ordered, 0.99), 3),
+        }
+    total = sum(len(values) for values in latencies.values())
+    return {"ops_per_sec": round(total / elapsed, 1), "operations": operations}
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], tolerance: float
+) -> List[str]:
+    """
+    Describe every p95 latency or throughput that is worse than ``baseline``
+    by more than ``tolerance`` (a fraction).
+    """
+    regressions = []
+    for path, summary in results.items():
+        previous = baseline.get(path)
+        if not previous:
+            continue
+        if summary["ops_per_sec"] < previous["ops_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{path}: {summary['ops_per_sec']} ops/s, was {previous['ops_per_sec']} ops/s"
+            )
+        for operation, stats in summary["operations"].items():
+            before = previous["operations"].get(operation)
+            if before and stats["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{path} {operation}: p95 {stats['p95_ms']}ms, was {before['p95_ms']}ms"
+                )
+    return regressions
@@ -0,0 +1,263 @@
+import struct
+import zlib
+from typing import Any, Dict, List, Tuple
+
+from django.conf import settings as django_settings
+from django.core import signing
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django.utils.encoding import force_str
+from django.utils.module_loading import import_string
+
+from authentication.redis_sessions import settings
+
+# Keys almost every session has, written as a single byte instead of a string.
+# Append only: an entry's position is part of the stored format.
+WELL_KNOWN_KEYS = [
+    "_auth_user_id",
+    "_auth_user_backend",
+    "_auth_user_hash",
+    "_session_expiry",
+    "_language",
+    "django.contrib.auth.backends.ModelBackend",
+]
+_KEY_CODES = {key: code for code, key in enumerate(WELL_KNOWN_KEYS)}
+
+_NONE, _TRUE, _FALSE, _INT, _NEG_INT, _FLOAT, _STR, _KNOWN, _LIST, _DICT = range(10)
+_DOUBLE = struct.Struct(">d")
+
+# Compact entries start with a byte that never begins Django's signed
+# (base64/ASCII) encoding, so both can be stored side by side.
+COMPACT_MAGIC = 0x01
+_COMPRESSED = 0x01
+_MAC_SIZE = 16
+# Raw deflate with a 4 KiB window: sessions are small, and setting up zlib's
+# default 32 KiB window and header costs more than compressing them.
+_WBITS = -12
+_MEM_LEVEL = 4
+
+
+class SessionCodec:
+    """Turns a session dictionary into the bytes stored in Redis, and back."""
+
+    def __init__(self, key_salt: str) -> None:
+        self.key_salt = key_salt
+
+    def encode(self, session: Dict[str, Any]) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        """Raise ``signing.BadSignature`` for tampered data."""
+        raise NotImplementedError
+
+
+class DjangoCodec(SessionCodec):
+    """Django's own signed, base64 JSON encoding."""
+
+    def encode(self, session: Dict[str, Any]) -> bytes:
+        return signing.dumps(
+            session, salt=self.key_salt, serializer=signing.JSONSerializer, compress=True
+        ).encode()
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        return signing.loads(force_str(data), salt=self.key_salt, serializer=signing.JSONSerializer)
+
+
+def _write_uint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_uint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _pack_str(out: bytearray, value: str) -> None:
+    code = _KEY_CODES.get(value)
+    if code is not None:
+        out += bytes((_KNOWN, code))
+        return
+    encoded = value.encode()
+    if len(encoded) < 0x80:
+        out += bytes((_STR, len(encoded)))
+    else:
+        out.append(_STR)
+        _write_uint(out, len(encoded))
+    out += encoded
+
+
+def _pack_int(out: bytearray, value: int) -> None:
+    if 0 <= value < 0x80:
+        out += bytes((_INT, value))
+        return
+    out.append(_INT if value >= 0 else _NEG_INT)
+    _write_uint(out, abs(value))
+
+
+def _pack_float(out: bytearray, value: float) -> None:
+    out.append(_FLOAT)
+    out += _DOUBLE.pack(value)
+
+
+def _pack_list(out: bytearray, value: List[Any]) -> None:
+    out.append(_LIST)
+    _write_uint(out, len(value))
+    for item in value:
+        _pack(out, item)
+
+
+def _pack_dict(out: bytearray, value: Dict[str, Any]) -> None:
+    out.append(_DICT)
+    _write_uint(out, len(value))
+    for key, item in value.items():
+        if type(key) is not str:
+            raise TypeError(f"Session keys must be strings, not {type(key).__name__}")
+        _pack_str(out, key)
+        _pack(out, item)
+
+
+_PACKERS = {
+    str: _pack_str,
+    int: _pack_int,
+    float: _pack_float,
+    list: _pack_list,
+    tuple: _pack_list,
+    dict: _pack_dict,
+}
+
+
+def _pack(out: bytearray, value: Any) -> None:
+    # Exact type lookup first: the isinstance() chain is only for subclasses.
+    packer = _PACKERS.get(type(value))
+    if packer is not None:
+        packer(out, value)
+    elif value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    else:
+        for base, packer in _PACKERS.items():
+            if isinstance(value, base):
+                packer(out, value)
+                return
+        raise TypeError(f"Object of type {type(value).__name__} is not session serializable")
+
+
+def _unpack(data: bytes, offset: int) -> Tuple[Any, int]:
+    tag = data[offset]
+    offset += 1
+    if tag == _STR:
+        length = data[offset]
+        if length < 0x80:
+            offset += 1
+        else:
+            length, offset = _read_uint(data, offset)
+        return data[offset : offset + length].decode(), offset + length
+    if tag == _KNOWN:
+        return WELL_KNOWN_KEYS[data[offset]], offset + 1
+    if tag == _DICT:
+        length, offset = _read_uint(data, offset)
+        result = {}
+        for _ in range(length):
+            key, offset = _unpack(data, offset)
+            result[key], offset = _unpack(data, offset)
+        return result, offset
+    if tag == _LIST:
+        length, offset = _read_uint(data, offset)
+        items: List[Any] = []
+        for _ in range(length):
+            item, offset = _unpack(data, offset)
+            items.append(item)
+        return items, offset
+    if tag in (_INT, _NEG_INT):
+        value, offset = _read_uint(data, offset)
+        return (value if tag == _INT else -value), offset
+    if tag == _NONE:
+        return None, offset
+    if tag == _TRUE:
+        return True, offset
+    if tag == _FALSE:
+        return False, offset
+    if tag == _FLOAT:
+        return _DOUBLE.unpack_from(data, offset)[0], offset + _DOUBLE.size
+    raise ValueError(f"Unknown session value tag {tag}")
+
+
+def pack(value: Any) -> bytes:
+    """Serialize JSON-compatible data to the compact binary format."""
+    out = bytearray()
+    _pack(out, value)
+    return bytes(out)
+
+
+def unpack(data: bytes) -> Any:
+    value, offset = _unpack(data, 0)
+    if offset != len(data):
+        raise ValueError("Trailing data after session value")
+    return value
+
+
+class CompactCodec(SessionCodec):
+    """
+    Binary encoding: a magic byte, a flags byte, a 16-byte HMAC of the rest
+    and the packed session, zlib-compressed when it is at least
+    ``compress_min_size`` bytes and compression pays off. Entries written by
+    ``DjangoCodec`` are still decoded.
+    """
+
+    def __init__(
+        self,
+        key_salt: str,
+        compress_min_size: int = settings.SESSION_REDIS_COMPRESS_MIN_SIZE,
+        compress_level: int = settings.SESSION_REDIS_COMPRESS_LEVEL,
+    ) -> None:
+        super().__init__(key_salt)
+        self.compress_min_size = compress_min_size
+        self.compress_level = compress_level
+        self.legacy = DjangoCodec(key_salt)
+
+    def _mac(self, data: bytes, secret: Any = None) -> bytes:
+        return salted_hmac(self.key_salt, data, secret, algorithm="sha256").digest()[:_MAC_SIZE]
+
+    def _verify(self, mac: bytes, data: bytes) -> bool:
+        # Like Django's signing, also accept keys still being rotated out.
+        for secret in [django_settings.SECRET_KEY, *django_settings.SECRET_KEY_FALLBACKS]:
+            if constant_time_compare(mac, self._mac(data, secret)):
+                return True
+        return False
+
+    def encode(self, session: Dict[str, Any]) -> bytes:
+        payload = pack(session)
+        flags = 0
+        if len(payload) >= self.compress_min_size:
+            compressor = zlib.compressobj(self.compress_level, zlib.DEFLATED, _WBITS, _MEM_LEVEL)
+            compressed = compressor.compress(payload) + compressor.flush()
+            if len(compressed) < len(payload):
+                payload = compressed
+                flags |= _COMPRESSED
+        header = bytes((COMPACT_MAGIC, flags))
+        return header + self._mac(header + payload) + payload
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        if isinstance(data, str) or not data or data[0] != COMPACT_MAGIC:
+            return self.legacy.decode(data)
+        header, mac, payload = data[:2], data[2 : 2 + _MAC_SIZE], data[2 + _MAC_SIZE :]
+        if not self._verify(mac, header + payload):
+            raise signing.BadSignature("Session HMAC does not match")
+        if header[1] & _COMPRESSED:
+            payload = zlib.decompress(payload, _WBITS)
+        return unpack(payload)
+
+
+def get_codec(key_salt: str) -> SessionCodec:
+    return import_string(settings.SESSION_REDIS_CODEC)(key_salt)
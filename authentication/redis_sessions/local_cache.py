@@ -0,0 +1,148 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis
+
+from authentication.redis_sessions import settings
+from authentication.redis_sessions.pool import ServerRegistry, get_registry
+
+logger = logging.getLogger(__name__)
+
+POLL_TIMEOUT = 1.0
+RECONNECT_DELAY = 1.0
+
+
+class LocalSessionCache:
+    """
+    Bounded LRU of encoded session data, kept for at most ``ttl`` seconds.
+
+    Every worker subscribes to an invalidation channel on each session server
+    and drops a key as soon as another worker saves or deletes it. While any
+    subscription is down the cache is empty and unused, since invalidations
+    may have been missed.
+    """
+
+    def __init__(
+        self, registry: ServerRegistry, max_entries: int, ttl: float, channel: str
+    ) -> None:
+        self.registry = registry
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.channel = channel
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation, so a load that raced with one does not
+        # cache what it read.
+        self._epoch = 0
+        self._subscribed: Dict[str, bool] = {server.name: False for server in registry.servers}
+        self.hits = 0
+        self.misses = 0
+        for server in registry.servers:
+            threading.Thread(
+                target=self._listen,
+                args=(server.name, server.client),
+                name=f"session-invalidation-{server.name}",
+                daemon=True,
+            ).start()
+
+    @property
+    def active(self) -> bool:
+        return all(self._subscribed.values())
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    def get(self, stored_key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(stored_key)
+            if entry is None or entry[0] < time.monotonic() or not self.active:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(stored_key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, stored_key: str, data: bytes, epoch: int) -> None:
+        """Cache ``data`` read while the cache was at ``epoch``."""
+        with self._lock:
+            if epoch != self._epoch or not self.active:
+                return
+            self._entries[stored_key] = (time.monotonic() + self.ttl, data)
+            self._entries.move_to_end(stored_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, stored_key: str) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.pop(stored_key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _listen(self, name: str, client: redis.Redis) -> None:
+        while True:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                self._subscribed[name] = True
+                while True:
+                    # Poll rather than listen(): the session connections' short
+                    # socket timeout would otherwise end an idle subscription.
+                    message = pubsub.get_message(timeout=POLL_TIMEOUT)
+                    if message and message["type"] == "message":
+                        stored_key = message["data"].decode()
+                        # Written elsewhere: read it from the master for a while.
+                        self.registry.note_write(stored_key)
+                        self.invalidate(stored_key)
+            except Exception:
+                logger.warning("Session invalidation channel on %s lost", name, exc_info=True)
+            finally:
+                self._subscribed[name] = False
+                self.clear()
+                pubsub.close()
+            time.sleep(RECONNECT_DELAY)
+
+
+def publish_invalidation(client: redis.Redis, stored_keys: List[str]) -> None:
+    """Queue messages telling every worker to drop ``stored_keys`` (on a client or pipeline)."""
+    if settings.SESSION_REDIS_LOCAL_CACHE is None:
+        return
+    for stored_key in stored_keys:
+        client.publish(settings.SESSION_REDIS_LOCAL_CACHE_CHANNEL, stored_key)
+
+
+_local_cache: Optional[LocalSessionCache] = None
+_local_cache_lock = threading.Lock()
+
+
+def get_local_cache() -> Optional[LocalSessionCache]:
+    """The process-wide cache, or None when SESSION_REDIS['local_cache'] is unset."""
+    global _local_cache
+    if settings.SESSION_REDIS_LOCAL_CACHE is None:
+        return None
+    if _local_cache is None:
+        with _local_cache_lock:
+            if _local_cache is None:
+                _local_cache = LocalSessionCache(
+                    get_registry(),
+                    max_entries=settings.SESSION_REDIS_LOCAL_CACHE_MAX_ENTRIES,
+                    ttl=settings.SESSION_REDIS_LOCAL_CACHE_TTL,
+                    channel=settings.SESSION_REDIS_LOCAL_CACHE_CHANNEL,
+                )
+    return _local_cache
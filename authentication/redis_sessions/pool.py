@@ -0,0 +1,308 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import redis
+from django.core.exceptions import ImproperlyConfigured
+from redis.exceptions import ConnectionError, ResponseError
+from redis.sentinel import Sentinel, SentinelConnectionPool
+
+from authentication.redis_sessions import settings
+from authentication.redis_sessions.ring import HashRing
+
+
+class MeteredPoolMixin:
+    """Count checkouts, failures and connections in use for a connection pool."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self.checkouts = 0
+        self.failures = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+
+    def get_connection(self, *args: Any, **kwargs: Any):
+        try:
+            connection = super().get_connection(*args, **kwargs)
+        except ConnectionError:
+            with self._metrics_lock:
+                self.failures += 1
+            raise
+        with self._metrics_lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+        return connection
+
+    def release(self, connection) -> None:
+        super().release(connection)
+        with self._metrics_lock:
+            self.in_use = max(0, self.in_use - 1)
+
+
+class MeteredBlockingConnectionPool(MeteredPoolMixin, redis.BlockingConnectionPool):
+    pass
+
+
+class MeteredSentinelConnectionPool(MeteredPoolMixin, SentinelConnectionPool):
+    pass
+
+
+class SessionServer:
+    """
+    One configured Redis server: its pool and a client sharing that pool, plus
+    an optional client for reads from its replicas.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        client: redis.Redis,
+        weight: int = 1,
+        replica: Optional[redis.Redis] = None,
+    ) -> None:
+        self.name = name
+        self.client = client
+        self.weight = weight
+        self.replica = replica
+
+    @property
+    def pool(self):
+        return self.client.connection_pool
+
+    def stats(self) -> Dict[str, Any]:
+        pool = self.pool
+        return {
+            "name": self.name,
+            "weight": self.weight,
+            "max_connections": getattr(pool, "max_connections", None),
+            "in_use": getattr(pool, "in_use", None),
+            "peak_in_use": getattr(pool, "peak_in_use", None),
+            "checkouts": getattr(pool, "checkouts", None),
+            "failures": getattr(pool, "failures", None),
+        }
+
+    def health(self) -> Dict[str, Any]:
+        started = time.monotonic()
+        try:
+            self.client.ping()
+        except Exception as exc:
+            return {"name": self.name, "healthy": False, "error": str(exc)}
+        return {
+            "name": self.name,
+            "healthy": True,
+            "latency_ms": round((time.monotonic() - started) * 1000, 2),
+        }
+
+
+def _connection_kwargs() -> Dict[str, Any]:
+    return {
+        "socket_timeout": settings.SESSION_REDIS_SOCKET_TIMEOUT,
+        "retry_on_timeout": settings.SESSION_REDIS_RETRY_ON_TIMEOUT,
+        "health_check_interval": settings.SESSION_REDIS_HEALTH_CHECK_INTERVAL,
+    }
+
+
+def _pool_kwargs() -> Dict[str, Any]:
+    return {
+        "max_connections": settings.SESSION_REDIS_MAX_CONNECTIONS,
+        "timeout": settings.SESSION_REDIS_POOL_TIMEOUT,
+    }
+
+
+def _server_client(config: Dict[str, Any]) -> redis.Redis:
+    """Build a client with its own bounded pool for one server definition."""
+    if config.get("url"):
+        pool = MeteredBlockingConnectionPool.from_url(
+            config["url"], **_pool_kwargs(), **_connection_kwargs()
+        )
+    elif config.get("unix_domain_socket_path"):
+        pool = MeteredBlockingConnectionPool(
+            connection_class=redis.UnixDomainSocketConnection,
+            path=config["unix_domain_socket_path"],
+            db=config.get("db", 0),
+            password=config.get("password"),
+            **_pool_kwargs(),
+            **_connection_kwargs(),
+        )
+    else:
+        pool = MeteredBlockingConnectionPool(
+            host=config.get("host", "localhost"),
+            port=config.get("port", 6379),
+            db=config.get("db", 0),
+            password=config.get("password"),
+            **_pool_kwargs(),
+            **_connection_kwargs(),
+        )
+    return redis.Redis(connection_pool=pool)
+
+
+def _server_name(config: Dict[str, Any]) -> str:
+    """A display name for the server, without credentials."""
+    if config.get("url"):
+        url = urlsplit(config["url"])
+        port = f":{url.port}" if url.port else ""
+        return f"{url.scheme}://{url.hostname or ''}{port}{url.path}"
+    if config.get("unix_domain_socket_path"):
+        return f"unix://{config['unix_domain_socket_path']}/{config.get('db', 0)}"
+    return f"{config.get('host', 'localhost')}:{config.get('port', 6379)}/{config.get('db', 0)}"
+
+
+def _sentinel_clients() -> Tuple[redis.Redis, Optional[redis.Redis]]:
+    """The master client and, with replica reads enabled, a replica client."""
+
+    def sentinel(**extra: Any) -> Sentinel:
+        return Sentinel(
+            settings.SESSION_REDIS_SENTINEL_LIST,
+            db=settings.SESSION_REDIS_DB,
+            password=settings.SESSION_REDIS_PASSWORD,
+            **_connection_kwargs(),
+            **extra,
+        )
+
+    pool_kwargs = {
+        "connection_pool_class": MeteredSentinelConnectionPool,
+        "max_connections": settings.SESSION_REDIS_MAX_CONNECTIONS,
+    }
+
+    instance = sentinel(sentinel_kwargs={"password": settings.SESSION_REDIS_SENTINEL_PASSWORD})
+    # Check if the sentinels are configured with a password. If not, connect
+    # without one.
+    try:
+        instance.sentinel_masters()
+    except ResponseError:
+        instance = sentinel()
+    master = instance.master_for(settings.SESSION_REDIS_SENTINEL_MASTER_ALIAS, **pool_kwargs)
+    if not settings.SESSION_REDIS_SENTINEL_REPLICA_READS:
+        return master, None
+    # Round-robins over the replicas, falling back to the master if none are up.
+    replica = instance.slave_for(settings.SESSION_REDIS_SENTINEL_MASTER_ALIAS, **pool_kwargs)
+    return master, replica
+
+
+class RecentWrites:
+    """
+    Keys written in the last ``window`` seconds, which are read from the master
+    rather than a replica that may not have the write yet.
+    """
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        self._expires: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, stored_key: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._expires.pop(stored_key, None)
+            self._expires[stored_key] = now + self.window
+            # Entries are in expiry order, so expired ones are at the front.
+            while self._expires and next(iter(self._expires.values())) < now:
+                self._expires.popitem(last=False)
+
+    def __contains__(self, stored_key: str) -> bool:
+        expires = self._expires.get(stored_key)
+        return expires is not None and expires >= time.monotonic()
+
+
+class ServerRegistry:
+    """
+    The Redis servers sessions are stored on, built once per process from the
+    SESSION_REDIS settings. Each server has a single bounded connection pool
+    shared by all threads; the request path only looks servers up.
+    """
+
+    def __init__(self) -> None:
+        self.servers: List[SessionServer] = []
+        if settings.SESSION_REDIS_SENTINEL_LIST is not None:
+            master, replica = _sentinel_clients()
+            self.servers.append(SessionServer("sentinel", master, replica=replica))
+        elif settings.SESSION_REDIS_CONNECTION_OBJECT is not None:
+            self.servers.append(
+                SessionServer("connection_object", settings.SESSION_REDIS_CONNECTION_OBJECT)
+            )
+        elif settings.SESSION_REDIS_POOL is not None:
+            for config in settings.SESSION_REDIS_POOL:
+                self.servers.append(
+                    SessionServer(
+                        config.get("name") or _server_name(config),
+                        _server_client(config),
+                        config.get("weight", 1),
+                    )
+                )
+        else:
+            config = {
+                "url": settings.SESSION_REDIS_URL,
+                "unix_domain_socket_path": settings.SESSION_REDIS_UNIX_DOMAIN_SOCKET_PATH,
+                "host": settings.SESSION_REDIS_HOST,
+                "port": settings.SESSION_REDIS_PORT,
+                "db": settings.SESSION_REDIS_DB,
+                "password": settings.SESSION_REDIS_PASSWORD,
+            }
+            self.servers.append(SessionServer(_server_name(config), _server_client(config)))
+        if not any(server.weight for server in self.servers):
+            raise ImproperlyConfigured("At least one session Redis server needs a weight above 0.")
+        self.ring = HashRing(
+            [(server.name, server.weight, server) for server in self.servers],
+            vnodes=settings.SESSION_REDIS_VNODES,
+        )
+        self.recent_writes = RecentWrites(settings.SESSION_REDIS_SENTINEL_READ_YOUR_WRITES_WINDOW)
+
+    def server_for(self, session_key: Optional[str]) -> SessionServer:
+        if len(self.servers) == 1 or not session_key:
+            return self.servers[0]
+        return self.ring.get(session_key)
+
+    def client_for(self, session_key: Optional[str]) -> redis.Redis:
+        return self.server_for(session_key).client
+
+    def reader_for(self, session_key: Optional[str], stored_key: str) -> redis.Redis:
+        """
+        The client to read a session with: a replica if the server has them,
+        unless the session was written within the read-your-writes window.
+        """
+        server = self.server_for(session_key)
+        if server.replica is None or stored_key in self.recent_writes:
+            return server.client
+        return server.replica
+
+    def note_write(self, stored_key: str) -> None:
+        if any(server.replica is not None for server in self.servers):
+            self.recent_writes.add(stored_key)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [server.stats() for server in self.servers]
+
+    def health(self) -> List[Dict[str, Any]]:
+        return [server.health() for server in self.servers]
+
+    def disconnect(self) -> None:
+        for server in self.servers:
+            server.pool.disconnect()
+            if server.replica is not None:
+                server.replica.connection_pool.disconnect()
+
+
+_registry: Optional[ServerRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ServerRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ServerRegistry()
+    return _registry
+
+
+def reset_registry() -> None:
+    """Drop the registry (and its connections), e.g. after changing settings."""
+    global _registry
+    with _registry_lock:
+        if _registry is not None:
+            _registry.disconnect()
+        _registry = None
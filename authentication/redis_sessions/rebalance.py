@@ -0,0 +1,124 @@
+from typing import Callable, Dict, Iterable, List, Optional
+
+import redis
+from redis.exceptions import ResponseError
+
+from authentication.redis_sessions import settings
+from authentication.redis_sessions.pool import ServerRegistry
+from authentication.redis_sessions.user_index import INDEX_PREFIX
+
+REBALANCE_BATCH_SIZE = 500
+
+
+def _session_key(stored_key: bytes) -> str:
+    key = stored_key.decode()
+    prefix = settings.SESSION_REDIS_PREFIX
+    return key[len(prefix) + 1 :] if prefix else key
+
+
+def _is_index(stored_key: bytes) -> bool:
+    return _session_key(stored_key).startswith(INDEX_PREFIX)
+
+
+def rebalance_sessions(
+    registry: ServerRegistry,
+    extra_sources: Iterable[redis.Redis] = (),
+    delete: bool = True,
+    dry_run: bool = False,
+    batch_size: int = REBALANCE_BATCH_SIZE,
+    progress: Optional[Callable[[Dict[str, int]], None]] = None,
+) -> Dict[str, int]:
+    """
+    Move every session stored on a server the hash ring no longer assigns it
+    to onto its current owner, after a change in SESSION_REDIS POOL.
+
+    All configured servers are scanned, plus ``extra_sources`` (servers that
+    were removed from the pool and should be drained). Sessions are copied with
+    DUMP/RESTORE, keeping their remaining TTL; a session that already exists on
+    the target (written there after the change) is left alone. User indexes
+    are merged into the one on the target instead, so no session in either
+    is lost to logout everywhere. With ``delete`` the old copy is removed
+    once the new one is in place.
+    """
+    counts = {"scanned": 0, "moved": 0, "skipped": 0}
+    pattern = f"{settings.SESSION_REDIS_PREFIX}:*" if settings.SESSION_REDIS_PREFIX else "*"
+    sources: List[redis.Redis] = [server.client for server in registry.servers]
+    sources.extend(extra_sources)
+
+    for source in sources:
+        batch: List[bytes] = []
+        for stored_key in source.scan_iter(match=pattern, count=batch_size):
+            batch.append(stored_key)
+            if len(batch) >= batch_size:
+                _move_batch(registry, source, batch, counts, delete, dry_run)
+                batch = []
+                if progress:
+                    progress(counts)
+        if batch:
+            _move_batch(registry, source, batch, counts, delete, dry_run)
+            if progress:
+                progress(counts)
+    return counts
+
+
+def _move_batch(
+    registry: ServerRegistry,
+    source: redis.Redis,
+    keys: List[bytes],
+    counts: Dict[str, int],
+    delete: bool,
+    dry_run: bool,
+) -> None:
+    counts["scanned"] += len(keys)
+    misplaced = [key for key in keys if registry.client_for(_session_key(key)) is not source]
+    if not misplaced or dry_run:
+        counts["moved"] += len(misplaced)
+        return
+
+    # One round trip to read every misplaced session and its remaining TTL.
+    with source.pipeline(transaction=False) as pipe:
+        for key in misplaced:
+            pipe.dump(key)
+            pipe.pttl(key)
+        dumped = pipe.execute()
+
+    by_target: Dict[int, list] = {}
+    for i, key in enumerate(misplaced):
+        data, ttl = dumped[2 * i], dumped[2 * i + 1]
+        if data is None or ttl == -2:
+            # Expired or deleted since the scan.
+            continue
+        target = registry.client_for(_session_key(key))
+        by_target.setdefault(id(target), [target, []])[1].append((key, max(ttl, 0), data))
+
+    moved: List[bytes] = []
+    for target, entries in by_target.values():
+        indexes = [entry for entry in entries if _is_index(entry[0])]
+        sessions = [entry for entry in entries if not _is_index(entry[0])]
+        if indexes:
+            # Restore next to the target's own set and take the union, in one
+            # transaction so the temporary copy is never seen.
+            with target.pipeline(transaction=True) as pipe:
+                for key, _, data in indexes:
+                    merge_key = key + b":rebalance"
+                    pipe.restore(merge_key, 0, data, replace=True)
+                    pipe.sunionstore(key, [key, merge_key])
+                    pipe.delete(merge_key)
+                pipe.execute()
+            moved.extend(key for key, _, _ in indexes)
+        if not sessions:
+            continue
+        with target.pipeline(transaction=False) as pipe:
+            for key, ttl, data in sessions:
+                pipe.restore(key, ttl, data)
+            results = pipe.execute(raise_on_error=False)
+        for (key, _, _), result in zip(sessions, results):
+            if isinstance(result, ResponseError):
+                # BUSYKEY: the session was already written on its new server.
+                counts["skipped"] += 1
+            else:
+                moved.append(key)
+
+    counts["moved"] += len(moved)
+    if delete and moved:
+        source.delete(*moved)
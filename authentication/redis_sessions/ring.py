@@ -0,0 +1,32 @@
+import hashlib
+from bisect import bisect
+from typing import Generic, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing(Generic[T]):
+    """
+    Consistent-hash ring. Every node is placed at ``vnodes * weight`` points
+    derived from its name, and a key belongs to the first point after its own
+    hash. Adding, removing or reweighting one node of N only moves about
+    1/N of the keys, and node order does not matter.
+    """
+
+    def __init__(self, nodes: Sequence[Tuple[str, int, T]], vnodes: int = 160) -> None:
+        points: List[Tuple[int, int]] = []
+        self.nodes = [node for _, _, node in nodes]
+        for index, (name, weight, _) in enumerate(nodes):
+            for replica in range(vnodes * weight):
+                points.append((_hash(f"{name}#{replica}"), index))
+        points.sort()
+        self._hashes = [point for point, _ in points]
+        self._owners = [index for _, index in points]
+
+    def get(self, key: str) -> T:
+        position = bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self.nodes[self._owners[position]]
@@ -1,152 +1,196 @@
 # type: ignore
 
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, Optional, Tuple
 
 import redis
-from django.contrib.sessions.backends.base import CreateError, SessionBase
-from django.utils.encoding import force_str
-from redis.exceptions import ResponseError
-
-from authentication.redis_sessions import settings
-
-
-class RedisServer:
-    __redis: Dict[str, Any] = {}
-
-    def __init__(self, session_key: str) -> None:
-        self.session_key = session_key
-        self.connection_key = ""
-
-        if settings.SESSION_REDIS_SENTINEL_LIST is not None:
-            self.connection_type = "sentinel"
-        elif settings.SESSION_REDIS_CONNECTION_OBJECT is not None:
-            self.connection_type = "connection_object"
-        else:
-            if settings.SESSION_REDIS_POOL is not None:
-                server_key, server = self.get_server(session_key, settings.SESSION_REDIS_POOL)
-                self.connection_key = str(server_key)
-                settings.SESSION_REDIS_HOST = getattr(server, "host", "localhost")
-                settings.SESSION_REDIS_PORT = getattr(server, "port", 6379)
-                settings.SESSION_REDIS_DB = getattr(server, "db", 0)
-                settings.SESSION_REDIS_PASSWORD = getattr(server, "password", None)
-                settings.SESSION_REDIS_URL = getattr(server, "url", None)
-                settings.SESSION_REDIS_UNIX_DOMAIN_SOCKET_PATH = getattr(
-                    server, "unix_domain_socket_path", None
-                )
+from asgiref.sync import sync_to_async
+from django.conf import settings as django_settings
+from django.contrib.auth import SESSION_KEY
+from django.contrib.sessions.backends.base import (
+    VALID_KEY_CHARS,
+    CreateError,
+    SessionBase,
+    UpdateError,
+)
+from django.contrib.sessions.backends.cache import KEY_PREFIX as LEGACY_KEY_PREFIX
+from django.core import signing
+from django.core.cache import caches
+from django.utils.crypto import get_random_string
 
-            if settings.SESSION_REDIS_URL is not None:
-                self.connection_type = "redis_url"
-            elif settings.SESSION_REDIS_UNIX_DOMAIN_SOCKET_PATH is not None:
-                self.connection_type = "redis_unix_url"
-            elif settings.SESSION_REDIS_HOST is not None:
-                self.connection_type = "redis_host"
-
-        self.connection_key += self.connection_type
-
-    def get_server(self, key: str, servers_pool: Any) -> Any:
-        total_weight = sum([row.get("weight", 1) for row in servers_pool])
-        pos = 0
-        for i in range(3, -1, -1):
-            pos = pos * 2**8 + ord(key[i])
-        pos = pos % total_weight
-
-        pool = iter(servers_pool)
-        server = next(pool)
-        server_key = 0
-        i = 0
-        while i < total_weight:
-            if i <= pos < (i + server.get("weight", 1)):
-                return server_key, server
-            i += server.get("weight", 1)
-            server = next(pool)
-            server_key += 1
-
-        return
-
-    def get(self) -> redis.Redis:
-        if self.connection_key in self.__redis:
-            return self.__redis[self.connection_key]
-
-        if self.connection_type == "connection_object":
-            self.__redis[self.connection_key] = settings.SESSION_REDIS_CONNECTION_OBJECT
-        elif self.connection_type == "sentinel":
-            from redis.sentinel import Sentinel
-
-            sentinel = Sentinel(
-                settings.SESSION_REDIS_SENTINEL_LIST,
-                socket_timeout=settings.SESSION_REDIS_SOCKET_TIMEOUT,
-                retry_on_timeout=settings.SESSION_REDIS_RETRY_ON_TIMEOUT,
-                db=getattr(settings, "SESSION_REDIS_DB", 0),
-                password=getattr(settings, "SESSION_REDIS_PASSWORD", None),
-                sentinel_kwargs={
-                    "password": getattr(settings, "SESSION_REDIS_SENTINEL_PASSWORD", None)
-                },
-            )
-            self.__redis[self.connection_key] = sentinel.master_for(
-                settings.SESSION_REDIS_SENTINEL_MASTER_ALIAS
-            )
-            # check if redis server is configured with sentinel password.
-            # If not, then connect without password
-            try:
-                sentinel.sentinel_masters()
-            except ResponseError:
-                self.__redis[self.connection_key] = Sentinel(
-                    settings.SESSION_REDIS_SENTINEL_LIST,
-                    socket_timeout=settings.SESSION_REDIS_SOCKET_TIMEOUT,
-                    retry_on_timeout=settings.SESSION_REDIS_RETRY_ON_TIMEOUT,
-                    db=getattr(settings, "SESSION_REDIS_DB", 0),
-                    password=getattr(settings, "SESSION_REDIS_PASSWORD", None),
-                ).master_for(settings.SESSION_REDIS_SENTINEL_MASTER_ALIAS)
-        elif self.connection_type == "redis_url":
-            self.__redis[self.connection_key] = redis.StrictRedis.from_url(
-                settings.SESSION_REDIS_URL, socket_timeout=settings.SESSION_REDIS_SOCKET_TIMEOUT
-            )
-        elif self.connection_type == "redis_host":
-            self.__redis[self.connection_key] = redis.StrictRedis(
-                host=settings.SESSION_REDIS_HOST,
-                port=settings.SESSION_REDIS_PORT,
-                socket_timeout=settings.SESSION_REDIS_SOCKET_TIMEOUT,
-                retry_on_timeout=settings.SESSION_REDIS_RETRY_ON_TIMEOUT,
-                db=settings.SESSION_REDIS_DB,
-                password=settings.SESSION_REDIS_PASSWORD,
-            )
-        elif self.connection_type == "redis_unix_url":
-            self.__redis[self.connection_key] = redis.StrictRedis(
-                unix_socket_path=settings.SESSION_REDIS_UNIX_DOMAIN_SOCKET_PATH,
-                socket_timeout=settings.SESSION_REDIS_SOCKET_TIMEOUT,
-                retry_on_timeout=settings.SESSION_REDIS_RETRY_ON_TIMEOUT,
-                db=settings.SESSION_REDIS_DB,
-                password=settings.SESSION_REDIS_PASSWORD,
-            )
-
-        return self.__redis[self.connection_key]
+from authentication.redis_sessions import settings, user_index
+from authentication.redis_sessions.async_pool import get_async_registry
+from authentication.redis_sessions.codec import get_codec
+from authentication.redis_sessions.local_cache import get_local_cache, publish_invalidation
+from authentication.redis_sessions.pool import get_registry
 
 
 class SessionStore(SessionBase):
     """
-    Implements Redis database session store.
+    Implements Redis database session store. The ``a``-prefixed methods use
+    ``redis.asyncio`` clients with the same key layout, placement and pool
+    limits, so async views never block the event loop on Redis.
     """
 
     def __init__(self, session_key: Any = None) -> None:
         super(SessionStore, self).__init__(session_key)
-        self.server = RedisServer(session_key).get()
+        self.registry = get_registry()
+        self.codec = get_codec(self.key_salt)
+
+    @property
+    def server(self) -> redis.Redis:
+        return self.registry.client_for(self.session_key)
+
+    def server_for(self, session_key: str) -> redis.Redis:
+        return self.registry.client_for(session_key)
 
     def load(self) -> Dict[str, Any]:
+        # With sliding expiry (SESSION_SAVE_EVERY_REQUEST), GETEX reads the
+        # session and renews its TTL in the same command, so saving an
+        # unmodified session afterwards costs nothing.
+        sliding = django_settings.SESSION_SAVE_EVERY_REQUEST and settings.SESSION_REDIS_GETEX
+        local_cache = get_local_cache()
+        renewed = False
         try:
             session_key = self._get_or_create_session_key()
             real_stored_session_key = self.get_real_stored_key(session_key)
-            session_data = self.server.get(real_stored_session_key)
+            # A locally cached copy was read at most the cache TTL ago, which
+            # is as good as reading it again.
+            session_data = local_cache.get(real_stored_session_key) if local_cache else None
+            if session_data is not None:
+                renewed = sliding and self.registry.server_for(session_key).replica is None
+            else:
+                epoch = local_cache.epoch if local_cache else 0
+                session_data, renewed = self._fetch(session_key, real_stored_session_key, sliding)
+                if session_data is None and settings.SESSION_REDIS_LEGACY_CACHE:
+                    session_data = self._migrate_legacy(session_key)
+                if local_cache and session_data is not None:
+                    local_cache.set(real_stored_session_key, session_data, epoch)
+        except Exception:
+            session_data = None
+        return self._loaded(session_data, renewed)
+
+    async def aload(self) -> Dict[str, Any]:
+        sliding = django_settings.SESSION_SAVE_EVERY_REQUEST and settings.SESSION_REDIS_GETEX
+        local_cache = get_local_cache()
+        renewed = False
+        try:
+            session_key = await self._aget_or_create_session_key()
+            real_stored_session_key = self.get_real_stored_key(session_key)
+            session_data = local_cache.get(real_stored_session_key) if local_cache else None
+            if session_data is not None:
+                renewed = sliding and self.registry.server_for(session_key).replica is None
+            else:
+                epoch = local_cache.epoch if local_cache else 0
+                session_data, renewed = await self._afetch(
+                    session_key, real_stored_session_key, sliding
+                )
+                if session_data is None and settings.SESSION_REDIS_LEGACY_CACHE:
+                    session_data = await sync_to_async(self._migrate_legacy)(session_key)
+                if local_cache and session_data is not None:
+                    local_cache.set(real_stored_session_key, session_data, epoch)
         except Exception:
             session_data = None
+        return self._loaded(session_data, renewed)
 
+    def _loaded(self, session_data: Optional[bytes], renewed: bool) -> Dict[str, Any]:
         if session_data is not None:
-            return self.decode(force_str(session_data))
+            session = self.decode(session_data)
+            self._stored = True
+            # A custom expiry (set_expiry) still needs its own EXPIRE on save.
+            self._expiry_renewed = renewed and "_session_expiry" not in session
+            self._indexed_user = session.get(SESSION_KEY)
+            return session
 
         self._session_key = None
         return {}
 
+    def _fetch(
+        self, session_key: str, stored_key: str, sliding: bool
+    ) -> Tuple[Optional[bytes], bool]:
+        """Read the stored session; also return whether its TTL was renewed."""
+        master = self.server_for(session_key)
+        reader = self.registry.reader_for(session_key, stored_key)
+        if reader is not master:
+            # Replicas are read-only, so no GETEX; save() renews the TTL.
+            session_data = reader.get(stored_key)
+            if session_data is not None:
+                return session_data, False
+            # Possibly created on the master after the window: check there.
+        if sliding:
+            return master.getex(stored_key, ex=django_settings.SESSION_COOKIE_AGE), True
+        return master.get(stored_key), False
+
+    async def _afetch(
+        self, session_key: str, stored_key: str, sliding: bool
+    ) -> Tuple[Optional[bytes], bool]:
+        registry = await get_async_registry()
+        master = registry.client_for(session_key)
+        reader = registry.reader_for(session_key, stored_key)
+        if reader is not master:
+            session_data = await reader.get(stored_key)
+            if session_data is not None:
+                return session_data, False
+        if sliding:
+            return await master.getex(stored_key, ex=django_settings.SESSION_COOKIE_AGE), True
+        return await master.get(stored_key), False
+
+    def _migrate_legacy(self, session_key: str) -> Optional[bytes]:
+        """
+        Move a session stored by Django's cache session engine into Redis and
+        its user's index, and return it encoded; None if there is none.
+        """
+        legacy_cache = caches[settings.SESSION_REDIS_LEGACY_CACHE]
+        legacy_key = LEGACY_KEY_PREFIX + session_key
+        session = legacy_cache.get(legacy_key)
+        if session is None:
+            return None
+        data = self.encode(session)
+        expiry_age = self.get_expiry_age(expiry=session.get("_session_expiry"))
+        server = self.server_for(session_key)
+        if server.set(self.get_real_stored_key(session_key), data, ex=expiry_age, nx=True):
+            self._index(self.registry, session, server, server)
+        legacy_cache.delete(legacy_key)
+        return data
+
+    def encode(self, session_dict: Dict[str, Any]) -> bytes:
+        return self.codec.encode(session_dict)
+
+    def decode(self, session_data: bytes) -> Dict[str, Any]:
+        try:
+            return self.codec.decode(session_data)
+        except signing.BadSignature:
+            logger = logging.getLogger("django.security.SuspiciousSession")
+            logger.warning("Session data corrupted")
+        except Exception:
+            # Truncated or otherwise unreadable data: start an empty session.
+            pass
+        return {}
+
     def exists(self, session_key) -> bool:
-        return self.server.exists(self.get_real_stored_key(session_key))
+        real_stored_session_key = self.get_real_stored_key(session_key)
+        reader = self.registry.reader_for(session_key, real_stored_session_key)
+        if reader.exists(real_stored_session_key):
+            return True
+        master = self.server_for(session_key)
+        return reader is not master and bool(master.exists(real_stored_session_key))
+
+    async def aexists(self, session_key) -> bool:
+        registry = await get_async_registry()
+        real_stored_session_key = self.get_real_stored_key(session_key)
+        reader = registry.reader_for(session_key, real_stored_session_key)
+        if await reader.exists(real_stored_session_key):
+            return True
+        master = registry.client_for(session_key)
+        return reader is not master and bool(await master.exists(real_stored_session_key))
+
+    def _get_new_session_key(self) -> str:
+        # Collisions are caught by SET NX when the session is created, so skip
+        # the EXISTS round trip the base class makes for every new key.
+        return get_random_string(32, VALID_KEY_CHARS)
+
+    async def _aget_new_session_key(self) -> str:
+        return self._get_new_session_key()
 
     def create(self) -> None:
         while True:
@@ -160,34 +204,155 @@ class SessionStore(SessionBase):
             self.modified = True
             return
 
+    async def acreate(self) -> None:
+        while True:
+            self._session_key = await self._aget_new_session_key()
+
+            try:
+                await self.asave(must_create=True)
+            except CreateError:
+                continue
+            self.modified = True
+            return
+
     def save(self, must_create=False) -> None:
         if self.session_key is None:
             return self.create()
-        if must_create and self.exists(self._get_or_create_session_key()):
-            raise CreateError
-        data = self.encode(self._get_session(no_load=must_create))
-        if redis.VERSION[0] >= 2:
-            self.server.setex(
-                self.get_real_stored_key(self._get_or_create_session_key()),
-                self.get_expiry_age(),
-                data,
-            )
-        else:
-            self.server.set(self.get_real_stored_key(self._get_or_create_session_key()), data)
-            self.server.expire(
-                self.get_real_stored_key(self._get_or_create_session_key()), self.get_expiry_age()
-            )
+        session = self._get_session(no_load=must_create)
+        real_stored_session_key = self.get_real_stored_key(self._get_or_create_session_key())
+        server = self.server_for(self.session_key)
+
+        if must_create:
+            # SET NX EX: create the key only if it is free, in one atomic command.
+            if not server.set(
+                real_stored_session_key, self.encode(session), ex=self.get_expiry_age(), nx=True
+            ):
+                raise CreateError
+            self.registry.note_write(real_stored_session_key)
+            # A new key (cycle_key keeps the user) always goes into the index.
+            self._indexed_user = None
+            self._index(self.registry, session, server, server)
+            self._stored = True
+            return
+
+        if not self.modified and getattr(self, "_stored", False):
+            # Unchanged since it was loaded: only the expiry needs extending.
+            # EXPIRE does nothing if the session was deleted meanwhile (e.g. by
+            # a logout elsewhere), rather than bringing it back.
+            if not getattr(self, "_expiry_renewed", False):
+                server.expire(real_stored_session_key, self.get_expiry_age())
+            return
+
+        data = self.encode(session)
+        self._invalidate_local(real_stored_session_key)
+        # Other workers drop their cached copy in the same round trip as the
+        # SET. XX: a session deleted meanwhile (e.g. by a logout everywhere)
+        # is not brought back by a request that loaded it before.
+        with server.pipeline(transaction=False) as pipe:
+            pipe.set(real_stored_session_key, data, ex=self.get_expiry_age(), xx=True)
+            publish_invalidation(pipe, [real_stored_session_key])
+            self._index(self.registry, session, server, pipe)
+            updated = pipe.execute()[0]
+        if not updated:
+            raise UpdateError
+        self._stored = True
+
+    async def asave(self, must_create=False) -> None:
+        if self.session_key is None:
+            return await self.acreate()
+        session = await self._aget_session(no_load=must_create)
+        real_stored_session_key = self.get_real_stored_key(await self._aget_or_create_session_key())
+        server = (await get_async_registry()).client_for(self.session_key)
+        expiry_age = await self.aget_expiry_age()
+
+        if must_create:
+            if not await server.set(
+                real_stored_session_key, self.encode(session), ex=expiry_age, nx=True
+            ):
+                raise CreateError
+            self.registry.note_write(real_stored_session_key)
+            self._indexed_user = None
+            if session.get(SESSION_KEY) is not None:
+                await self._index(await get_async_registry(), session, server, server)
+            self._stored = True
+            return
+
+        if not self.modified and getattr(self, "_stored", False):
+            if not getattr(self, "_expiry_renewed", False):
+                await server.expire(real_stored_session_key, expiry_age)
+            return
+
+        data = self.encode(session)
+        self._invalidate_local(real_stored_session_key)
+        async with server.pipeline(transaction=False) as pipe:
+            pipe.set(real_stored_session_key, data, ex=expiry_age, xx=True)
+            publish_invalidation(pipe, [real_stored_session_key])
+            added = self._index(await get_async_registry(), session, server, pipe)
+            if added is not None and added is not pipe:
+                await added
+            updated = (await pipe.execute())[0]
+        if not updated:
+            raise UpdateError
+        self._stored = True
+
+    def _index(self, registry: Any, session: Dict[str, Any], server: Any, pipe: Any) -> Any:
+        """
+        Add an authenticated session to its user's index, so that
+        ``delete_user_sessions`` can find it. Returns the queued or issued
+        command (a coroutine on an asyncio client).
+
+        Only done when the session is created or logged in, never for a
+        session loaded as that user already: a request still in flight after
+        its session was deleted must not put it back into the index.
+        """
+        user_id = session.get(SESSION_KEY)
+        if user_id is None or user_id == getattr(self, "_indexed_user", None):
+            return None
+        self._indexed_user = user_id
+        target = user_index.index_client_for(registry, str(user_id), server, pipe)
+        return target.sadd(
+            user_index.stored_key(user_index.index_name(str(user_id))), self.session_key
+        )
+
+    def _invalidate_local(self, stored_key: str) -> None:
+        self.registry.note_write(stored_key)
+        local_cache = get_local_cache()
+        if local_cache:
+            local_cache.invalidate(stored_key)
 
     def delete(self, session_key=None) -> None:
         if session_key is None:
             if self.session_key is None:
                 return
             session_key = self.session_key
-        self.server.delete(self.get_real_stored_key(session_key))
+        real_stored_session_key = self.get_real_stored_key(session_key)
+        self._invalidate_local(real_stored_session_key)
+        with self.server_for(session_key).pipeline(transaction=False) as pipe:
+            pipe.delete(real_stored_session_key)
+            publish_invalidation(pipe, [real_stored_session_key])
+            pipe.execute()
+
+    async def adelete(self, session_key=None) -> None:
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+        real_stored_session_key = self.get_real_stored_key(session_key)
+        self._invalidate_local(real_stored_session_key)
+        server = (await get_async_registry()).client_for(session_key)
+        async with server.pipeline(transaction=False) as pipe:
+            pipe.delete(real_stored_session_key)
+            publish_invalidation(pipe, [real_stored_session_key])
+            await pipe.execute()
 
     @classmethod
     def clear_expired(cls) -> None:
-        pass
+        # Sessions expire on their own TTL; only the user indexes need pruning.
+        user_index.prune_indexes(get_registry())
+
+    @classmethod
+    async def aclear_expired(cls) -> None:
+        await sync_to_async(cls.clear_expired)()
 
     def get_real_stored_key(self, session_key: str) -> str:
         """Return the real key name in redis storage
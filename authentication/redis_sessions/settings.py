@@ -14,12 +14,40 @@ SESSION_REDIS_UNIX_DOMAIN_SOCKET_PATH = SESSION_REDIS.get("unix_domain_socket_pa
 SESSION_REDIS_URL = SESSION_REDIS.get("url", None)
 SESSION_REDIS_SENTINEL_PASSWORD = getattr(settings, "SESSION_REDIS_SENTINEL_PASSWORD", "")
 SESSION_REDIS_SENTINEL_KWARGS = SESSION_REDIS.get("sentinel_kwargs", None)
+# Connection pool limits, per server: at most max_connections connections,
+# waiting up to pool_timeout seconds for a free one. Idle connections are
+# pinged before reuse after health_check_interval seconds.
+SESSION_REDIS_MAX_CONNECTIONS = SESSION_REDIS.get("max_connections", 50)
+SESSION_REDIS_POOL_TIMEOUT = SESSION_REDIS.get("pool_timeout", 1)
+SESSION_REDIS_HEALTH_CHECK_INTERVAL = SESSION_REDIS.get("health_check_interval", 30)
+# Renew the TTL while loading with GETEX (Redis >= 6.2) when
+# SESSION_SAVE_EVERY_REQUEST is on; disable for older servers.
+SESSION_REDIS_GETEX = SESSION_REDIS.get("getex", True)
+# How sessions are serialized: CompactCodec (binary, compressed from
+# compress_min_size bytes up) or DjangoCodec (Django's signed JSON). Both
+# read entries written by DjangoCodec.
+SESSION_REDIS_CODEC = SESSION_REDIS.get("codec", "authentication.redis_sessions.codec.CompactCodec")
+SESSION_REDIS_COMPRESS_MIN_SIZE = SESSION_REDIS.get("compress_min_size", 256)
+SESSION_REDIS_COMPRESS_LEVEL = SESSION_REDIS.get("compress_level", 6)
+# Optional per-process cache of loaded sessions, e.g.
+# {"max_entries": 10000, "ttl": 5, "channel": "sessions:invalidate"}.
+# Workers publish saved and deleted keys on the channel to keep it coherent.
+SESSION_REDIS_LOCAL_CACHE = SESSION_REDIS.get("local_cache", None)
+_LOCAL_CACHE = SESSION_REDIS_LOCAL_CACHE or {}
+SESSION_REDIS_LOCAL_CACHE_MAX_ENTRIES = _LOCAL_CACHE.get("max_entries", 10000)
+SESSION_REDIS_LOCAL_CACHE_TTL = _LOCAL_CACHE.get("ttl", 5)
+SESSION_REDIS_LOCAL_CACHE_CHANNEL = _LOCAL_CACHE.get("channel", "sessions:invalidate")
+# Cache alias Django's cache session engine kept sessions in. A session
+# found only there is moved into Redis when first loaded, so switching
+# engines logs nobody out.
+SESSION_REDIS_LEGACY_CACHE = SESSION_REDIS.get("legacy_cache", None)
 
 
 """
 Should be on the format:
 [
     {
+        'name': 'sessions-2',  # optional, identifies the server on the hash ring
         'host': 'localhost2',
         'port': 6379,
         'db': 0,
@@ -40,7 +68,18 @@ Should be on the format:
 ]
 """
 SESSION_REDIS_POOL = SESSION_REDIS.get("POOL", None)
+# Points per unit of weight each pool server gets on the consistent-hash ring.
+SESSION_REDIS_VNODES = SESSION_REDIS.get("vnodes", 160)
 
 # should be on the format [(host, port), (host, port), (host, port)]
 SESSION_REDIS_SENTINEL_LIST = getattr(settings, "SESSION_REDIS_SENTINEL_LIST", None)
 SESSION_REDIS_SENTINEL_MASTER_ALIAS = getattr(settings, "SESSION_REDIS_SENTINEL_MASTER_ALIAS", None)
+# Load sessions from the replicas while writes go to the master. A session
+# written within the window (on this worker, or by any worker when the local
+# cache's invalidation channel is on) is read from the master instead.
+SESSION_REDIS_SENTINEL_REPLICA_READS = getattr(
+    settings, "SESSION_REDIS_SENTINEL_REPLICA_READS", False
+)
+SESSION_REDIS_SENTINEL_READ_YOUR_WRITES_WINDOW = getattr(
+    settings, "SESSION_REDIS_SENTINEL_READ_YOUR_WRITES_WINDOW", 5
+)
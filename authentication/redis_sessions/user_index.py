@@ -0,0 +1,116 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings as django_settings
+from django.core.exceptions import ImproperlyConfigured
+
+from authentication.redis_sessions import settings
+from authentication.redis_sessions.local_cache import get_local_cache, publish_invalidation
+from authentication.redis_sessions.pool import ServerRegistry, get_registry
+
+SESSION_ENGINE = "authentication.redis_sessions.session"
+INDEX_PREFIX = "user:"
+PRUNE_BATCH_SIZE = 500
+
+
+def is_enabled() -> bool:
+    """Sessions are only indexed per user by the Redis session engine."""
+    return django_settings.SESSION_ENGINE == SESSION_ENGINE
+
+
+def stored_key(name: str) -> str:
+    prefix = settings.SESSION_REDIS_PREFIX
+    return f"{prefix}:{name}" if prefix else name
+
+
+def index_name(user_id: str) -> str:
+    """
+    The per-user set of session keys. It is placed on the hash ring under this
+    name like a session, which never contains a colon.
+    """
+    return f"{INDEX_PREFIX}{user_id}"
+
+
+def index_client_for(registry: Any, user_id: str, server: Any, pipe: Any) -> Any:
+    """
+    Where to add to ``user_id``'s index: ``pipe`` when the index lives on the
+    session's ``server``, so it costs no extra round trip, else its own client.
+    Works for the sync and the asyncio registry alike.
+    """
+    index_client = registry.client_for(index_name(user_id))
+    return pipe if index_client is server else index_client
+
+
+def _delete_sessions(registry: ServerRegistry, session_keys: Iterable[str]) -> int:
+    """Delete sessions on whichever servers hold them, one pipeline per server."""
+    by_server: Dict[int, list] = {}
+    for session_key in session_keys:
+        client = registry.client_for(session_key)
+        by_server.setdefault(id(client), [client, []])[1].append(stored_key(session_key))
+
+    local_cache = get_local_cache()
+    deleted = 0
+    for client, keys in by_server.values():
+        for key in keys:
+            registry.note_write(key)
+            if local_cache:
+                local_cache.invalidate(key)
+        with client.pipeline(transaction=False) as pipe:
+            pipe.delete(*keys)
+            publish_invalidation(pipe, keys)
+            deleted += pipe.execute()[0]
+    return deleted
+
+
+def delete_user_sessions(user_id: str, keep_session_key: Optional[str] = None) -> int:
+    """
+    Log ``user_id`` out everywhere (except ``keep_session_key``) by deleting
+    the sessions in their index. Returns the number of sessions deleted.
+    """
+    if not is_enabled():
+        raise ImproperlyConfigured(
+            f"Deleting a user's sessions needs SESSION_ENGINE = {SESSION_ENGINE!r}."
+        )
+    registry = get_registry()
+    name = index_name(str(user_id))
+    index_client = registry.client_for(name)
+    session_keys = [key.decode() for key in index_client.smembers(stored_key(name))]
+    session_keys = [key for key in session_keys if key != keep_session_key]
+    if not session_keys:
+        return 0
+    deleted = _delete_sessions(registry, session_keys)
+    index_client.srem(stored_key(name), *session_keys)
+    return deleted
+
+
+def prune_indexes(registry: ServerRegistry) -> Dict[str, int]:
+    """
+    Drop the keys of expired sessions from every user index (Redis removes a
+    set once it is empty). The indexes have no TTL of their own, since sliding
+    expiry can keep a session alive without rewriting it.
+    """
+    counts = {"indexes": 0, "pruned": 0}
+    pattern = stored_key(f"{INDEX_PREFIX}*")
+    for server in registry.servers:
+        for index_key in server.client.scan_iter(match=pattern, count=PRUNE_BATCH_SIZE):
+            counts["indexes"] += 1
+            session_keys = [key.decode() for key in server.client.smembers(index_key)]
+            dead = _missing_sessions(registry, session_keys)
+            if dead:
+                server.client.srem(index_key, *dead)
+                counts["pruned"] += len(dead)
+    return counts
+
+
+def _missing_sessions(registry: ServerRegistry, session_keys: List[str]) -> List[str]:
+    by_server: Dict[int, list] = {}
+    for session_key in session_keys:
+        client = registry.client_for(session_key)
+        by_server.setdefault(id(client), [client, []])[1].append(session_key)
+
+    missing = []
+    for client, keys in by_server.values():
+        with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.exists(stored_key(key))
+            missing.extend(key for key, found in zip(keys, pipe.execute()) if not found)
+    return missing
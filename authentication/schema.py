@@ -1,6 +1,6 @@
 # users/schema.py
 from ninja import Schema
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 class LoginInput(Schema):
@@ -44,3 +44,36 @@ class CurrentUserOut(Schema):
 # Wrapper schema so the endpoint always returns a 200 response.
 class CurrentUserResponse(Schema):
     user: Optional[CurrentUserOut] = None
+
+# Connection pool usage of one session Redis server.
+class SessionPoolStats(Schema):
+    name: str
+    weight: int
+    max_connections: Optional[int] = None
+    in_use: Optional[int] = None
+    peak_in_use: Optional[int] = None
+    checkouts: Optional[int] = None
+    failures: Optional[int] = None
+    healthy: Optional[bool] = None
+    latency_ms: Optional[float] = None
+    error: Optional[str] = None
+
+# Hit counts of this worker's in-process session cache.
+class LocalSessionCacheStats(Schema):
+    active: bool
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
+
+class SessionPoolsResponse(Schema):
+    servers: List[SessionPoolStats]
+    local_cache: Optional[LocalSessionCacheStats] = None
+
+# Login attempt counters of the login throttle.
+class LoginThrottleStats(Schema):
+    allowed: int
+    succeeded: int
+    throttled_ip: int
+    throttled_email: int
+    errors: int
@@ -0,0 +1,100 @@
+import os
+import select
+import socket
+import socketserver
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+from unittest import mock
+
+from fakeredis import FakeAsyncRedis, FakeConnection, TcpFakeServer
+
+from authentication.redis_sessions import async_pool, benchmark
+
+# django-redis caches on an in-process fakeredis, for the login throttle and
+# the /auth/me projection.
+FAKE_REDIS_CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://fakeredis/0",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "CONNECTION_POOL_KWARGS": {"connection_class": FakeConnection},
+        },
+    },
+}
+
+
+class _UnixForwarder(socketserver.BaseRequestHandler):
+    """Relay one unix socket connection to the fake server's TCP port."""
+
+    server: "_UnixForwardingServer"
+
+    def handle(self) -> None:
+        with socket.create_connection(self.server.target) as upstream:
+            peers = {self.request: upstream, upstream: self.request}
+            while True:
+                readable, _, _ = select.select(list(peers), [], [])
+                for sock in readable:
+                    data = sock.recv(65536)
+                    if not data:
+                        return
+                    peers[sock].sendall(data)
+
+
+class _UnixForwardingServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, target: Any) -> None:
+        self.target = target
+        super().__init__(path, _UnixForwarder)
+
+
+def _serve(server: socketserver.BaseServer) -> None:
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+
+@contextmanager
+def fake_redis_server() -> Iterator[Dict[str, Any]]:
+    """
+    A fakeredis server on a free TCP port, also reachable through a unix
+    socket. Yields its address in the shape ``benchmark.local_server`` does.
+    """
+    server = TcpFakeServer(("127.0.0.1", 0))
+    _serve(server)
+    with tempfile.TemporaryDirectory() as directory:
+        unix_socket = os.path.join(directory, "redis.sock")
+        forwarder = _UnixForwardingServer(unix_socket, server.server_address)
+        _serve(forwarder)
+        try:
+            yield {
+                "host": "127.0.0.1",
+                "port": server.server_address[1],
+                "unix_socket": unix_socket,
+            }
+        finally:
+            forwarder.shutdown()
+            forwarder.server_close()
+            server.shutdown()
+            server.server_close()
+
+
+def session_settings(overrides: Dict[str, Any]):
+    """Point the session store at one benchmark path, isolated from optional features."""
+    return benchmark.override_settings(**{**benchmark.base_overrides(), **overrides})
+
+
+def fake_session_redis():
+    """Store sessions in a fresh in-process fakeredis."""
+    [(_, overrides)] = benchmark.in_process_paths()
+    return session_settings(overrides)
+
+
+def fake_async_clients():
+    """Give the asyncio registry fakeredis clients on the in-process servers."""
+
+    def client(server: Any) -> FakeAsyncRedis:
+        return FakeAsyncRedis(server=server.client.connection_pool.connection_kwargs["server"])
+
+    return mock.patch.object(async_pool, "_async_client", client)
@@ -0,0 +1,90 @@
+from django.contrib.auth import get_user_model
+from django.test import Client, TestCase, override_settings
+
+from apps.blog.models import Author
+from authentication.tests.fake_redis import FAKE_REDIS_CACHES, fake_session_redis
+
+User = get_user_model()
+
+# A default cache whose Redis is down.
+UNAVAILABLE_CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://127.0.0.1:1/0",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "SOCKET_CONNECT_TIMEOUT": 0.1,
+        },
+    },
+}
+
+
+@override_settings(
+    SESSION_ENGINE="authentication.redis_sessions.session",
+    CACHES=FAKE_REDIS_CACHES,
+)
+class CurrentUserTests(TestCase):
+    def setUp(self) -> None:
+        context = fake_session_redis()
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+        self.user = User.objects.create_user("ada@example.com", "password", "Ada", "Lovelace")
+
+    def login(self) -> Client:
+        client = Client()
+        response = client.post(
+            "/api/auth/login",
+            {"email": "ada@example.com", "password": "password"},
+            content_type="application/json",
+        )
+        self.assertTrue(response.json()["success"])
+        return client
+
+    def current_user(self, client: Client):
+        return client.get("/api/auth/me").json()["user"]
+
+    def test_warm_path_runs_no_queries(self) -> None:
+        client = self.login()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.current_user(client)["email"], "ada@example.com")
+
+    def test_user_save_refreshes(self) -> None:
+        client = self.login()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = "Augusta"
+            self.user.save()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.current_user(client)["first_name"], "Augusta")
+
+    def test_author_save_and_delete_refresh(self) -> None:
+        client = self.login()
+        with self.captureOnCommitCallbacks(execute=True):
+            author = Author.objects.create(user=self.user, bio="Analyst")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.current_user(client)["author"]["bio"], "Analyst")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            author.bio = "Mathematician"
+            author.save()
+        self.assertEqual(self.current_user(client)["author"]["bio"], "Mathematician")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            author.delete()
+        self.assertIsNone(self.current_user(client)["author"])
+        with self.assertNumQueries(0):
+            self.assertIsNone(self.current_user(client)["author"])
+
+    def test_user_delete_forgets(self) -> None:
+        client = self.login()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        self.assertIsNone(self.current_user(client))
+
+    def test_cache_unavailable(self) -> None:
+        # The login throttle shares the cache and fails open as well.
+        with override_settings(CACHES=UNAVAILABLE_CACHES), self.assertLogs(
+            "authentication", "WARNING"
+        ) as logs:
+            client = self.login()
+            self.assertEqual(self.current_user(client)["email"], "ada@example.com")
+        self.assertIn("authentication.current_user", {record.name for record in logs.records})
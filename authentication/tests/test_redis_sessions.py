@@ -0,0 +1,175 @@
+import redis
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+
+from authentication.redis_sessions import async_pool, benchmark
+from authentication.redis_sessions.pool import MeteredBlockingConnectionPool, get_registry
+from authentication.redis_sessions.rebalance import rebalance_sessions
+from authentication.redis_sessions.session import SessionStore
+from authentication.redis_sessions.user_index import index_name, stored_key
+from authentication.tests.fake_redis import (
+    fake_async_clients,
+    fake_redis_server,
+    fake_session_redis,
+    session_settings,
+)
+
+
+class SessionStoreCycleMixin:
+    def assert_session_cycle(self) -> str:
+        """Create, load, modify, reload and delete one session."""
+        store = SessionStore()
+        store["cart"] = [1, 2, 3]
+        store.save()
+        session_key = store.session_key
+        self.assertIsNotNone(session_key)
+        self.assertTrue(SessionStore().exists(session_key))
+
+        loaded = SessionStore(session_key)
+        self.assertEqual(loaded["cart"], [1, 2, 3])
+        loaded["cart"] = loaded["cart"] + [4]
+        loaded.save()
+        self.assertEqual(loaded.session_key, session_key)
+        self.assertEqual(SessionStore(session_key)["cart"], [1, 2, 3, 4])
+
+        SessionStore(session_key).delete()
+        self.assertFalse(SessionStore().exists(session_key))
+        self.assertEqual(SessionStore(session_key).load(), {})
+        return session_key
+
+    async def assert_async_session_cycle(self) -> str:
+        """The same cycle through the asyncio methods, checked against the sync store."""
+        store = SessionStore()
+        await store.aset("cart", [1, 2, 3])
+        await store.asave()
+        session_key = store.session_key
+        self.assertIsNotNone(session_key)
+        self.assertTrue(await SessionStore().aexists(session_key))
+        self.assertEqual(SessionStore(session_key)["cart"], [1, 2, 3])
+
+        loaded = SessionStore(session_key)
+        self.assertEqual(await loaded.aget("cart"), [1, 2, 3])
+        await loaded.aset("cart", [1, 2, 3, 4])
+        await loaded.asave()
+        self.assertEqual(loaded.session_key, session_key)
+        self.assertEqual(await SessionStore(session_key).aget("cart"), [1, 2, 3, 4])
+
+        await SessionStore(session_key).adelete()
+        self.assertFalse(await SessionStore().aexists(session_key))
+        self.assertEqual(await SessionStore(session_key).aload(), {})
+        return session_key
+
+
+class InProcessSessionStoreTests(SessionStoreCycleMixin, SimpleTestCase):
+    def test_session_cycle(self) -> None:
+        with fake_session_redis():
+            self.assert_session_cycle()
+
+    async def test_async_session_cycle(self) -> None:
+        with fake_session_redis(), fake_async_clients():
+            await self.assert_async_session_cycle()
+
+    def test_async_registry_is_dropped_with_its_loop(self) -> None:
+        with fake_session_redis(), fake_async_clients():
+            async_to_sync(self.assert_async_session_cycle)()
+            async_to_sync(self.assert_async_session_cycle)()
+        self.assertEqual(async_pool._async_registries, {})
+
+    def test_create_does_not_overwrite(self) -> None:
+        with fake_session_redis():
+            store = SessionStore()
+            store["a"] = 1
+            store.save()
+            taken = store.session_key
+            # The next generated key collides with the stored one.
+            keys = iter([taken, "b" * 32])
+            other = SessionStore()
+            other._get_new_session_key = lambda: next(keys)
+            other["a"] = 2
+            other.save()
+            self.assertEqual(other.session_key, "b" * 32)
+            self.assertEqual(SessionStore(taken)["a"], 1)
+
+
+class ConnectionPathTests(SessionStoreCycleMixin, SimpleTestCase):
+    """The store against a fake server reached through each configuration path."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        context = fake_redis_server()
+        cls.server = context.__enter__()
+        cls.addClassCleanup(context.__exit__, None, None, None)
+        cls.paths = dict(benchmark.connection_paths(cls.server))
+
+    def use_path(self, name: str):
+        return session_settings(self.paths[name])
+
+    def test_url(self) -> None:
+        with self.use_path("url"):
+            (server,) = get_registry().servers
+            self.assertIsInstance(server.pool, MeteredBlockingConnectionPool)
+            self.assertEqual(server.pool.connection_kwargs["port"], self.server["port"])
+            self.assert_session_cycle()
+
+    async def test_url_async(self) -> None:
+        with self.use_path("url"):
+            await self.assert_async_session_cycle()
+
+    def test_unix_socket(self) -> None:
+        with self.use_path("unix_socket"):
+            (server,) = get_registry().servers
+            self.assertIs(server.pool.connection_class, redis.UnixDomainSocketConnection)
+            self.assertEqual(server.pool.connection_kwargs["path"], self.server["unix_socket"])
+            self.assert_session_cycle()
+
+    def test_pool(self) -> None:
+        with self.use_path("pool"):
+            registry = get_registry()
+            self.assertEqual([server.name for server in registry.servers], ["bench-1", "bench-2"])
+            self.assert_session_cycle()
+
+            stores = []
+            for i in range(20):
+                store = SessionStore()
+                store["i"] = i
+                store.save()
+                stores.append(store)
+            # Sessions are spread over both servers and found where they were put.
+            self.assertEqual(
+                {registry.server_for(store.session_key).name for store in stores},
+                {"bench-1", "bench-2"},
+            )
+            for store in stores:
+                self.assertEqual(SessionStore(store.session_key)["i"], store["i"])
+                self.assertTrue(
+                    registry.client_for(store.session_key).exists(
+                        store.get_real_stored_key(store.session_key)
+                    )
+                )
+                store.delete()
+
+    def test_rebalance_merges_user_indexes(self) -> None:
+        with self.use_path("pool"):
+            registry = get_registry()
+            key = stored_key(index_name("42"))
+            owner = registry.client_for(index_name("42"))
+            (other,) = [server.client for server in registry.servers if server.client is not owner]
+            owner.sadd(key, "written-after-the-change")
+            other.sadd(key, "written-before-the-change")
+
+            counts = rebalance_sessions(registry)
+
+            self.assertEqual(counts["moved"], 1)
+            self.assertEqual(
+                owner.smembers(key), {b"written-after-the-change", b"written-before-the-change"}
+            )
+            self.assertFalse(other.exists(key))
+            owner.delete(key)
+
+    def test_connection_object(self) -> None:
+        with self.use_path("connection_object"):
+            (server,) = get_registry().servers
+            client = self.paths["connection_object"]["SESSION_REDIS_CONNECTION_OBJECT"]
+            self.assertIs(server.client, client)
+            self.assert_session_cycle()
@@ -0,0 +1,83 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import Client, TestCase, override_settings
+from django_redis import get_redis_connection
+from redis.exceptions import ConnectionError
+
+from authentication.tests.fake_redis import FAKE_REDIS_CACHES, fake_session_redis
+from authentication.throttle import (
+    LOGIN_THROTTLE_EMAIL_LIMIT,
+    LOGIN_THROTTLE_IP_LIMIT,
+    get_login_throttle,
+)
+
+User = get_user_model()
+
+
+@override_settings(
+    SESSION_ENGINE="authentication.redis_sessions.session",
+    CACHES=FAKE_REDIS_CACHES,
+)
+class LoginThrottleTests(TestCase):
+    def setUp(self) -> None:
+        context = fake_session_redis()
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+        get_redis_connection("default").flushdb()
+        self.staff = User.objects.create_user(
+            "staff@example.com", "password", "Grace", "Hopper", is_staff=True
+        )
+        User.objects.create_user("ada@example.com", "password", "Ada", "Lovelace")
+
+    def login(self, password: str):
+        return Client().post(
+            "/api/auth/login",
+            {"email": "ada@example.com", "password": password},
+            content_type="application/json",
+        )
+
+    def test_failures_beyond_the_limit_are_throttled(self) -> None:
+        for _ in range(LOGIN_THROTTLE_EMAIL_LIMIT):
+            self.assertEqual(self.login("wrong").status_code, 200)
+
+        with mock.patch("authentication.api.authenticate") as authenticate:
+            response = self.login("password")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response["Retry-After"]), 0)
+        authenticate.assert_not_called()
+
+    def test_forwarded_for_cannot_be_spoofed(self) -> None:
+        # Many emails from one client, each claiming another address in front
+        # of the one the proxy appended.
+        def login(i: int):
+            return Client(HTTP_X_FORWARDED_FOR=f"10.0.{i}.1, 203.0.113.7").post(
+                "/api/auth/login",
+                {"email": f"user{i}@example.com", "password": "wrong"},
+                content_type="application/json",
+            )
+
+        with mock.patch("authentication.api.authenticate", return_value=None):
+            for i in range(LOGIN_THROTTLE_IP_LIMIT):
+                self.assertEqual(login(i).status_code, 200)
+            self.assertEqual(login(LOGIN_THROTTLE_IP_LIMIT).status_code, 429)
+
+    def test_successful_logins_do_not_count(self) -> None:
+        for _ in range(LOGIN_THROTTLE_EMAIL_LIMIT + 1):
+            self.assertTrue(self.login("password").json()["success"])
+
+    def test_stats(self) -> None:
+        self.login("wrong")
+        self.login("password")
+        client = Client()
+        client.force_login(self.staff)
+
+        stats = client.get("/api/auth/login-throttle").json()
+        self.assertEqual(stats["allowed"], 2)
+        self.assertEqual(stats["succeeded"], 1)
+
+        with mock.patch.object(
+            type(get_login_throttle()), "client", mock.PropertyMock(side_effect=ConnectionError)
+        ), self.assertLogs("authentication.throttle", "WARNING"):
+            self.assertEqual(client.get("/api/auth/login-throttle").status_code, 503)
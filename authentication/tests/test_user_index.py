@@ -0,0 +1,115 @@
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
+from django.contrib.sessions.backends.base import UpdateError
+from django.contrib.sessions.backends.cache import KEY_PREFIX as LEGACY_KEY_PREFIX
+from django.contrib.sessions.backends.cache import SessionStore as LegacySessionStore
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+
+from authentication.redis_sessions import benchmark
+from authentication.redis_sessions.pool import get_registry
+from authentication.redis_sessions.session import SessionStore
+from authentication.redis_sessions.user_index import (
+    delete_user_sessions,
+    index_name,
+    stored_key,
+)
+from authentication.tests.fake_redis import FAKE_REDIS_CACHES, fake_session_redis
+
+User = get_user_model()
+
+
+@override_settings(
+    SESSION_ENGINE="authentication.redis_sessions.session",
+    CACHES=FAKE_REDIS_CACHES,
+)
+class LogoutEverywhereTests(TestCase):
+    def setUp(self) -> None:
+        context = fake_session_redis()
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+        self.user = User.objects.create_user("ada@example.com", "password", "Ada", "Lovelace")
+
+    def login(self) -> Client:
+        client = Client()
+        response = client.post(
+            "/api/auth/login",
+            {"email": "ada@example.com", "password": "password"},
+            content_type="application/json",
+        )
+        self.assertTrue(response.json()["success"])
+        return client
+
+    def current_user(self, client: Client):
+        return client.get("/api/auth/me").json()["user"]
+
+    def index_size(self) -> int:
+        name = index_name(str(self.user.pk))
+        return get_registry().client_for(name).scard(stored_key(name))
+
+    def test_logout_everywhere_ends_other_sessions(self) -> None:
+        first, second = self.login(), self.login()
+        second_key = second.session.session_key
+        self.assertTrue(SessionStore().exists(second_key))
+        self.assertEqual(self.current_user(second)["email"], "ada@example.com")
+
+        response = first.post("/api/auth/logout-everywhere")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["message"], "Logged out of 2 sessions.")
+        self.assertFalse(SessionStore().exists(second_key))
+        self.assertIsNone(self.current_user(second))
+        self.assertIsNone(self.current_user(first))
+        self.assertEqual(self.index_size(), 0)
+
+    def test_request_in_flight_does_not_restore_session(self) -> None:
+        store = SessionStore()
+        store[SESSION_KEY] = str(self.user.pk)
+        store.save()
+        in_flight = SessionStore(store.session_key)
+        in_flight["cart"] = [1]
+
+        self.assertEqual(delete_user_sessions(self.user.pk), 1)
+
+        with self.assertRaises(UpdateError):
+            in_flight.save()
+        self.assertFalse(SessionStore().exists(store.session_key))
+        self.assertEqual(self.index_size(), 0)
+
+    def test_legacy_cache_sessions_are_moved_over(self) -> None:
+        with override_settings(SESSION_CACHE_ALIAS="default"):
+            legacy = LegacySessionStore()
+            legacy[SESSION_KEY] = str(self.user.pk)
+            legacy[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+            legacy[HASH_SESSION_KEY] = self.user.get_session_auth_hash()
+            legacy.save()
+        client = Client()
+        client.cookies[settings.SESSION_COOKIE_NAME] = legacy.session_key
+
+        with benchmark.override_settings(SESSION_REDIS_LEGACY_CACHE="default"):
+            self.assertEqual(self.current_user(client)["email"], "ada@example.com")
+
+        self.assertIsNone(cache.get(LEGACY_KEY_PREFIX + legacy.session_key))
+        self.assertTrue(SessionStore().exists(legacy.session_key))
+        self.assertEqual(self.index_size(), 1)
+        self.assertEqual(delete_user_sessions(self.user.pk), 1)
+
+    def test_password_change_ends_other_sessions(self) -> None:
+        first, second = self.login(), self.login()
+        second_key = second.session.session_key
+
+        response = first.post(
+            "/api/auth/reset-password",
+            {"old_password": "password", "new_password": "new-password"},
+            content_type="application/json",
+        )
+
+        self.assertTrue(response.json()["success"])
+        self.assertFalse(SessionStore().exists(second_key))
+        self.assertEqual(self.current_user(first)["email"], "ada@example.com")
+
+    def test_logout_everywhere_needs_redis_sessions(self) -> None:
+        with override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cache"):
+            client = self.login()
+            response = client.post("/api/auth/logout-everywhere")
+        self.assertEqual(response.status_code, 501)
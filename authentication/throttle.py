@@ -0,0 +1,168 @@
+import hashlib
+import logging
+import math
+import secrets
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.http import HttpRequest
+from django_redis import get_redis_connection
+from ninja.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+# LOGIN_THROTTLE - Default
+# Sliding-window limits on login attempts that did not succeed, per client IP
+# and per email, kept in the Redis behind the given cache alias. Clients are
+# identified like ninja's throttles: by the X-Forwarded-For entry the last of
+# NINJA_NUM_PROXIES proxies added, never by what the client sent itself.
+LOGIN_THROTTLE = getattr(settings, "LOGIN_THROTTLE", {})
+LOGIN_THROTTLE_CACHE = LOGIN_THROTTLE.get("cache", "default")
+LOGIN_THROTTLE_PREFIX = LOGIN_THROTTLE.get("prefix", "login-throttle")
+LOGIN_THROTTLE_WINDOW = LOGIN_THROTTLE.get("window", 300)
+LOGIN_THROTTLE_IP_LIMIT = LOGIN_THROTTLE.get("ip_limit", 30)
+LOGIN_THROTTLE_EMAIL_LIMIT = LOGIN_THROTTLE.get("email_limit", 5)
+
+COUNTERS = ["allowed", "succeeded", "throttled_ip", "throttled_email", "errors"]
+
+
+class Attempt:
+    """A login attempt reserved in the windows of ``keys`` as ``member``."""
+
+    def __init__(self, keys: List[str], member: str, retry_after: int = 0) -> None:
+        self.keys = keys
+        self.member = member
+        self.retry_after = retry_after
+
+    @property
+    def throttled(self) -> bool:
+        return self.retry_after > 0
+
+
+class LoginThrottle(BaseThrottle):
+    """
+    Counts attempts in a sorted set per client IP and per email, scored by
+    time. An attempt is reserved before the password is checked and released
+    again if the login succeeds, so only failures count and a burst can never
+    run more password checks than the limits allow.
+    """
+
+    def __init__(
+        self, cache: str, prefix: str, window: float, ip_limit: int, email_limit: int
+    ) -> None:
+        self.cache = cache
+        self.prefix = prefix
+        self.window = window
+        self.limits = {"ip": ip_limit, "email": email_limit}
+
+    @property
+    def client(self):
+        return get_redis_connection(self.cache)
+
+    def _key(self, scope: str, value: str) -> str:
+        if scope == "email":
+            # Keep addresses out of Redis key names.
+            value = hashlib.sha256(value.strip().lower().encode()).hexdigest()[:32]
+        return f"{self.prefix}:{scope}:{value}"
+
+    def acquire(self, request: HttpRequest, email: str) -> Attempt:
+        """Reserve an attempt, or say how long to wait when a limit is reached."""
+        scopes = [("ip", self.get_ident(request) or "unknown"), ("email", email)]
+        keys = [self._key(scope, value) for scope, value in scopes]
+        now = time.time()
+        member = f"{now}:{secrets.token_hex(4)}"
+        try:
+            # One round trip: trim each window, add this attempt, count it.
+            with self.client.pipeline(transaction=True) as pipe:
+                for key in keys:
+                    pipe.zremrangebyscore(key, 0, now - self.window)
+                    pipe.zadd(key, {member: now})
+                    pipe.zcard(key)
+                    pipe.zrange(key, 0, 0, withscores=True)
+                    pipe.expire(key, math.ceil(self.window))
+                results = pipe.execute()
+        except Exception:
+            # Fail open: losing Redis must not lock everybody out.
+            logger.warning("Login throttle unavailable", exc_info=True)
+            self._count("errors")
+            return Attempt([], member)
+
+        retry_after, throttled_scope = 0, None
+        for (scope, _), offset in zip(scopes, range(0, len(results), 5)):
+            count, oldest = results[offset + 2], results[offset + 3]
+            if count > self.limits[scope]:
+                wait = math.ceil(oldest[0][1] + self.window - now) if oldest else self.window
+                retry_after = max(retry_after, wait, 1)
+                throttled_scope = throttled_scope or scope
+        if throttled_scope is None:
+            self._count("allowed")
+            return Attempt(keys, member)
+
+        # Rejected attempts do not count, or a steady attack would keep the
+        # window full forever and Retry-After would never come true.
+        self._release(keys, member, f"throttled_{throttled_scope}")
+        return Attempt(keys, member, retry_after)
+
+    def succeeded(self, attempt: Attempt) -> None:
+        """Take a successful login out of the windows."""
+        if attempt.keys:
+            self._release(attempt.keys, attempt.member, "succeeded")
+
+    def _release(self, keys: List[str], member: str, counter: str) -> None:
+        try:
+            with self.client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.zrem(key, member)
+                pipe.hincrby(f"{self.prefix}:stats", counter, 1)
+                pipe.execute()
+        except Exception:
+            logger.warning("Login throttle unavailable", exc_info=True)
+
+    def _count(self, counter: str) -> None:
+        try:
+            self.client.hincrby(f"{self.prefix}:stats", counter, 1)
+        except Exception:
+            pass
+
+    def stats(self) -> Optional[Dict[str, int]]:
+        """
+        Attempts allowed, succeeded and throttled so far, across all workers;
+        None while Redis is unavailable.
+        """
+        try:
+            counts = self.client.hgetall(f"{self.prefix}:stats")
+        except Exception:
+            logger.warning("Login throttle unavailable", exc_info=True)
+            return None
+        return {counter: int(counts.get(counter.encode(), 0)) for counter in COUNTERS}
+
+    def reset(self, request: Optional[HttpRequest] = None, email: Optional[str] = None) -> None:
+        """Clear the window of a client IP and/or an email, e.g. after support verified them."""
+        keys: List[Tuple[str, str]] = []
+        if request is not None:
+            keys.append(("ip", self.get_ident(request) or "unknown"))
+        if email is not None:
+            keys.append(("email", email))
+        if keys:
+            self.client.delete(*(self._key(scope, value) for scope, value in keys))
+
+
+_login_throttle: Optional[LoginThrottle] = None
+_login_throttle_lock = threading.Lock()
+
+
+def get_login_throttle() -> LoginThrottle:
+    global _login_throttle
+    if _login_throttle is None:
+        with _login_throttle_lock:
+            if _login_throttle is None:
+                _login_throttle = LoginThrottle(
+                    cache=LOGIN_THROTTLE_CACHE,
+                    prefix=LOGIN_THROTTLE_PREFIX,
+                    window=LOGIN_THROTTLE_WINDOW,
+                    ip_limit=LOGIN_THROTTLE_IP_LIMIT,
+                    email_limit=LOGIN_THROTTLE_EMAIL_LIMIT,
+                )
+    return _login_throttle
@@ -217,6 +217,25 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media/")
 
+# Responsive derivatives generated for uploaded images (see apps/blog/utils/images.py)
+IMAGE_DERIVATIVE_WIDTHS = [320, 640, 1024, 1600]
+IMAGE_DERIVATIVE_FORMATS = ["webp", "jpeg"]
+IMAGE_DERIVATIVE_QUALITY = int(os.environ.get("IMAGE_DERIVATIVE_QUALITY", "80"))
+# Width in pixels of the inline base64 placeholder (LQIP)
+IMAGE_PLACEHOLDER_WIDTH = 16
+
+# Uploaded images are stored once per distinct content under MEDIA_ROOT/cas/
+# and reference-counted (see apps/blog/utils/storage.py and blobs.py).
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "media": {"BACKEND": "apps.blog.utils.storage.ContentAddressedStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+# Resumable chunked uploads (see apps/blog/utils/uploads.py)
+CHUNKED_UPLOAD_MAX_SIZE = int(os.environ.get("CHUNKED_UPLOAD_MAX_SIZE", str(100 * 1024 * 1024)))
+CHUNKED_UPLOAD_MAX_CHUNK_SIZE = 8 * 1024 * 1024
+
 SITE_ID = 1
 SITE_NAME = "fliplytics"
 
@@ -250,6 +269,10 @@ if DEBUG:
 CSRF_TRUSTED_ORIGINS = CORS_ALLOWED_ORIGINS
 
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
+# Proxies in front of the backend (nginx). Throttles take the client address
+# from the last that many X-Forwarded-For entries, which the proxies set,
+# rather than trusting whatever the client sent.
+NINJA_NUM_PROXIES = int(os.environ.get("NUM_PROXIES", "1"))
 
 CORS_ALLOW_HEADERS = [
     "accept",
@@ -266,14 +289,22 @@ CORS_ALLOW_HEADERS = [
 
 CORS_ALLOW_CREDENTIALS = True
 
-SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+# Sessions live in the session Redis, indexed per user so that a user can be
+# logged out everywhere (see authentication/redis_sessions). Sessions still
+# stored by the cache engine used before are moved over when first loaded;
+# the "session" cache can go once SESSION_COOKIE_AGE has passed.
+SESSION_ENGINE = "authentication.redis_sessions.session"
+SESSION_REDIS = {
+    "url": os.environ.get("SESSION_BACKEND_URL") or None,
+    "prefix": "session",
+    "socket_timeout": 1,
+    "legacy_cache": "session",
+}
 SESSION_COOKIE_SAMESITE = "Lax"
 SESSION_COOKIE_SECURE = True
 SESSION_COOKIE_AGE = 864000
 SESSION_COOKIE_DOMAIN = "." + SITE_DOMAIN
 
-SESSION_CACHE_ALIAS = "session"
-
 CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
@@ -9,13 +9,26 @@ from apps.blog.api import category_router as category_router
 from apps.blog.api import tag_router as tag_router
 from apps.blog.api import author_router as author_router
 from apps.blog.api import gallery_router as gallery_router
+from apps.blog.api import upload_router as upload_router
 from apps.blog.apis.seo import seo_nlp_router as seo_nlp_router
 from authentication.api import auth_router as auth_router
+from django.core.exceptions import RequestDataTooBig
+from django.http.request import RawPostDataException
 from ninja.errors import HttpError, ValidationError
 import logging
 
 logger = logging.getLogger(__name__)
 
+def request_body_for_log(request) -> str:
+    # Only JSON bodies are logged. Anything else (chunked uploads, files) is
+    # streamed or may exceed DATA_UPLOAD_MAX_MEMORY_SIZE, and is never read here.
+    if request.content_type != "application/json":
+        return f"<{request.content_type or 'no body'}>"
+    try:
+        return request.body.decode("utf-8", errors="replace")
+    except (RawPostDataException, RequestDataTooBig):
+        return "<not read>"
+
 api = NinjaAPI(
     title="DebugLife Blog API",
     version="1.0",
@@ -27,7 +40,7 @@ api = NinjaAPI(
 def custom_validation_errors(request, exc):
     # Log detailed information
     logger.info(f"Validation error on {request.method} {request.path}")
-    logger.info(f"Request body: {request.body.decode('utf-8')}")
+    logger.info(f"Request body: {request_body_for_log(request)}")
     logger.info(f"Validation errors: {exc.errors}")
 
     # Return the standard 422 response
@@ -41,7 +54,7 @@ def custom_validation_errors(request, exc):
 def custom_http_errors(request, exc):
     # Log detailed information
     logger.info(f"HTTP error on {request.method} {request.path}")
-    logger.info(f"Request body: {request.body.decode('utf-8')}")
+    logger.info(f"Request body: {request_body_for_log(request)}")
     logger.info(f"HTTP error: {exc}")
 
     # Return the standard response
@@ -59,6 +72,7 @@ blog_router.add_router("/", category_router)
 blog_router.add_router("/", tag_router)
 blog_router.add_router("/", author_router)
 blog_router.add_router("/", gallery_router)
+blog_router.add_router("/", upload_router)
 blog_router.add_router("/", seo_nlp_router)
 
 api.add_router("/blog", blog_router)